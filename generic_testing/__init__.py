@@ -12,7 +12,7 @@ except ImportError:
 
 version = _version.Version("0.1.1")
 
-from .timeout import Timeout, version as timeout_version
+from .timeout import Timeout, TickStatistics, TimeoutGroup, version as timeout_version
 if not isinstance(timeout_version, str) and not timeout_version.is_backwards_compatible_with("2.0.0"):
     raise ImportError("Incompatible version of timeout")
 
@@ -20,6 +20,7 @@ from .isclose import IsClose, isclose, version as isclose_version
 if not isinstance(isclose_version, str) and not isclose_version.is_backwards_compatible_with("1.0.0"):
     raise ImportError("Incompatible version of isclose")
 
+from .watchdog import *
 from .core import *
 from .relations import *
 from .arithmetic import *
@@ -27,8 +28,19 @@ from .lattices import *
 from .numbers_abc import *
 from .collections_abc import *
 from .augmented_assignment import *
+from .memory import *
+from .concurrency import *
+from .differential import *
+from .mutation import *
 from .built_in_types import *
+from .scaling import *
+from .sorted_collections import *
+from .queues import *
 from .enums import *
 from .file_likes import *
 
+from .benchmarks import *
 from .loader import *
+from .incremental import *
+from .reporting import *
+from .runner import *
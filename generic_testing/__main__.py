@@ -0,0 +1,173 @@
+# Copyright 2021 Steve Palmer
+
+"""Discover and run the generic tests of any importable class.
+
+From the command line:
+
+    python -m generic_testing run MODULE:CLASS [--strategy MODULE:STRATEGY] [--set NAME=MODULE:VALUE]
+                                               [--workers N] [--budget DURATION]
+
+The generic tests of the class are discovered by the defaultGenericTestLoader,
+using the ClassDescription in the docstring of the class, if it has one,
+and bound by Given to the strategy, by default hypothesis.strategies.from_type(CLASS).
+Each of CLASS, STRATEGY and VALUE is a Python expression, evaluated in the namespace of its MODULE,
+such as modulo_n:ModuloN.decimal_digit(0), where hypothesis.strategies is st, unless the module has its own st.
+A strategy that is a function, such as hypothesis.strategies:integers, is called to make the strategy.
+--set gives the test class an attribute, such as the zero and one of an arithmetic class.
+If the tests need an attribute that is not given, no test is run, and the missing attributes are reported:
+
+    python -m generic_testing run modulo_n:ModuloN --strategy "modulo_n:st.builds(ModuloN.decimal_digit, st.integers())" \
+        --set "zero=modulo_n:ModuloN.decimal_digit(0)" --set "one=modulo_n:ModuloN.decimal_digit(1)"
+
+The tests are shared between --workers processes, each of which builds the test class again from the arguments,
+as a class made on the command line cannot be passed to another process.
+Once --budget, such as 60s or 2m, has passed, no more tests are started, and those not run are reported as skipped.
+"""
+
+import argparse
+import concurrent.futures
+import importlib
+import inspect
+import sys
+import time
+import typing
+import unittest
+
+from hypothesis import strategies as st
+
+from .core import Given
+from .loader import defaultGenericTestLoader
+from .runner import ClassResult, _run_test_class
+
+
+def import_object(spec: str):
+    """The object given by spec, as "module:expression", evaluated in the namespace of the module.
+
+    The namespace has hypothesis.strategies as st, unless the module has its own st.
+    """
+    module_name, _, expression = spec.partition(":")
+    if not expression:
+        raise ValueError(f"{spec!r} is not MODULE:EXPRESSION")
+    namespace = dict(st=st)
+    namespace.update(vars(importlib.import_module(module_name)))
+    return eval(expression, namespace)
+
+
+def parse_duration(text: str) -> float:
+    """The seconds in text, such as "90", "90s", "2m" or "1h"."""
+    units = dict(s=1.0, m=60.0, h=3600.0)
+    if text and text[-1] in units:
+        return float(text[:-1]) * units[text[-1]]
+    return float(text)
+
+
+def build_test_class(class_spec: str, strategy_spec: str = None, attributes: typing.Sequence[str] = ()) -> type:
+    """The generic test class of the class named by class_spec, bound to the strategy named by strategy_spec.
+
+    Raises ValueError if the tests need attributes, such as zero and one, that are not in attributes.
+    """
+    T = import_object(class_spec)
+    if strategy_spec is None:
+        strategy = st.from_type(T)
+    else:
+        strategy = import_object(strategy_spec)
+        if not isinstance(strategy, st.SearchStrategy) and callable(strategy):
+            strategy = strategy()
+    use_docstring_yaml = isinstance(T.__doc__, str) and "!ClassDescription" in T.__doc__
+    namespace = dict(class_under_test=T)
+    for attribute in attributes:
+        name, _, value_spec = attribute.partition("=")
+        namespace[name] = import_object(value_spec)
+    tests = defaultGenericTestLoader.discover(T, use_docstring_yaml=use_docstring_yaml)
+    result = Given(strategy)(type(f"Test_{T.__name__}", (tests,), namespace))
+    if inspect.isabstract(result):
+        missing = sorted(result.__abstractmethods__)
+        raise ValueError(
+            f"the tests of {T.__name__} need {', '.join(missing)}, such as --set {missing[0]}=MODULE:VALUE"
+        )
+    return result
+
+
+def _run_share(
+    class_spec: str, strategy_spec: str, attributes: typing.Sequence[str], names: typing.Sequence[str], deadline: float
+) -> ClassResult:
+    """Run the tests named, one at a time, until the deadline, a time.time(), has passed."""
+    test_class = build_test_class(class_spec, strategy_spec, attributes)
+    all_names = frozenset(unittest.defaultTestLoader.getTestCaseNames(test_class))
+    run, failures, errors, skipped, seconds, passed = 0, [], [], 0, 0.0, []
+    for name in names:
+        if time.time() >= deadline:
+            skipped += 1
+            continue
+        result = _run_test_class(test_class, all_names - {name})
+        run += result.run
+        failures += result.failures
+        errors += result.errors
+        skipped += result.skipped
+        seconds += result.seconds
+        passed += result.passed
+    return ClassResult(
+        f"{test_class.__module__}.{test_class.__qualname__}", run, failures, errors, skipped, seconds, tuple(passed), 0
+    )
+
+
+def run(
+    class_spec: str,
+    strategy_spec: str = None,
+    attributes: typing.Sequence[str] = (),
+    *,
+    workers: int = 1,
+    budget: float = float("inf"),
+) -> typing.List[ClassResult]:
+    """Run the generic tests of the class named by class_spec, shared between workers processes, within budget seconds."""
+    test_class = build_test_class(class_spec, strategy_spec, attributes)
+    names = list(unittest.defaultTestLoader.getTestCaseNames(test_class))
+    deadline = time.time() + budget
+    if workers == 1:
+        return [_run_share(class_spec, strategy_spec, attributes, names, deadline)]
+    shares = [names[i::workers] for i in range(workers)]
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(_run_share, class_spec, strategy_spec, attributes, share, deadline) for share in shares
+        ]
+        return [future.result() for future in futures]
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m generic_testing", description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+    run_parser = commands.add_parser("run", help="discover and run the generic tests of a class")
+    run_parser.add_argument("class_spec", metavar="MODULE:CLASS")
+    run_parser.add_argument("--strategy", metavar="MODULE:STRATEGY", help="default hypothesis.strategies.from_type(CLASS)")
+    run_parser.add_argument(
+        "--set", metavar="NAME=MODULE:VALUE", action="append", default=[], help="an attribute of the test class"
+    )
+    run_parser.add_argument("--workers", type=int, default=1, help="number of processes, default 1")
+    run_parser.add_argument("--budget", type=parse_duration, default=float("inf"), help="such as 60s, default none")
+    args = parser.parse_args(argv)
+
+    try:  # report a class, strategy or attribute that cannot be built, before starting any workers
+        build_test_class(args.class_spec, args.strategy, args.set)
+    except Exception as e:
+        print(f"{run_parser.prog}: error: {e}", file=sys.stderr)
+        return 2
+    start = time.perf_counter()
+    results = run(args.class_spec, args.strategy, args.set, workers=args.workers, budget=args.budget)
+    for result in results:
+        for test, traceback in result.failures:
+            print(f"FAIL: {test}\n{traceback}")
+        for test, traceback in result.errors:
+            print(f"ERROR: {test}\n{traceback}")
+    total = sum(result.run for result in results)
+    failures = sum(len(result.failures) for result in results)
+    errors = sum(len(result.errors) for result in results)
+    skipped = sum(result.skipped for result in results)
+    print(
+        f"Ran {total} tests in {time.perf_counter() - start:.3f}s: "
+        f"{failures} failures, {errors} errors, {skipped} skipped"
+    )
+    return 1 if failures or errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,8 +3,11 @@
 """A library of generic test for the elementary arithmetic operators."""
 
 import abc
+import math
+import numbers
 
-from hypothesis import assume
+from hypothesis import assume, event
+from hypothesis import strategies as st
 
 from .core import GenericTests, ClassUnderTest
 
@@ -20,6 +23,7 @@ __all__ = (
     "FieldTests",
     "FloorDivModMixinTests",
     "ExponentiationMixinTests",
+    "ExponentiationIdentitiesMixinTests",
     "AbsoluteValueMixinTests",
     "AdditionExtensionsMixinTests",
     "ScalarT",
@@ -223,7 +227,7 @@ class ExponentiationMixinTests:
         1. these identities are only true for certain types.  E.g. items 3 is not true for Reals
         2. with ints (for which they are true), the full range maths kills the preformance.
 
-    So, for now these are not tested...
+    So these are left to ExponentiationIdentitiesMixinTests, for the types where they hold.
     """
 
     def test_generic_2250_exponentiation_zero_by_zero(self) -> None:
@@ -254,6 +258,66 @@ class ExponentiationMixinTests:
         self.assertEqual(a ** self.one, a)
 
 
+class ExponentiationIdentitiesMixinTests:
+    """Discrete tests of the identities of __pow__ with natural exponents.
+
+    For natural (non-negative integral) exponents m and n, in a commutative ring:
+        1. a ** (m + n)  == a ** m * a ** n
+        2. (a * b) ** n  == a ** n * b ** n
+        3. (a ** m) ** n == a ** (m * n)
+
+    The size of a ** n grows as n times the size of a, so drawing the exponents from
+    the full range kills the performance.  Instead, the exponents are drawn after the bases,
+    bounded so that the estimated size of the result is within exponentiation_cost_budget.
+    Each example records its exponent bound as a hypothesis event,
+    so the statistics show how much of the exponent range was covered.
+
+    By default, the exponents are ints.  Override exponent_strategy for other exponent types.
+    """
+
+    exponentiation_cost_budget = 2 ** 16  # bits
+
+    def exponentiation_bits(self, a: ClassUnderTest) -> int:
+        """Approximate size of a in bits, so that a ** n is about n times this size."""
+        if isinstance(a, numbers.Rational):
+            return max(int(a.numerator).bit_length(), int(a.denominator).bit_length())
+        return int(abs(a)).bit_length()
+
+    def exponent_strategy(self, max_exponent: int) -> st.SearchStrategy:
+        """Strategy for the natural exponents up to max_exponent."""
+        return st.integers(min_value=0, max_value=max_exponent)
+
+    def _exponent_bound(self, bits: int) -> int:
+        """The largest exponent n for which bits × n is within exponentiation_cost_budget."""
+        return self.exponentiation_cost_budget // max(bits, 1)
+
+    def _draw_exponent(self, data, bound: int, label: str):
+        event(f"exponent bound: < 2**{bound.bit_length()}")
+        return data.draw(self.exponent_strategy(bound), label=label)
+
+    def test_generic_2255_exponentiation_sum_of_exponents(self, a: ClassUnderTest, data) -> None:
+        """a ** (m + n) == a ** m * a ** n"""
+        bound = self._exponent_bound(self.exponentiation_bits(a)) // 2
+        m = self._draw_exponent(data, bound, "m")
+        n = self._draw_exponent(data, bound, "n")
+        self.assertEqual(a ** (m + n), a ** m * a ** n)
+
+    def test_generic_2256_exponentiation_of_product(
+        self, a: ClassUnderTest, b: ClassUnderTest, data
+    ) -> None:
+        """(a * b) ** n == a ** n * b ** n"""
+        bound = self._exponent_bound(self.exponentiation_bits(a) + self.exponentiation_bits(b))
+        n = self._draw_exponent(data, bound, "n")
+        self.assertEqual((a * b) ** n, a ** n * b ** n)
+
+    def test_generic_2257_exponentiation_power_of_power(self, a: ClassUnderTest, data) -> None:
+        """(a ** m) ** n == a ** (m * n)"""
+        bound = math.isqrt(self._exponent_bound(self.exponentiation_bits(a)))
+        m = self._draw_exponent(data, bound, "m")
+        n = self._draw_exponent(data, bound, "n")
+        self.assertEqual((a ** m) ** n, a ** (m * n))
+
+
 class AbsoluteValueMixinTests:
     """Discrete tests of __abs__ operator.
 
@@ -2,9 +2,12 @@
 
 """A library of generic test for the augmented assignment operators."""
 
+import operator
+import sys
+
 from hypothesis import assume
 
-from .core import GenericTests, ClassUnderTest
+from .core import AllocationTrace, GenericTests, ClassUnderTest
 
 
 __all__ = (
@@ -13,6 +16,7 @@ __all__ = (
     "ComplexAugmentedAssignmentMixinTests",
     "FloorDivAugmentedAssignmentMixinTests",
     "IntegralAugmentedAssignmentMixinTests",
+    "InPlaceAugmentedAssignmentMixinTests",
 )
 
 
@@ -119,3 +123,56 @@ class IntegralAugmentedAssignmentMixinTests(ComplexAugmentedAssignmentMixinTests
         a_expected = a >> b
         a >>= b
         self.assertEqual(a, a_expected)
+
+
+class InPlaceAugmentedAssignmentMixinTests:
+    """Tests that the augmented assignment operators of a mutable class work in place.
+
+    For each operator the ClassUnderTest supports, a op= b must keep id(a),
+    and allocate in proportion to the size of b rather than of a.
+    The peak allocation may be inplace_allocation_ratio × sys.getsizeof(b) plus inplace_allocation_slack_bytes.
+    If the operation resizes a, twice the change in sys.getsizeof(a) is allowed on top,
+    since a growing or compacting hash table allocates all its new table.
+    Operators named in inplace_allocation_exempt are only checked for keeping id(a).
+    """
+
+    inplace_allocation_ratio = 2
+    inplace_allocation_slack_bytes = 256
+    inplace_allocation_exempt = ()
+
+    def _check_in_place(self, a: ClassUnderTest, b, name: str) -> None:
+        # Look in the class dictionaries, as hasattr also finds type.__or__ on every class
+        if not any(f"__i{name}__" in vars(c) or f"__{name}__" in vars(c) for c in type(a).__mro__):
+            return
+        a_id = id(a)
+        a_size = sys.getsizeof(a)
+        with AllocationTrace() as trace:
+            a = getattr(operator, f"i{name}")(a, b)
+        self.assertEqual(id(a), a_id, f"{name} assignment is not in place")
+        if f"i{name}" not in self.inplace_allocation_exempt:
+            limit = (
+                self.inplace_allocation_ratio * sys.getsizeof(b)
+                + self.inplace_allocation_slack_bytes
+                + 2 * abs(sys.getsizeof(a) - a_size)
+            )
+            self.assertLessEqual(trace.peak, limit, f"{name} assignment allocates in proportion to a")
+
+    def test_generic_2260_ior_in_place(self, a: ClassUnderTest, b: ClassUnderTest):
+        """a |= b keeps id(a)"""
+        self._check_in_place(a, b, "or")
+
+    def test_generic_2261_iand_in_place(self, a: ClassUnderTest, b: ClassUnderTest):
+        """a &= b keeps id(a)"""
+        self._check_in_place(a, b, "and")
+
+    def test_generic_2262_isub_in_place(self, a: ClassUnderTest, b: ClassUnderTest):
+        """a -= b keeps id(a)"""
+        self._check_in_place(a, b, "sub")
+
+    def test_generic_2263_ixor_in_place(self, a: ClassUnderTest, b: ClassUnderTest):
+        """a ^= b keeps id(a)"""
+        self._check_in_place(a, b, "xor")
+
+    def test_generic_2264_iadd_in_place(self, a: ClassUnderTest, b: ClassUnderTest):
+        """a += b keeps id(a)"""
+        self._check_in_place(a, b, "add")
@@ -0,0 +1,353 @@
+# Copyright 2021 Steve Palmer
+
+"""A library of generic operator benchmarks, mirroring the generic tests.
+
+Each *Benchmarks class times the operators that the corresponding *Tests class exercises,
+and benchmarks_for builds the benchmarks of a test class from the test classes it inherits.
+The benchmarks are GenericTests, so are bound to strategies by Given, and run by unittest, like the tests.
+"""
+
+import collections
+import json
+import operator
+import statistics
+import time
+
+from hypothesis import settings
+
+from .core import GenericTests, ClassUnderTest
+from .relations import EqualsOnlyTests, EqualityTests, LessOrEqualTests, PartialOrderingTests
+from .arithmetic import (
+    AdditionMonoidTests,
+    AdditionGroupTests,
+    MultiplicationMonoidTests,
+    FieldTests,
+    FloorDivModMixinTests,
+    AbsoluteValueMixinTests,
+)
+from .lattices import LatticeOrMixinTests, LatticeAndMixinTests, LatticeWithComplementTests, BitShiftMixinTests
+from .collections_abc import (
+    ElementT,
+    KeyT,
+    HashableMixinTests,
+    IterableMixinTests,
+    SizedMixinTests,
+    ContainerMixinTests,
+    SetTests,
+    MappingTests,
+    SequenceTests,
+)
+
+
+__all__ = (
+    "BenchmarkRecord",
+    "GenericBenchmarks",
+    "EqualsOnlyBenchmarks",
+    "EqualityBenchmarks",
+    "LessOrEqualBenchmarks",
+    "PartialOrderingBenchmarks",
+    "HashableBenchmarks",
+    "AdditionMonoidBenchmarks",
+    "AdditionGroupBenchmarks",
+    "MultiplicationMonoidBenchmarks",
+    "FieldBenchmarks",
+    "FloorDivModBenchmarks",
+    "AbsoluteValueBenchmarks",
+    "LatticeOrBenchmarks",
+    "LatticeAndBenchmarks",
+    "LatticeWithComplementBenchmarks",
+    "BitShiftBenchmarks",
+    "IterableBenchmarks",
+    "SizedBenchmarks",
+    "ContainerBenchmarks",
+    "SetBenchmarks",
+    "MappingBenchmarks",
+    "SequenceBenchmarks",
+    "benchmarks_for",
+)
+
+
+BenchmarkRecord = collections.namedtuple("BenchmarkRecord", ["test", "operation", "samples"])
+# test: str = name of the benchmark class
+# operation: str = name of the operation timed
+# samples: tuple of float = seconds per call, of each repeat
+
+
+class GenericBenchmarks(GenericTests):
+    """Base class for all Generic Benchmarks.
+
+    Each operation is called benchmark_warmup times, and then timed over benchmark_repeats
+    repeats of benchmark_number calls, to give a sample of the seconds per call from each repeat.
+    Operations that raise an ArithmeticError, ValueError or TypeError on the inputs are passed over.
+    Every sample is kept in benchmark_records, and benchmark_report gives robust statistics
+    over all the examples of each benchmark class and operation, as JSON lines.
+    """
+
+    benchmark_warmup = 10
+    benchmark_repeats = 5
+    benchmark_number = 100
+    benchmark_records = []  # shared by all benchmark classes
+
+    @classmethod
+    def benchmark_report(cls, records=None) -> str:
+        """The median, interquartile range and minimum of the seconds per call of each benchmark class and operation.
+
+        The records default to benchmark_records.
+        """
+        samples = collections.OrderedDict()
+        for record in cls.benchmark_records if records is None else records:
+            samples.setdefault((record.test, record.operation), []).extend(record.samples)
+        lines = []
+        for (test, operation), seconds in samples.items():
+            quartiles = statistics.quantiles(seconds, n=4) if len(seconds) > 1 else seconds * 3
+            lines.append(
+                json.dumps(
+                    dict(
+                        test=test,
+                        operation=operation,
+                        samples=len(seconds),
+                        median=statistics.median(seconds),
+                        iqr=quartiles[2] - quartiles[0],
+                        min=min(seconds),
+                    )
+                )
+                + "\n"
+            )
+        return "".join(lines)
+
+    def benchmark(self, operation: str, function, *args) -> None:
+        """Time function(*args), and record the samples as operation."""
+        try:
+            for _ in range(self.benchmark_warmup):
+                function(*args)
+        except (ArithmeticError, ValueError, TypeError):
+            return
+        samples = []
+        for _ in range(self.benchmark_repeats):
+            start = time.perf_counter()
+            for _ in range(self.benchmark_number):
+                function(*args)
+            samples.append((time.perf_counter() - start) / self.benchmark_number)
+        type(self).benchmark_records.append(BenchmarkRecord(type(self).__name__, operation, tuple(samples)))
+
+
+# Each example takes many calls, and none fail, so run fewer of them and without a deadline.
+# The examples are derandomized, so that each run times the same inputs, for comparison across runs.
+_benchmark_settings = settings(max_examples=20, deadline=None, derandomize=True)
+
+
+class EqualsOnlyBenchmarks:
+    @_benchmark_settings
+    def test_generic_3000_eq_benchmark(self, a: ClassUnderTest, b: ClassUnderTest) -> None:
+        self.benchmark("eq", operator.eq, a, b)
+
+
+class EqualityBenchmarks(EqualsOnlyBenchmarks):
+    @_benchmark_settings
+    def test_generic_3001_ne_benchmark(self, a: ClassUnderTest, b: ClassUnderTest) -> None:
+        self.benchmark("ne", operator.ne, a, b)
+
+
+class LessOrEqualBenchmarks:
+    @_benchmark_settings
+    def test_generic_3010_le_benchmark(self, a: ClassUnderTest, b: ClassUnderTest) -> None:
+        self.benchmark("le", operator.le, a, b)
+
+
+class PartialOrderingBenchmarks(LessOrEqualBenchmarks):
+    @_benchmark_settings
+    def test_generic_3011_lt_benchmark(self, a: ClassUnderTest, b: ClassUnderTest) -> None:
+        self.benchmark("lt", operator.lt, a, b)
+
+    @_benchmark_settings
+    def test_generic_3012_ge_benchmark(self, a: ClassUnderTest, b: ClassUnderTest) -> None:
+        self.benchmark("ge", operator.ge, a, b)
+
+    @_benchmark_settings
+    def test_generic_3013_gt_benchmark(self, a: ClassUnderTest, b: ClassUnderTest) -> None:
+        self.benchmark("gt", operator.gt, a, b)
+
+
+class HashableBenchmarks:
+    @_benchmark_settings
+    def test_generic_3020_hash_benchmark(self, a: ClassUnderTest) -> None:
+        self.benchmark("hash", hash, a)
+
+
+class AdditionMonoidBenchmarks:
+    @_benchmark_settings
+    def test_generic_3030_add_benchmark(self, a: ClassUnderTest, b: ClassUnderTest) -> None:
+        self.benchmark("add", operator.add, a, b)
+
+
+class AdditionGroupBenchmarks(AdditionMonoidBenchmarks):
+    @_benchmark_settings
+    def test_generic_3031_neg_benchmark(self, a: ClassUnderTest) -> None:
+        self.benchmark("neg", operator.neg, a)
+
+    @_benchmark_settings
+    def test_generic_3032_sub_benchmark(self, a: ClassUnderTest, b: ClassUnderTest) -> None:
+        self.benchmark("sub", operator.sub, a, b)
+
+
+class MultiplicationMonoidBenchmarks:
+    @_benchmark_settings
+    def test_generic_3033_mul_benchmark(self, a: ClassUnderTest, b: ClassUnderTest) -> None:
+        self.benchmark("mul", operator.mul, a, b)
+
+
+class FieldBenchmarks:
+    @_benchmark_settings
+    def test_generic_3034_truediv_benchmark(self, a: ClassUnderTest, b: ClassUnderTest) -> None:
+        self.benchmark("truediv", operator.truediv, a, b)
+
+
+class FloorDivModBenchmarks:
+    @_benchmark_settings
+    def test_generic_3035_floordiv_benchmark(self, a: ClassUnderTest, b: ClassUnderTest) -> None:
+        self.benchmark("floordiv", operator.floordiv, a, b)
+
+    @_benchmark_settings
+    def test_generic_3036_mod_benchmark(self, a: ClassUnderTest, b: ClassUnderTest) -> None:
+        self.benchmark("mod", operator.mod, a, b)
+
+
+class AbsoluteValueBenchmarks:
+    @_benchmark_settings
+    def test_generic_3037_abs_benchmark(self, a: ClassUnderTest) -> None:
+        self.benchmark("abs", abs, a)
+
+
+class LatticeOrBenchmarks:
+    @_benchmark_settings
+    def test_generic_3040_or_benchmark(self, a: ClassUnderTest, b: ClassUnderTest) -> None:
+        self.benchmark("or", operator.or_, a, b)
+
+
+class LatticeAndBenchmarks:
+    @_benchmark_settings
+    def test_generic_3041_and_benchmark(self, a: ClassUnderTest, b: ClassUnderTest) -> None:
+        self.benchmark("and", operator.and_, a, b)
+
+
+class LatticeWithComplementBenchmarks:
+    @_benchmark_settings
+    def test_generic_3042_invert_benchmark(self, a: ClassUnderTest) -> None:
+        self.benchmark("invert", operator.invert, a)
+
+    @_benchmark_settings
+    def test_generic_3043_xor_benchmark(self, a: ClassUnderTest, b: ClassUnderTest) -> None:
+        self.benchmark("xor", operator.xor, a, b)
+
+
+class BitShiftBenchmarks:
+    """Shifts are only timed by 0 <= b < benchmark_max_shift, as a << b grows with b."""
+
+    benchmark_max_shift = 64
+
+    @_benchmark_settings
+    def test_generic_3044_lshift_benchmark(self, a: ClassUnderTest, b: ClassUnderTest) -> None:
+        if 0 <= b < self.benchmark_max_shift:
+            self.benchmark("lshift", operator.lshift, a, b)
+
+    @_benchmark_settings
+    def test_generic_3045_rshift_benchmark(self, a: ClassUnderTest, b: ClassUnderTest) -> None:
+        if 0 <= b < self.benchmark_max_shift:
+            self.benchmark("rshift", operator.rshift, a, b)
+
+
+def _iterate(a) -> None:
+    for _ in a:
+        pass
+
+
+class IterableBenchmarks:
+    @_benchmark_settings
+    def test_generic_3050_iter_benchmark(self, a: ClassUnderTest) -> None:
+        self.benchmark("iter", _iterate, a)
+
+
+class SizedBenchmarks:
+    @_benchmark_settings
+    def test_generic_3051_len_benchmark(self, a: ClassUnderTest) -> None:
+        self.benchmark("len", len, a)
+
+
+class ContainerBenchmarks:
+    @_benchmark_settings
+    def test_generic_3052_contains_benchmark(self, a: ClassUnderTest, b: ElementT) -> None:
+        self.benchmark("contains", operator.contains, a, b)
+
+
+class SetBenchmarks:
+    @_benchmark_settings
+    def test_generic_3060_sub_benchmark(self, a: ClassUnderTest, b: ClassUnderTest) -> None:
+        self.benchmark("sub", operator.sub, a, b)
+
+    @_benchmark_settings
+    def test_generic_3061_xor_benchmark(self, a: ClassUnderTest, b: ClassUnderTest) -> None:
+        self.benchmark("xor", operator.xor, a, b)
+
+
+class MappingBenchmarks:
+    @_benchmark_settings
+    def test_generic_3070_getitem_benchmark(self, a: ClassUnderTest, b: KeyT) -> None:
+        """a[b], or a[k] for the first key k when b is missing"""
+        if b not in a:
+            if len(a) == 0:
+                return
+            b = next(iter(a))
+        self.benchmark("getitem", operator.getitem, a, b)
+
+
+class SequenceBenchmarks:
+    @_benchmark_settings
+    def test_generic_3080_getitem_benchmark(self, a: ClassUnderTest, b: KeyT) -> None:
+        """a[b % len(a)]"""
+        if len(a) > 0:
+            self.benchmark("getitem", operator.getitem, a, b % len(a))
+
+
+# The benchmarks of the operators exercised by each test class
+_benchmarks_of_tests = collections.OrderedDict(
+    [
+        (EqualsOnlyTests, EqualsOnlyBenchmarks),
+        (EqualityTests, EqualityBenchmarks),
+        (LessOrEqualTests, LessOrEqualBenchmarks),
+        (PartialOrderingTests, PartialOrderingBenchmarks),
+        (HashableMixinTests, HashableBenchmarks),
+        (AdditionMonoidTests, AdditionMonoidBenchmarks),
+        (AdditionGroupTests, AdditionGroupBenchmarks),
+        (MultiplicationMonoidTests, MultiplicationMonoidBenchmarks),
+        (FieldTests, FieldBenchmarks),
+        (FloorDivModMixinTests, FloorDivModBenchmarks),
+        (AbsoluteValueMixinTests, AbsoluteValueBenchmarks),
+        (LatticeOrMixinTests, LatticeOrBenchmarks),
+        (LatticeAndMixinTests, LatticeAndBenchmarks),
+        (LatticeWithComplementTests, LatticeWithComplementBenchmarks),
+        (BitShiftMixinTests, BitShiftBenchmarks),
+        (IterableMixinTests, IterableBenchmarks),
+        (SizedMixinTests, SizedBenchmarks),
+        (ContainerMixinTests, ContainerBenchmarks),
+        (SetTests, SetBenchmarks),
+        (MappingTests, MappingBenchmarks),
+        (SequenceTests, SequenceBenchmarks),
+    ]
+)
+
+
+def benchmarks_for(tests: type) -> type:
+    """Generate the benchmarks of the operators exercised by the test class tests.
+
+    The benchmarks take the relabelling of tests, so bind to the same strategies.
+    """
+    base_class_list = []
+    for klass in tests.__mro__:
+        benchmarks = _benchmarks_of_tests.get(klass)
+        if benchmarks is not None and not any(issubclass(bc, benchmarks) for bc in base_class_list):
+            base_class_list.append(benchmarks)
+
+    class result(*base_class_list, GenericBenchmarks):
+        relabel = staticmethod(tests.relabel)
+
+    return result
@@ -2,20 +2,25 @@
 
 """A library of generic test for the python built-in types."""
 
+import array
 import collections
+import copy
 from functools import wraps
 import fractions
+import sys
 import types
 
 from hypothesis import assume
 
 from .isclose import IsClose, isclose
-from .core import ClassUnderTest
+from .core import AllocationTrace, ClassUnderTest, GenericTests
 from .relations import EqualityTests, TotalOrderingTests
-from .arithmetic import AdditionMonoidTests, ScalarT
+from .arithmetic import AdditionMonoidTests, ExponentiationIdentitiesMixinTests, ScalarT
 from .numbers_abc import IntegralTests, RationalTests, RealTests, ComplexTests
 from .collections_abc import (
     ElementT,
+    KeyT,
+    ValueT,
     HashableMixinTests,
     SetTests,
     KeysViewTests,
@@ -27,6 +32,7 @@ from .collections_abc import (
     SequenceTests,
     MutableSequenceTests,
 )
+from .scaling import ScalingMixinTests
 from .augmented_assignment import (
     ComplexAugmentedAssignmentMixinTests,
     FloorDivAugmentedAssignmentMixinTests,
@@ -50,8 +56,16 @@ __all__ = (
     "CounterTests",
     "OrderedDictTests",
     "defaultdictTests",
+    "dequeTests",
     "tupleTests",
     "listTests",
+    "rangeTests",
+    "BufferMixinTests",
+    "ResizableBufferMixinTests",
+    "bytesTests",
+    "bytearrayTests",
+    "memoryviewTests",
+    "arrayTests",
 )
 
 
@@ -59,6 +73,7 @@ class intTests(
     IntegralAugmentedAssignmentMixinTests,
     FloorDivAugmentedAssignmentMixinTests,
     LatticeWithComplementAugmentedAssignmentMixinTests,
+    ExponentiationIdentitiesMixinTests,
     IntegralTests,
 ):
     """Tests of int class properties."""
@@ -99,6 +114,7 @@ class intTests(
 class FractionTests(
     ComplexAugmentedAssignmentMixinTests,
     FloorDivAugmentedAssignmentMixinTests,
+    ExponentiationIdentitiesMixinTests,
     RationalTests,
 ):
     """Tests of Fraction class properties."""
@@ -533,3 +549,240 @@ class listTests(_tupleTests, MutableSequenceTests):
         a_copy = self.copy(a)
         a *= b
         self.assertEqual(a, a_copy * b)
+
+    def test_generic_2633_imul_in_place(self, a: ClassUnderTest, b: ScalarT) -> None:
+        """a *= b keeps id(a)"""
+        self._check_in_place(a, b, "mul")
+
+
+class dequeTests(ScalingMixinTests, _tupleTests, MutableSequenceTests):
+    """Tests of deque class properties.
+
+    The operations at either end take amortised constant time, which is timed when scaling_timed.
+    """
+
+    empty = collections.deque()
+
+    def copy(self, a: ClassUnderTest) -> ClassUnderTest:
+        return a.copy()
+
+    def test_generic_2533_getitem_slice_definition(self, a: ClassUnderTest) -> None:
+        """a[start:stop] raises TypeError"""
+        with self.assertRaises(TypeError):
+            a[0:0]
+
+    def test_generic_2563_pop_definition(self, a: ClassUnderTest) -> None:
+        """v = a.pop(); v == a₀[-1] and a == a₀[:-1]"""
+        a_list = list(a)
+        if a_list:
+            self.assertEqual(a.pop(), a_list[-1])
+            self.assertEqual(list(a), a_list[:-1])
+        else:
+            with self.assertRaises(IndexError):
+                a.pop()
+
+    def test_generic_2750_appendleft_definition(self, a: ClassUnderTest, b: ValueT) -> None:
+        """a.appendleft(b); a == [b] + a₀"""
+        a_list = list(a)
+        a.appendleft(b)
+        self.assertEqual(list(a), [b] + a_list)
+
+    def test_generic_2751_popleft_definition(self, a: ClassUnderTest) -> None:
+        """v = a.popleft(); v == a₀[0] and a == a₀[1:]"""
+        a_list = list(a)
+        if a_list:
+            self.assertEqual(a.popleft(), a_list[0])
+            self.assertEqual(list(a), a_list[1:])
+        else:
+            with self.assertRaises(IndexError):
+                a.popleft()
+
+    def test_generic_2752_rotate_definition(self, a: ClassUnderTest, b: KeyT) -> None:
+        """a.rotate(b); a[i] == a₀[(i - b) % len(a)]"""
+        a_list = list(a)
+        a.rotate(b)
+        a_len = len(a_list)
+        self.assertEqual(list(a), [a_list[(i - b) % a_len] for i in range(a_len)])
+
+    def test_generic_2753_maxlen_eviction(self, a: ClassUnderTest, b: ValueT) -> None:
+        """c = deque(a, maxlen=len(a)); c.append(b) evicts c[0], and c.appendleft(b) evicts c[-1]"""
+        a_list = list(a)
+        c = type(a)(a_list, maxlen=len(a_list))
+        c.append(b)
+        self.assertEqual(list(c), (a_list + [b])[1:])
+        c = type(a)(a_list, maxlen=len(a_list))
+        c.appendleft(b)
+        self.assertEqual(list(c), ([b] + a_list)[: len(a_list)])
+
+    def test_generic_2754_extendleft_order(self, a: ClassUnderTest, b: ValueT, c: ValueT) -> None:
+        """a.extendleft([b, c]); a == [c, b] + a₀"""
+        a_list = list(a)
+        a.extendleft([b, c])
+        self.assertEqual(list(a), [c, b] + a_list)
+
+    def test_generic_2755_append_and_pop_are_constant_time(self) -> None:
+        """time(a.append(x); a.pop()) ∈ O(1)"""
+
+        def append_and_pop(a, x):
+            a.append(x)
+            a.pop()
+
+        self.assertScalesConstantly(append_and_pop, "append and pop are slower than constant")
+
+    def test_generic_2756_appendleft_and_popleft_are_constant_time(self) -> None:
+        """time(a.appendleft(x); a.popleft()) ∈ O(1)"""
+
+        def appendleft_and_popleft(a, x):
+            a.appendleft(x)
+            a.popleft()
+
+        self.assertScalesConstantly(appendleft_and_popleft, "appendleft and popleft are slower than constant")
+
+
+class rangeTests(HashableMixinTests, EqualityTests, SequenceTests):
+    """Tests of range class properties.
+
+    Ranges are lazily evaluated, so can be far longer than any sequence in memory.
+    """
+
+    empty = range(0)
+
+
+class BufferMixinTests:
+    """Tests of a ClassUnderTest that exports a one dimensional, C contiguous buffer.
+
+    Slicing a memoryview must not copy the buffer: it may only allocate the new view,
+    sys.getsizeof of the view plus buffer_slice_allocation_slack_bytes.
+    The slack allows for the interpreter's own allocations while tracing, such as specialising the code.
+    So that a copy would be seen, the slice is taken of a repeated, by buffer_repeat,
+    to at least buffer_slice_payload_bytes, far more than the slack.
+    """
+
+    buffer_slice_allocation_slack_bytes = 1024
+    buffer_slice_payload_bytes = 64 * 1024
+
+    def buffer_repeat(self, a: ClassUnderTest, n: int) -> ClassUnderTest:
+        """a repeated n times."""
+        return a * n
+
+    def test_generic_2690_memoryview_slice_shares_memory(self, a: ClassUnderTest, b: KeyT, c: KeyT) -> None:
+        """memoryview(a)[b:c].obj is memoryview(a).obj and memoryview(a)[b:c] == memoryview(a)[i for i in b:c]"""
+        with memoryview(a) as a_memoryview:
+            with a_memoryview[b:c] as a_slice:
+                self.assertIs(a_slice.obj, a_memoryview.obj)
+                self.assertEqual(a_slice.tolist(), a_memoryview.tolist()[b:c])
+
+    def test_generic_2691_memoryview_slice_writes_through(self, a: ClassUnderTest, b: KeyT, c: ValueT) -> None:
+        """not readonly ⇒ memoryview(a)[i:][0] = c; a[i] == c"""
+        with memoryview(a) as a_memoryview:
+            if a_memoryview.readonly or len(a_memoryview) == 0:
+                return
+            i = b % len(a_memoryview)
+            with a_memoryview[i:] as a_slice:
+                a_slice[0] = c
+            self.assertEqual(a[i], c)
+
+    def test_generic_2692_memoryview_slice_does_not_copy(self, a: ClassUnderTest, b: KeyT, c: KeyT) -> None:
+        """memoryview(a * n)[b:-c] allocates only the view, where the slice is far longer than the slack"""
+        with memoryview(a) as a_memoryview:
+            a_len, a_nbytes = len(a_memoryview), a_memoryview.nbytes
+        if a_nbytes == 0:
+            return
+        a = self.buffer_repeat(a, self.buffer_slice_payload_bytes // a_nbytes + 3)
+        with memoryview(a) as a_memoryview:
+            start, stop = b % a_len, len(a_memoryview) - c % a_len
+            a_memoryview[start:stop].release()  # warm any caches
+            with AllocationTrace() as trace:
+                a_slice = a_memoryview[start:stop]
+            slice_nbytes = a_slice.nbytes
+            limit = sys.getsizeof(a_slice) + self.buffer_slice_allocation_slack_bytes
+            a_slice.release()
+            self.assertGreaterEqual(slice_nbytes, self.buffer_slice_payload_bytes)
+            self.assertLessEqual(trace.peak, limit, "memoryview slice copies the buffer")
+
+    def test_generic_2693_cast_round_trip(self, a: ClassUnderTest) -> None:
+        """m = memoryview(a); m.cast("B").cast(m.format) == m"""
+        with memoryview(a) as a_memoryview:
+            with a_memoryview.cast("B") as a_bytes:
+                self.assertEqual(a_bytes.nbytes, a_memoryview.nbytes)
+                with a_bytes.cast(a_memoryview.format) as a_cast:
+                    self.assertEqual(a_cast, a_memoryview)
+
+    def test_generic_2694_tobytes_round_trip(self, a: ClassUnderTest) -> None:
+        """m = memoryview(a); m.tobytes() == bytes(m) and memoryview(m.tobytes()).cast(m.format) == m"""
+        with memoryview(a) as a_memoryview:
+            a_tobytes = a_memoryview.tobytes()
+            self.assertEqual(a_tobytes, bytes(a_memoryview))
+            self.assertEqual(memoryview(a_tobytes).cast(a_memoryview.format), a_memoryview)
+
+    def test_generic_2695_release_definition(self, a: ClassUnderTest) -> None:
+        """m = memoryview(a); m.release(); m[0] and len(m) raise ValueError"""
+        a_memoryview = memoryview(a)
+        a_memoryview.release()
+        with self.assertRaises(ValueError):
+            a_memoryview[0]
+        with self.assertRaises(ValueError):
+            len(a_memoryview)
+        a_memoryview.release()  # releasing again has no effect
+        with memoryview(a) as a_memoryview:
+            pass
+        with self.assertRaises(ValueError):
+            len(a_memoryview)
+
+
+class ResizableBufferMixinTests(BufferMixinTests):
+    """Tests of a mutable sequence that exports a buffer, and cannot be resized while the buffer is exported."""
+
+    def test_generic_2696_export_prevents_resize(self, a: ClassUnderTest, b: ValueT) -> None:
+        """m = memoryview(a); a.append(b) raises BufferError until m.release()"""
+        a_len = len(a)
+        a_memoryview = memoryview(a)
+        with self.assertRaises(BufferError):
+            a.append(b)
+        with self.assertRaises(BufferError):
+            a.extend([b])
+        self.assertEqual(len(a), a_len)
+        a_memoryview.release()
+        a.append(b)
+        self.assertEqual(len(a), a_len + 1)
+        self.assertEqual(a[-1], b)
+
+
+class bytesTests(BufferMixinTests, tupleTests):
+    """Tests of bytes class properties."""
+
+    empty = bytes()
+
+
+class bytearrayTests(ResizableBufferMixinTests, listTests):
+    """Tests of bytearray class properties."""
+
+    empty = bytearray()
+
+
+class memoryviewTests(BufferMixinTests, EqualityTests, SequenceTests):
+    """Tests of memoryview class properties."""
+
+    empty = memoryview(bytes())
+
+    def buffer_repeat(self, a: ClassUnderTest, n: int) -> ClassUnderTest:
+        return memoryview(a.tobytes() * n).cast(a.format)
+
+    if not hasattr(memoryview, "index"):  # memoryview.index and count were added in Python 3.14
+        test_generic_2536_index_definition = GenericTests._skip
+        test_generic_2537_index_definition_extra_tests = GenericTests._skip
+        test_generic_2538_count_definition = GenericTests._skip
+        test_generic_2539_count_definition_extra_tests = GenericTests._skip
+
+
+class arrayTests(ResizableBufferMixinTests, _tupleTests, MutableSequenceTests):
+    """Tests of array.array class properties, for arrays of typecode."""
+
+    typecode = "i"
+
+    @property
+    def empty(self):
+        return array.array(self.typecode)
+
+    def copy(self, a: ClassUnderTest) -> ClassUnderTest:
+        return copy.copy(a)
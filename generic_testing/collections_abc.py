@@ -4,13 +4,19 @@
 
 import abc
 import collections
+import math
+import random
+import typing
 
 from hypothesis import assume, strategies as st
 
 from .core import GenericTests, ClassUnderTest
 from .relations import EqualityTests, PartialOrderingTests
 from .lattices import BoundedBelowLatticeTests
-from .augmented_assignment import LatticeWithComplementAugmentedAssignmentMixinTests
+from .augmented_assignment import (
+    LatticeWithComplementAugmentedAssignmentMixinTests,
+    InPlaceAugmentedAssignmentMixinTests,
+)
 
 
 __all__ = (
@@ -234,9 +240,7 @@ class SetTests(
         universe = a | b
         self.assertLessEqual(c, universe)
         for x in universe:
-            self.assertEqual(
-                x in c, x in a and x not in b, f"fails for a={a!r}, b={b!r}, x={x!r}"
-            )
+            self.assertEqual(x in c, x in a and x not in b, f"fails for x={x!r}")
 
     def test_generic_2432_xor_defintion(
         self, a: ClassUnderTest, b: ClassUnderTest
@@ -249,7 +253,7 @@ class SetTests(
             self.assertEqual(
                 x in c,
                 x in a and x not in b or x not in a and x in b,
-                f"fails for a={a!r}, b={b!r}, x={x!r}",
+                f"fails for x={x!r}",
             )
 
 
@@ -272,7 +276,9 @@ class ValuesViewTests(CollectionTests):
     """The property tests of collections.abc.ValuesView."""
 
 
-class MutableSetTests(LatticeWithComplementAugmentedAssignmentMixinTests, SetTests):
+class MutableSetTests(
+    InPlaceAugmentedAssignmentMixinTests, LatticeWithComplementAugmentedAssignmentMixinTests, SetTests
+):
     """The property tests of collections.abc.MutableSet."""
 
     @abc.abstractmethod
@@ -452,7 +458,20 @@ class MutableMappingTests(MappingTests):
 
 
 class SequenceTests(CollectionWithEmptyTests):
-    """The property tests of collections.abc.Sequence."""
+    """The property tests of collections.abc.Sequence.
+
+    Lazily evaluated sequences may be far too long to iterate in full.
+    So for sequences longer than sampling_threshold,
+    the properties that would iterate the whole sequence instead check sample_windows(len(a)).
+    An iterator cannot skip ahead, so iteration order is checked at the sampled indices
+    of the first (or, reversed, the last) sampling_threshold elements,
+    and beyond them, on the iteration of slices over the windows.
+    """
+
+    sampling_threshold = 100_000
+    sample_window_size = 64
+    sample_confidence = 0.99
+    sample_defect_rate = 0.001
 
     @staticmethod
     def relabel(annotation):
@@ -460,6 +479,51 @@ class SequenceTests(CollectionWithEmptyTests):
             return ValueT
         return annotation
 
+    def sample_windows(self, a_len: int) -> typing.List[range]:
+        """Disjoint windows of consecutive indices into a sequence of length a_len, in order.
+
+        The windows include the first and the last, plus enough chosen at random that,
+        if a fraction sample_defect_rate of the indices are defective,
+        then one is sampled with probability sample_confidence.
+        The random choice uses the random module, which hypothesis seeds for each example.
+        """
+        w = self.sample_window_size
+        blocks = a_len // w
+        samples = math.ceil(math.log1p(-self.sample_confidence) / math.log1p(-self.sample_defect_rate) / w)
+        chosen = {0, blocks - 1}.union(random.sample(range(blocks), min(samples, blocks)))
+        result = [range(k * w, (k + 1) * w) for k in sorted(chosen)]
+        if blocks * w < a_len:
+            result.append(range(blocks * w, a_len))
+        return result
+
+    def _sampled_indices(self, a_len: int) -> typing.Iterable[int]:
+        if a_len > self.sampling_threshold:
+            for window in self.sample_windows(a_len):
+                yield from window
+        else:
+            yield from range(a_len)
+
+    def test_generic_2411_len_iterations(self, a: ClassUnderTest) -> None:
+        a_len = len(a)
+        if a_len > self.sampling_threshold:
+            # A Sequence's length is defined by its indices
+            a[a_len - 1]
+            with self.assertRaises(IndexError):
+                a[a_len]
+        else:
+            super().test_generic_2411_len_iterations(a)
+
+    def test_generic_2421_contains_over_iterable_definition(
+        self, a: ElementT, b: ClassUnderTest
+    ) -> None:
+        """a in b ⇔ any(a == x for x in b)"""
+        b_len = len(b)
+        if b_len > self.sampling_threshold:
+            if any(a == b[i] for i in self._sampled_indices(b_len)):
+                self.assertTrue(a in b)
+        else:
+            super().test_generic_2421_contains_over_iterable_definition(a, b)
+
     def test_generic_2530_getitem_on_empty_raises_IndexError(self, i: KeyT) -> None:
         """Ø[i] raises IndexError"""
         with self.assertRaises(IndexError):
@@ -468,10 +532,22 @@ class SequenceTests(CollectionWithEmptyTests):
     def test_generic_2531_getitem_has_same_order_as_iterator(
         self, a: ClassUnderTest
     ) -> None:
-        i = 0
-        for x in a:
-            self.assertEqual(x, a[i])
-            i += 1
+        a_len = len(a)
+        if a_len > self.sampling_threshold:
+            prefix = self.sampling_threshold
+            checked = {i for window in self.sample_windows(prefix) for i in window}
+            for i, x in zip(range(prefix), a):
+                if i in checked:
+                    self.assertEqual(x, a[i])
+            for window in self.sample_windows(a_len):
+                if window.start >= prefix:
+                    self.assertEqual(list(a[window.start:window.stop]), [a[i] for i in window])
+            i = a_len
+        else:
+            i = 0
+            for x in a:
+                self.assertEqual(x, a[i])
+                i += 1
         with self.assertRaises(IndexError):
             a[i]
 
@@ -480,10 +556,8 @@ class SequenceTests(CollectionWithEmptyTests):
     ) -> None:
         """a[-i] == a[len(a) - i]"""
         a_len = len(a)
-        i = 1
-        while i <= a_len:
-            self.assertEqual(a[-i], a[a_len - i])
-            i += 1
+        for i in self._sampled_indices(a_len):
+            self.assertEqual(a[i - a_len], a[i])
         with self.assertRaises(IndexError):
             a[-a_len - 1]
 
@@ -499,18 +573,26 @@ class SequenceTests(CollectionWithEmptyTests):
             if start > stop:
                 step = -step
             a_slice = a[start:stop:step]
-            i = 0
-            j = start
-            while j < stop if step >= 0 else j > stop:
-                self.assertEqual(a_slice[i], a[j])
-                i += 1
-                j += step
+            for i in self._sampled_indices(len(range(start, stop, step))):
+                self.assertEqual(a_slice[i], a[start + i * step])
 
     def test_generic_2535_reversed_definition(self, a: ClassUnderTest) -> None:
-        i = -1
-        for x in reversed(a):
-            self.assertEqual(x, a[i])
-            i -= 1
+        a_len = len(a)
+        if a_len > self.sampling_threshold:
+            prefix = self.sampling_threshold
+            checked = {i for window in self.sample_windows(prefix) for i in window}
+            for i, x in zip(range(prefix), reversed(a)):
+                if i in checked:
+                    self.assertEqual(x, a[-1 - i])
+            for window in self.sample_windows(a_len):
+                if window.stop <= a_len - prefix:
+                    self.assertEqual(list(reversed(a[window.start:window.stop])), [a[i] for i in reversed(window)])
+            i = -a_len - 1
+        else:
+            i = -1
+            for x in reversed(a):
+                self.assertEqual(x, a[i])
+                i -= 1
         with self.assertRaises(IndexError):
             a[i]
 
@@ -519,10 +601,8 @@ class SequenceTests(CollectionWithEmptyTests):
         try:
             i = a.index(b)
             self.assertEqual(a[i], b)
-            j = 0
-            while j < i:
+            for j in self._sampled_indices(i):
                 self.assertNotEqual(a[j], b)
-                j += 1
         except ValueError:
             self.assertFalse(b in a)
 
@@ -530,26 +610,32 @@ class SequenceTests(CollectionWithEmptyTests):
         self, a: ClassUnderTest, data
     ) -> None:
         assume(len(a) > 0)
-        b = data.draw(st.sampled_from(a))
+        b = a[data.draw(st.integers(min_value=0, max_value=len(a) - 1))]
         self.assertTrue(b in a)
         SequenceTests.test_generic_2536_index_definition(self, a, b)
 
     def test_generic_2538_count_definition(self, a: ClassUnderTest, b: ValueT) -> None:
-        count = 0
-        for x in a:
-            if x == b:
-                count += 1
-        self.assertEqual(count, a.count(b))
+        a_len = len(a)
+        if a_len > self.sampling_threshold:
+            # a.count(b) would visit every element, so count is checked on the slices over the windows
+            for window in self.sample_windows(a_len):
+                self.assertEqual(a[window.start:window.stop].count(b), sum(1 for i in window if a[i] == b))
+        else:
+            count = 0
+            for x in a:
+                if x == b:
+                    count += 1
+            self.assertEqual(count, a.count(b))
 
     def test_generic_2539_count_definition_extra_tests(
         self, a: ClassUnderTest, data
     ) -> None:
         assume(len(a) > 0)
-        b = data.draw(st.sampled_from(a))
+        b = a[data.draw(st.integers(min_value=0, max_value=len(a) - 1))]
         SequenceTests.test_generic_2538_count_definition(self, a, b)
 
 
-class MutableSequenceTests(SequenceTests):
+class MutableSequenceTests(InPlaceAugmentedAssignmentMixinTests, SequenceTests):
     """The property tests of collections.abc.MutableSequence."""
 
     @abc.abstractmethod
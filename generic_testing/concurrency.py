@@ -0,0 +1,222 @@
+# Copyright 2021 Steve Palmer
+
+"""A library of generic tests of mutable collections shared between threads."""
+
+import collections
+import concurrent.futures
+import contextlib
+import json
+import sys
+import threading
+import time
+
+from hypothesis import Phase, settings
+
+from .core import ClassUnderTest
+from .collections_abc import KeyT, ValueT
+
+
+__all__ = (
+    "ConcurrencyRecord",
+    "ConcurrentMutationMixinTests",
+    "ConcurrentMutableMappingMixinTests",
+    "ConcurrentMutableSequenceMixinTests",
+)
+
+
+ConcurrencyRecord = collections.namedtuple(
+    "ConcurrencyRecord", ["test", "threads", "operations", "seconds", "contention"]
+)
+# test: str = name of the test class
+# threads: int = number of threads mutating the instance
+# operations: int = number of mutations made, over all the threads
+# seconds: float = time taken to make them on the instance under test
+# contention: int = times a thread found the lock of the reference instance held
+
+
+class ConcurrentMutationMixinTests:
+    """Discrete tests of a mutable ClassUnderTest shared between threads.
+
+    For each of concurrency_thread_counts, a pool of threads makes concurrency_rounds rounds of mutations
+    on one instance, while another thread iterates over it, and checks an invariant on its len.
+    Each thread has its own keys or indices, so that the result does not depend on how the threads interleave.
+    The same mutations are then made on a copy, the reference, with each mutation holding a lock,
+    and the instance must end equal to the reference, with a len consistent with iterating over it.
+    The thread switch interval is lowered to concurrency_switch_interval while the threads run,
+    so that they interleave finely.
+
+    Iterating over an instance while it is mutated may raise a RuntimeError,
+    unless concurrent_iteration_safe is set, when it must not raise at all.
+    Every run is kept in concurrency_records, with its time and the contention for the reference lock,
+    and concurrency_report gives them as JSON lines, to show how throughput scales with the thread count.
+    Since each example runs many thousand mutations, only 10 examples are run, with no deadline.
+    The failing examples are not shrunk, as a failure depends more on the interleaving than on the instance.
+
+    The ClassUnderTest must provide the copy helper of the MutableMapping or MutableSequence tests.
+    """
+
+    concurrency_thread_counts = (1, 2, 4, 8)
+    concurrency_rounds = 100
+    concurrency_switch_interval = 1e-5  # seconds
+    concurrent_iteration_safe = False
+    concurrency_records = []  # shared by all test classes
+
+    @classmethod
+    def concurrency_report(cls) -> str:
+        """The concurrency_records, as JSON lines."""
+        return "".join(json.dumps(record._asdict()) + "\n" for record in cls.concurrency_records)
+
+    def _run_threads(self, mutate, threads: int, lock=None):
+        """Run mutate(thread, lock) on each of threads threads at once.
+
+        mutate returns the number of mutations it made, and each must hold the lock, if given.
+        Returns the total mutations, the time taken, and the contention for the lock.
+        """
+        barrier = threading.Barrier(threads + 1)
+        contention = [0] * threads
+
+        class CountingLock:
+            """A lock that counts the times a thread finds it held."""
+
+            def __init__(self, thread: int) -> None:
+                self._thread = thread
+
+            def __enter__(self) -> None:
+                if not lock.acquire(blocking=False):
+                    contention[self._thread] += 1
+                    lock.acquire()
+
+            def __exit__(self, *exc_info) -> None:
+                lock.release()
+
+        def worker(thread: int) -> int:
+            barrier.wait()
+            return mutate(thread, contextlib.nullcontext() if lock is None else CountingLock(thread))
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=threads) as pool:
+            futures = [pool.submit(worker, thread) for thread in range(threads)]
+            barrier.wait()
+            start = time.perf_counter()
+            operations = sum(future.result() for future in futures)
+            seconds = time.perf_counter() - start
+        return operations, seconds, sum(contention)
+
+    def _check_concurrent_mutation(self, a, reference, mutate, threads: int, len_invariant) -> None:
+        """Run mutate on a and reference from threads threads, and confirm they end equal."""
+        done = threading.Event()
+        observed = []
+
+        def observe():
+            try:
+                while not done.is_set():
+                    a_len = len(a)
+                    if not len_invariant(a_len):
+                        observed.append(self.failureException(f"len {a_len} is inconsistent during mutation"))
+                        return
+                    try:
+                        for _ in a:
+                            pass
+                    except RuntimeError:
+                        if self.concurrent_iteration_safe:
+                            raise
+            except Exception as exc:  # reported on the test thread
+                observed.append(exc)
+
+        observer = threading.Thread(target=observe, name="generic_testing.observer", daemon=True)
+        switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(self.concurrency_switch_interval)
+        try:
+            observer.start()
+            try:
+                operations, seconds, _ = self._run_threads(mutate(a), threads)
+            finally:
+                done.set()
+                observer.join()
+            _, _, contention = self._run_threads(mutate(reference), threads, threading.Lock())
+        finally:
+            sys.setswitchinterval(switch_interval)
+        if observed:
+            raise self.failureException(f"iterating during mutation by {threads} threads raised {observed[0]!r}")
+        self.assertEqual(len(a), len(list(a)), f"len is inconsistent with iteration after {threads} threads")
+        self.assertEqual(a, reference, f"lost updates with {threads} threads")
+        type(self).concurrency_records.append(
+            ConcurrencyRecord(type(self).__name__, threads, operations, seconds, contention)
+        )
+
+
+class ConcurrentMutableMappingMixinTests(ConcurrentMutationMixinTests):
+    """Discrete tests of a MutableMapping ClassUnderTest shared between threads.
+
+    The keys of a, and b, are shared out between the threads.
+    Each round, each thread sets, deletes and then updates each of its keys, and finally pops and sets them again.
+    So every key ends with the value c, and len(a) never exceeds the number of keys.
+    """
+
+    @settings(max_examples=10, deadline=None, phases=[Phase.explicit, Phase.reuse, Phase.generate])
+    def test_generic_2920_concurrent_mapping_mutation(self, a: ClassUnderTest, b: KeyT, c: ValueT) -> None:
+        """Mutations of a from many threads are not lost."""
+        keys = list(a.keys())
+        if b not in a:
+            keys.append(b)
+        for threads in self.concurrency_thread_counts:
+            instance, reference = self.copy(a), self.copy(a)
+
+            def mutate(m):
+                def result(thread: int, lock) -> int:
+                    own = keys[thread::threads]
+                    for _ in range(self.concurrency_rounds):
+                        for key in own:
+                            with lock:
+                                m[key] = c
+                            with lock:
+                                del m[key]
+                            with lock:
+                                m.update({key: c})
+                            with lock:
+                                m.pop(key)
+                            with lock:
+                                m[key] = c
+                    return 5 * self.concurrency_rounds * len(own)
+
+                return result
+
+            self._check_concurrent_mutation(
+                instance, reference, mutate, threads, lambda n, most=len(keys): 0 <= n <= most
+            )
+
+
+class ConcurrentMutableSequenceMixinTests(ConcurrentMutationMixinTests):
+    """Discrete tests of a MutableSequence ClassUnderTest shared between threads.
+
+    The indices of a are shared out between the threads.
+    Each round, each thread sets each of its indices to c, and appends c,
+    and finally each thread pops as many items as it appended.
+    So a thread only pops after its own appends, and len(a) never falls below len(a₀),
+    and the indices of a₀ are never moved.
+    """
+
+    @settings(max_examples=10, deadline=None, phases=[Phase.explicit, Phase.reuse, Phase.generate])
+    def test_generic_2921_concurrent_sequence_mutation(self, a: ClassUnderTest, c: ValueT) -> None:
+        """Mutations of a from many threads are not lost."""
+        a_len = len(a)
+        for threads in self.concurrency_thread_counts:
+            instance, reference = self.copy(a), self.copy(a)
+
+            def mutate(s):
+                def result(thread: int, lock) -> int:
+                    own = range(thread, a_len, threads)
+                    for _ in range(self.concurrency_rounds):
+                        for index in own:
+                            with lock:
+                                s[index] = c
+                        with lock:
+                            s.append(c)
+                    for _ in range(self.concurrency_rounds):
+                        with lock:
+                            s.pop()
+                    return (len(own) + 2) * self.concurrency_rounds
+
+                return result
+
+            self._check_concurrent_mutation(instance, reference, mutate, threads, lambda n: n >= a_len)
+
@@ -3,16 +3,53 @@
 """Fundemental tools in the GenericTesting library."""
 
 import abc
+import collections
+import contextlib
+import functools
 import unittest
 import inspect
 import datetime
+import tracemalloc
 
-from hypothesis import given, strategies as st
+from hypothesis import given, settings, strategies as st
 
 from .isclose import IsClose
+from .watchdog import Watchdog
 
 
-__all__ = ("GenericTests", "Given", "ClassUnderTest")
+__all__ = ("GenericTests", "Given", "Tier", "ClassUnderTest", "AllocationTrace")
+
+
+class AllocationTrace:
+    """Measure the memory allocated within a with block.
+
+    The measurement uses tracemalloc, so only allocations made through the Python
+    memory allocators are seen.  If tracemalloc is not already tracing, it is started
+    on entry and stopped again on exit.  On exit:
+        peak: the highest number of bytes allocated at any time within the block,
+        net: the number of bytes allocated within the block and still live at exit.
+    """
+
+    def __init__(self) -> None:
+        self._was_tracing = False
+        self._start = 0
+        self.peak = 0
+        self.net = 0
+
+    def __enter__(self) -> "AllocationTrace":
+        self._was_tracing = tracemalloc.is_tracing()
+        if not self._was_tracing:
+            tracemalloc.start()
+        self._start, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        current, peak = tracemalloc.get_traced_memory()
+        if not self._was_tracing:
+            tracemalloc.stop()
+        self.peak = max(0, peak - self._start)
+        self.net = current - self._start
 
 
 class GenericTests(unittest.TestCase, metaclass=abc.ABCMeta):
@@ -104,6 +141,20 @@ class GenericTests(unittest.TestCase, metaclass=abc.ABCMeta):
                 msg = f"{a} is too close to {b}"
             raise self.failureException(msg)
 
+    @contextlib.contextmanager
+    def assertAllocatesAtMost(self, limit: int, msg: str = None):
+        """Confirm the peak memory allocated within a with block.
+
+        Allocations are measured with an AllocationTrace.
+        """
+        trace = AllocationTrace()
+        with trace:
+            yield trace
+        if trace.peak > limit:
+            if msg is None:
+                msg = f"{trace.peak} bytes allocated, but expected at most {limit}"
+            raise self.failureException(msg)
+
     def assertCloseOrLessThan(self, a, b, msg: str = None):
         """Confirm one number is close or less than another."""
         if not (a < b or self.isclose(a, b)):
@@ -122,15 +173,48 @@ class GenericTests(unittest.TestCase, metaclass=abc.ABCMeta):
 ClassUnderTest = "ClassUnderTest"
 
 
-def Given(strategy_dict=None, *, testMethodPrefix="test_generic", data_arg="data"):
+Tier = collections.namedtuple("Tier", ["min_size", "max_size", "max_examples"])
+# min_size: int = smallest collection size in the tier
+# max_size: int = largest collection size in the tier
+# max_examples: int = number of examples to run in the tier
+
+
+def Given(
+    strategy_dict=None,
+    *,
+    testMethodPrefix="test_generic",
+    data_arg="data",
+    watchdog: Watchdog = None,
+    tiers=None,
+):
     """Bind GenericTests to hypothesis strategies.
 
     It binds hypothesis strategies to the test_generic methods using the strategy_dict.
+    If a watchdog is given, each example is run under it.
+
+    If tiers are given, they map a tier name to a Tier (min_size, max_size, max_examples),
+    and the strategy_dict may map annotations to a function of (min_size, max_size) returning a strategy.
+    Each test using such a sized strategy is then run once per tier, as a subTest,
+    so that failures are reported per tier.
+    Choose max_examples so that each tier takes a similar time:
+    the tiers are balanced by their example counts, so there is no per-example deadline.
     """
     if strategy_dict is None:
         strategy_dict = dict()
     elif not isinstance(strategy_dict, dict):
         strategy_dict = {ClassUnderTest: strategy_dict}
+    if tiers is not None:
+        tiers = collections.OrderedDict((name, Tier(*tier)) for name, tier in tiers.items())
+
+    def tiered(method, tier_tests):
+        @functools.wraps(method)
+        def run_tiers(self):
+            for tier_name, tier_test in tier_tests:
+                with self.subTest(tier=tier_name):
+                    tier_test(self)
+
+        run_tiers.__signature__ = inspect.signature(tier_tests[0][1])
+        return run_tiers
 
     def result(cls: type) -> type:
         if not issubclass(cls, GenericTests):
@@ -160,7 +244,26 @@ def Given(strategy_dict=None, *, testMethodPrefix="test_generic", data_arg="data
                                 f"Cannot bind {cls.__name__}.{name}.{arg} with annotation {annotation} to strategy"
                             )
                         given_args[arg] = strat
-                    setattr(cls, name, given(**given_args)(method))
+                    if watchdog is not None:
+                        method = watchdog.watch(f"{cls.__name__}.{name}", method)
+                    sized_args = [arg for arg, strat in given_args.items() if not isinstance(strat, st.SearchStrategy)]
+                    if not sized_args:
+                        setattr(cls, name, given(**given_args)(method))
+                    elif tiers is None:
+                        raise TypeError(f"Cannot bind {cls.__name__}.{name}.{sized_args[0]} to a sized strategy without tiers")
+                    else:
+                        tier_tests = []
+                        for tier_name, tier in tiers.items():
+                            tier_args = {
+                                arg: strat(tier.min_size, tier.max_size) if arg in sized_args else strat
+                                for arg, strat in given_args.items()
+                            }
+                            tier_test = given(**tier_args)(method)
+                            tier_tests.append(
+                                (tier_name, settings(max_examples=tier.max_examples, deadline=None)(tier_test))
+                            )
+                        setattr(cls, name, tiered(method, tier_tests))
+        cls._given_strategies = dict(strategy_dict)  # for fingerprinting the test class
         return cls
 
     return result
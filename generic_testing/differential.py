@@ -0,0 +1,140 @@
+# Copyright 2021 Steve Palmer
+
+"""A library of generic tests of a class against a reference implementation."""
+
+import abc
+import collections
+import json
+import operator
+import time
+
+from .core import GenericTests, ClassUnderTest
+
+
+__all__ = ("DifferentialRecord", "DifferentialTests")
+
+
+DifferentialRecord = collections.namedtuple(
+    "DifferentialRecord", ["test", "operation", "calls", "seconds", "reference_seconds"]
+)
+# test: str = name of the test class
+# operation: str = name of the operator function
+# calls: int = number of calls timed, on each implementation
+# seconds: float = time taken by the calls on the ClassUnderTest
+# reference_seconds: float = time taken by the same calls on the reference implementation
+
+
+class DifferentialTests(GenericTests):
+    """The tests that the ClassUnderTest behaves as a reference implementation.
+
+    The reference method maps an instance to the reference implementation,
+    and each operator must commute with it, so reference(a + b) == reference(a) + reference(b).
+    Results that are not instances of the ClassUnderTest, such as those of relations, are compared directly.
+    normalise_reference is applied to the results of the reference implementation that are mapped,
+    such as x % n where the reference of a ModuloN is int.
+    Where the ClassUnderTest raises an ArithmeticError, ValueError or TypeError,
+    the reference must raise the same exception.
+
+    The operations are the names of operator functions, used where the ClassUnderTest has the
+    corresponding special method.  Each operation is timed over a batch of differential_batch calls
+    on each implementation, so that the timer resolution does not dominate.
+    Every batch is kept in differential_records, and differential_report gives the totals of each test and
+    operation as JSON lines, with the speedup of the ClassUnderTest over the reference.
+    """
+
+    differential_unary_operations = ("neg", "pos", "abs", "invert")
+    differential_binary_operations = (
+        "add", "sub", "mul", "truediv", "floordiv", "mod", "pow", "lshift", "rshift", "and_", "or_", "xor",
+    )
+    differential_relations = ("eq", "ne", "lt", "le", "gt", "ge")
+    differential_batch = 10
+    differential_records = []  # shared by all test classes
+
+    @abc.abstractmethod
+    def reference(self, a: ClassUnderTest):
+        """The reference implementation of a."""
+
+    def normalise_reference(self, x):
+        """The reference implementation result x, in the form that reference gives."""
+        return x
+
+    @classmethod
+    def differential_report(cls) -> str:
+        """The totals of the differential_records of each test and operation, as JSON lines."""
+        totals = collections.OrderedDict()
+        for record in cls.differential_records:
+            total = totals.setdefault((record.test, record.operation), [0, 0.0, 0.0])
+            total[0] += record.calls
+            total[1] += record.seconds
+            total[2] += record.reference_seconds
+        return "".join(
+            json.dumps(
+                dict(
+                    test=test,
+                    operation=operation,
+                    calls=calls,
+                    seconds=seconds,
+                    reference_seconds=reference_seconds,
+                    speedup=reference_seconds / seconds if seconds > 0.0 else None,
+                )
+            )
+            + "\n"
+            for (test, operation), (calls, seconds, reference_seconds) in totals.items()
+        )
+
+    @staticmethod
+    def _supports(a, operation: str) -> bool:
+        # Look in the class dictionaries, as hasattr also finds type.__or__ on every class,
+        # and an operator may be disabled with None
+        name = f"__{operation.rstrip('_')}__"
+        for klass in type(a).__mro__:
+            if name in vars(klass):
+                return vars(klass)[name] is not None
+        return False
+
+    def _time(self, function, args) -> float:
+        start = time.perf_counter()
+        for _ in range(self.differential_batch):
+            function(*args)
+        return time.perf_counter() - start
+
+    def _check_differential(self, operation: str, *args) -> None:
+        if not self._supports(args[0], operation):
+            return
+        function = getattr(operator, operation)
+        reference_args = tuple(self.reference(x) for x in args)
+        try:
+            actual = function(*args)
+        except (ArithmeticError, ValueError, TypeError) as exc:
+            with self.assertRaises(type(exc), msg=f"{operation} raises {exc!r}, but not on the reference"):
+                function(*reference_args)
+            return
+        expected = function(*reference_args)
+        if isinstance(actual, type(args[0])):
+            actual = self.reference(actual)
+            expected = self.normalise_reference(expected)
+        self.assertEqual(actual, expected, f"{operation} differs from the reference")
+        type(self).differential_records.append(
+            DifferentialRecord(
+                type(self).__name__,
+                operation,
+                self.differential_batch,
+                self._time(function, args),
+                self._time(function, reference_args),
+            )
+        )
+
+    def test_generic_2930_unary_operations_match_reference(self, a: ClassUnderTest) -> None:
+        """reference(op(a)) == op(reference(a))"""
+        for operation in self.differential_unary_operations:
+            self._check_differential(operation, a)
+
+    def test_generic_2931_binary_operations_match_reference(self, a: ClassUnderTest, b: ClassUnderTest) -> None:
+        """reference(a op b) == reference(a) op reference(b)"""
+        for operation in self.differential_binary_operations:
+            self._check_differential(operation, a, b)
+
+    def test_generic_2932_relations_match_reference(self, a: ClassUnderTest, b: ClassUnderTest) -> None:
+        """(a rel b) == (reference(a) rel reference(b))"""
+        for operation in self.differential_relations:
+            self._check_differential(operation, a, b)
@@ -3,29 +3,52 @@
 """a library of generic tests for the file-like properties."""
 
 import abc
+import array
 import codecs
+import collections
 from collections import Counter
 import enum
+import gzip
 import io
+import mmap
 import os
 import time
 import unittest
 
+try:
+    import bz2
+except ImportError:  # Python built without the _bz2 extension
+    bz2 = None
+
+try:
+    import lzma
+except ImportError:  # Python built without the _lzma extension
+    lzma = None
+
 import hypothesis
+from hypothesis import strategies as st
 
 from .timeout import Timeout
 from .core import GenericTests, ClassUnderTest
-from .collections_abc import IterableMixinTests
+from .collections_abc import IterableMixinTests, SizedMixinTests
 
 
 __all__ = (
     "IOBaseTests",
     "RawIOBaseTests",
     "FileIOTests",
+    "LargeFileIOTests",
     "BufferedIOBaseTests",
+    "LargeBufferedIOBaseTests",
     "BytesIOTests",
+    "GzipFileTests",
+    "BZ2FileTests",
+    "LZMAFileTests",
+    "ThroughputRecord",
     "TextIOBaseTests",
     "StringIOTests",
+    "TextIOWrapperTests",
+    "mmapTests",
 )
 
 
@@ -176,7 +199,90 @@ class IOBaseTests(IterableMixinTests, GenericTests):
             a.truncate(0)
 
 
-class RawIOBaseTests(IOBaseTests):
+class _ZeroCopyReadIntoMixinTests:
+    """Tests that the readinto family write directly into the caller's buffer.
+
+    The caller's buffer is presented as a memoryview window over a larger shared buffer,
+    so that the data read must be visible through the underlying object,
+    and the bytes either side of the window must be left untouched.
+    Each kind of buffer-protocol object in buffer_kinds is tried in turn.
+    The stream read is given by zero_copy_reader, which by default lengthens a writable stream
+    by zero_copy_payload_bytes, so that the data read is far larger than the allocation_slack_bytes allowed,
+    and a copy of it cannot hide in the slack.
+    Streams that cannot be written should override zero_copy_reader to give an as long stream.
+    """
+
+    guard_bytes = 16
+    guard_value = 0xA5
+    zero_copy_payload_bytes = 64 * 1024
+
+    @property
+    def allocation_slack_bytes(self) -> int:
+        """The allocation allowed within a single readinto call.
+
+        This covers interpreter overhead, but is far smaller than zero_copy_payload_bytes.
+        """
+        return 1024
+
+    def _lengthen(self, a: ClassUnderTest) -> None:
+        """Append zero_copy_payload_bytes to a writable stream."""
+        if a.writable():
+            a.seek(0, io.SEEK_END)
+            a.write(bytes(range(256)) * (self.zero_copy_payload_bytes // 256))
+            a.flush()
+
+    def zero_copy_reader(self, a: ClassUnderTest) -> ClassUnderTest:
+        """The stream read by the zero copy tests, by default a, lengthened if it is writable.
+
+        A new stream returned is closed by the test.
+        """
+        self._lengthen(a)
+        return a
+
+    def buffer_kinds(self, size: int) -> tuple:
+        """Writable buffer-protocol objects of the given size, used as readinto targets."""
+        return (bytearray(size), array.array("B", bytes(size)), mmap.mmap(-1, size))
+
+    def _check_readinto_in_place(
+        self, a: ClassUnderTest, n: int, method_name: str, allocation_limit: float = None
+    ) -> None:
+        if allocation_limit is None:
+            allocation_limit = self.allocation_slack_bytes
+        hypothesis.assume(not a.closed)
+        self._ensure_readable(a)
+        self._ensure_seekable(a)
+        self._ensure_blocking(a)
+        self._ensure_non_interative(a)
+        reader = self.zero_copy_reader(a)
+        try:
+            reader.seek(0)
+            reference = reader.read()
+            n = len(reference) + (n & 0xFF) + 1  # read all of the stream, and a little more
+            guard = bytes([self.guard_value]) * self.guard_bytes
+            for backing in self.buffer_kinds(n + 2 * self.guard_bytes):
+                with memoryview(backing) as whole:
+                    whole[:] = guard[:1] * len(whole)
+                    reader.seek(0)
+                    with whole[self.guard_bytes : self.guard_bytes + n] as window:  # noqa E203
+                        with self.assertAllocatesAtMost(allocation_limit):
+                            count = getattr(reader, method_name)(window)
+                        self.assertIs(window.obj, backing)
+                    self.assertTrue(0 <= count <= n)
+                    self.assertEqual(
+                        whole[self.guard_bytes : self.guard_bytes + count].tobytes(),  # noqa E203
+                        reference[:count],
+                        f"{method_name} into {type(backing).__name__} did not land in place",
+                    )
+                    self.assertEqual(whole[: self.guard_bytes].tobytes(), guard)
+                    self.assertEqual(whole[self.guard_bytes + n :].tobytes(), guard)  # noqa E203
+                if isinstance(backing, mmap.mmap):
+                    backing.close()
+        finally:
+            if reader is not a:
+                reader.close()
+
+
+class RawIOBaseTests(_ZeroCopyReadIntoMixinTests, IOBaseTests):
     """Tests of RawIOBase inheritable properties."""
 
     @property
@@ -248,6 +354,10 @@ class RawIOBaseTests(IOBaseTests):
         with self.assertRaises(ValueError):
             a.readinto(buf)
 
+    def test_generic_2588_readinto_in_place(self, a: ClassUnderTest, n: int) -> None:
+        """io.RawIOBase.readinto(memoryview) writes into the shared buffer without copying"""
+        self._check_readinto_in_place(a, n, "readinto")
+
     def test_generic_2577_read_unlimited(self, a: ClassUnderTest) -> None:
         """io.RawIOBase.read()"""
         hypothesis.assume(not a.closed)
@@ -453,6 +563,121 @@ class _ReadWriteStorageBinarySteamTests:
         self.assertEqual(a.read(), expected)
 
 
+class _LargeReadWriteStorageBinaryStreamTests(_ReadWriteStorageBinarySteamTests):
+    """The "large" tier of tests of file backed binary streams.
+
+    Paging, buffering boundaries and 2 GiB offset bugs do not show up with the small payloads
+    the other tests use, so these tests work at offsets of several GiB.
+    To avoid writing that much data, they rely on sparse files:
+    truncating a file to extend it leaves a hole that costs no disk space and reads as zeros.
+    Streams that are not backed by a file descriptor, and file systems without sparse files, are skipped.
+    """
+
+    large_offset_minimum = 2 ** 31 - 2 ** 12  # straddle the 2 GiB boundary
+    large_offset_span = 2 ** 33
+    hole_check_bytes = 2 ** 12
+
+    def large_offset(self, n: int) -> int:
+        """Map an arbitrary int onto a multi-GiB offset."""
+        return self.large_offset_minimum + n % self.large_offset_span
+
+    def _ensure_file_backed(self, a: ClassUnderTest) -> None:
+        try:
+            a.fileno()
+        except OSError:
+            self.skipTest("Test only applies to file backed streams")
+
+    def _sparse_truncate(self, a: ClassUnderTest, size: int) -> None:
+        """Extend the stream to size, skipping the test if this did not leave a hole."""
+        original_size = os.fstat(a.fileno()).st_size
+        a.truncate(size)
+        allocated = getattr(os.fstat(a.fileno()), "st_blocks", None)
+        if allocated is None or allocated * 512 >= size // 2:
+            a.truncate(original_size)
+            self.skipTest("Test only applies to file systems supporting sparse files")
+
+    def test_generic_2670_seek_and_tell_at_large_offset(self, a: ClassUnderTest, n: int) -> None:
+        """a.seek(offset); a.tell() == offset, for offset beyond 2 GiB"""
+        hypothesis.assume(not a.closed)
+        self._ensure_seekable(a)
+        self._ensure_file_backed(a)
+        offset = self.large_offset(n)
+        size = a.seek(0, 2)
+        self.assertEqual(a.seek(offset), offset)
+        self.assertEqual(a.tell(), offset)
+        self.assertEqual(a.seek(1, 1), offset + 1)
+        self.assertEqual(a.seek(-offset - 1, 1), 0)
+        self.assertEqual(a.seek(0, 2), size)  # seeking does not extend the file
+        if a.readable():
+            a.seek(offset)
+            self.assertEqual(a.read(1), b"")
+            self.assertEqual(a.tell(), offset)
+
+    def test_generic_2671_truncate_at_large_offset(self, a: ClassUnderTest, n: int) -> None:
+        """a.truncate(offset) extends the stream with zeros, for offset beyond 2 GiB"""
+        hypothesis.assume(not a.closed)
+        self._ensure_seekable(a)
+        self._ensure_writable(a)
+        self._ensure_file_backed(a)
+        offset = self.large_offset(n)
+        size = a.seek(0, 2)
+        start = a.seek(0)
+        self._sparse_truncate(a, offset)
+        self.assertEqual(a.tell(), start)
+        self.assertEqual(a.seek(0, 2), offset)
+        if a.readable():
+            hole = min(offset - size, self.hole_check_bytes)
+            a.seek(offset - hole)
+            self.assertEqual(a.read(), bytes(hole))
+        self.assertEqual(a.truncate(size), size)
+        self.assertEqual(a.seek(0, 2), size)
+
+    def test_generic_2672_read_seek_write_at_large_offset(
+        self, a: ClassUnderTest, b: bytes, n: int
+    ) -> None:
+        """a.seek(offset); a.write(b); a.seek(offset); a.read(len(b)) == b, for offset beyond 2 GiB"""
+        hypothesis.assume(not a.closed)
+        self._ensure_readable(a)
+        self._ensure_seekable(a)
+        self._ensure_writable(a)
+        self._ensure_file_backed(a)
+        offset = self.large_offset(n)
+        a.seek(0)
+        original = a.read()
+        self._sparse_truncate(a, offset)
+        a.seek(offset)
+        written = a.write(b)
+        self.assertEqual(written, len(b))
+        self.assertEqual(a.tell(), offset + written)
+        hole = min(offset - len(original), self.hole_check_bytes)
+        a.seek(offset - hole)
+        self.assertEqual(a.read(hole + written), bytes(hole) + b)
+        self.assertEqual(a.seek(0, 2), offset + written)
+        a.seek(0)
+        self.assertEqual(a.read(len(original)), original)
+
+    def test_generic_2673_mmap_window_at_large_offset(
+        self, a: ClassUnderTest, b: bytes, n: int
+    ) -> None:
+        """mmap(a.fileno(), len(b), offset=offset)[:] = b; a.seek(offset); a.read(len(b)) == b"""
+        hypothesis.assume(not a.closed)
+        hypothesis.assume(len(b) > 0)
+        self._ensure_readable(a)
+        self._ensure_seekable(a)
+        self._ensure_writable(a)
+        self._ensure_file_backed(a)
+        offset = self.large_offset(n)
+        offset -= offset % mmap.ALLOCATIONGRANULARITY
+        self._sparse_truncate(a, offset + len(b))
+        a.flush()
+        with mmap.mmap(a.fileno(), len(b), offset=offset) as window:
+            self.assertEqual(window[:], bytes(len(b)))
+            window[:] = b
+            window.flush()
+        a.seek(offset)
+        self.assertEqual(a.read(len(b)), b)
+
+
 class FileIOTests(RawIOBaseTests, _ReadWriteStorageBinarySteamTests):
     """Tests of FileIO properties."""
 
@@ -481,6 +706,10 @@ class FileIOTests(RawIOBaseTests, _ReadWriteStorageBinarySteamTests):
         self.assertSetEqual(set(c.values()), {1}, f"Duplicate mode character: {mode}")
 
 
+class LargeFileIOTests(_LargeReadWriteStorageBinaryStreamTests, FileIOTests):
+    """Tests of FileIO properties, including the large offset tier."""
+
+
 class _SharedBufferedTextIOBaseTests:
     """Some tests are very similar between buffered and test stuff."""
 
@@ -554,7 +783,7 @@ class _SharedBufferedTextIOBaseTests:
     # TODO: readlines
 
 
-class BufferedIOBaseTests(IOBaseTests, _SharedBufferedTextIOBaseTests):
+class BufferedIOBaseTests(_ZeroCopyReadIntoMixinTests, IOBaseTests, _SharedBufferedTextIOBaseTests):
     """Tests of BufferedIOBase inheritable properties."""
 
     @property
@@ -625,6 +854,14 @@ class BufferedIOBaseTests(IOBaseTests, _SharedBufferedTextIOBaseTests):
                 break
         self.assertEqual(a.readinto1(buf), 0)
 
+    def test_generic_2592_readinto_in_place(self, a: ClassUnderTest, n: int) -> None:
+        """io.BufferedIOBase.readinto(memoryview) writes into the shared buffer without copying"""
+        self._check_readinto_in_place(a, n, "readinto")
+
+    def test_generic_2593_readinto1_in_place(self, a: ClassUnderTest, n: int) -> None:
+        """io.BufferedIOBase.readinto1(memoryview) writes into the shared buffer without copying"""
+        self._check_readinto_in_place(a, n, "readinto1")
+
     def test_generic_2590_raw(self, a: ClassUnderTest) -> None:
         """io.BufferedIOBase.raw"""
         hypothesis.assume(not a.closed)
@@ -642,6 +879,10 @@ class BufferedIOBaseTests(IOBaseTests, _SharedBufferedTextIOBaseTests):
             pass
 
 
+class LargeBufferedIOBaseTests(_LargeReadWriteStorageBinaryStreamTests, BufferedIOBaseTests):
+    """Tests of BufferedIOBase inheritable properties, including the large offset tier."""
+
+
 class BytesIOTests(BufferedIOBaseTests, _ReadWriteStorageBinarySteamTests):
     def test_generic_2402_zero_iterations_over_empty(self) -> None:
         with self.assertRaises(StopIteration):
@@ -664,8 +905,46 @@ class BytesIOTests(BufferedIOBaseTests, _ReadWriteStorageBinarySteamTests):
     def test_generic_2660_getbuffer(self, a: ClassUnderTest) -> None:
         """io.BytesIO.getbuffer"""
         hypothesis.assume(not a.closed)
-        # TODO: figure out a better set of tests...!
-        a.getbuffer()
+        self._lengthen(a)
+        # getvalue shares its bytes with the stream, which getbuffer would then have to copy
+        with self.assertAllocatesAtMost(self.allocation_slack_bytes):
+            a_getbuffer = a.getbuffer()
+        a_getvalue = a.getvalue()
+        with a_getbuffer:
+            self.assertIsInstance(a_getbuffer, memoryview)
+            self.assertFalse(a_getbuffer.readonly)
+            self.assertEqual(a_getbuffer.nbytes, len(a_getvalue))
+            self.assertEqual(a_getbuffer.tobytes(), a_getvalue)
+
+    def test_generic_2662_getbuffer_shares_memory(self, a: ClassUnderTest, b: bytes, n: int) -> None:
+        """m = a.getbuffer(); m[i:j] = c; a.getvalue()[i:j] == c"""
+        hypothesis.assume(not a.closed)
+        a.seek(0, 2)
+        a.write(b)
+        a_getvalue = a.getvalue()
+        length = len(a_getvalue)
+        position = n % length if length > 0 else 0
+        c = bytes(reversed(b))[: length - position]
+        with a.getbuffer() as a_getbuffer:
+            a_getbuffer[position : position + len(c)] = c  # noqa E203
+            expected = bytearray(a_getvalue)
+            expected[position : position + len(c)] = c  # noqa E203
+            self.assertEqual(a.getvalue(), expected)
+            a.seek(position)
+            self.assertEqual(a.read(len(c)), c)
+
+    def test_generic_2663_getbuffer_export_prevents_resize(self, a: ClassUnderTest, b: bytes) -> None:
+        """m = a.getbuffer(); a.truncate(0) and a.write(b) at end raise BufferError until m.release()"""
+        hypothesis.assume(not a.closed)
+        a_getbuffer = a.getbuffer()
+        with self.assertRaises(BufferError):
+            a.truncate(0)
+        a.seek(0, 2)
+        with self.assertRaises(BufferError):
+            a.write(b + b"\0")
+        a_getbuffer.release()
+        self.assertEqual(a.write(b), len(b))
+        self.assertEqual(a.truncate(0), 0)
 
     def test_generic_2661_getvalue(self, a: ClassUnderTest) -> None:
         """io.BytesIO.getvalue"""
@@ -708,6 +987,11 @@ class BytesIOTests(BufferedIOBaseTests, _ReadWriteStorageBinarySteamTests):
                 break
         self.assertEqual(a.readinto1(buf), 0)
 
+    def test_generic_2593_readinto1_in_place(self, a: ClassUnderTest, n: int) -> None:
+        """io.BytesIO.readinto1(memoryview) writes into the shared buffer"""
+        # BytesIO inherits readinto1 from BufferedIOBase, which reads into a bytes object and copies it
+        self._check_readinto_in_place(a, n, "readinto1", float("inf"))
+
     def test_generic_2584_tell(self, a: ClassUnderTest, n: int) -> None:
         """io.BytesIO.tell()"""
         hypothesis.assume(not a.closed)
@@ -751,6 +1035,173 @@ class BytesIOTests(BufferedIOBaseTests, _ReadWriteStorageBinarySteamTests):
             a.detach()
 
 
+class _ChunkedReadMixinTests:
+    """Tests that reading in chunks of arbitrary size yields the same stream as a single read().
+
+    Streams that decode (decompress or decode text) as they read have internal state
+    that must be carried correctly across chunk boundaries.
+    """
+
+    max_chunk_size = 64
+
+    def _chunk_sizes(self, data) -> list:
+        return data.draw(st.lists(st.integers(min_value=1, max_value=self.max_chunk_size), min_size=1))
+
+    def _check_chunked_read(self, a: ClassUnderTest, data, method_name: str) -> None:
+        hypothesis.assume(not a.closed)
+        self._ensure_readable(a)
+        self._ensure_seekable(a)
+        a.seek(0)
+        whole = a.read()
+        a.seek(0)
+        sizes = self._chunk_sizes(data)
+        chunks = []
+        i = 0
+        while True:
+            size = sizes[i % len(sizes)]
+            chunk = getattr(a, method_name)(size)
+            self.assertLessEqual(len(chunk), size)
+            if not chunk:
+                break
+            chunks.append(chunk)
+            i += 1
+        self.assertEqual(self.dtype().join(chunks), whole)
+
+    def test_generic_2700_read_chunked(self, a: ClassUnderTest, data) -> None:
+        """a.read(n₀) + a.read(n₁) + ... == a.read()"""
+        self._check_chunked_read(a, data, "read")
+
+
+ThroughputRecord = collections.namedtuple(
+    "ThroughputRecord", ["level", "ratio", "write_MBps", "read_MBps", "small_read_MBps"]
+)
+
+
+class _CompressedFileTests(_ChunkedReadMixinTests, BufferedIOBaseTests):
+    """Tests of compressed file inheritable properties.
+
+    The ClassUnderTest is expected to be a compressed file open for reading.
+    Subclasses supply open_compressed, and the compression_levels it accepts.
+    """
+
+    compression_levels = range(1, 10)
+
+    @staticmethod
+    @abc.abstractmethod
+    def open_compressed(fileobj, mode: str, level: int):
+        """Open a compressed file over fileobj."""
+
+    @property
+    def allocation_slack_bytes(self) -> float:
+        """Decompression produces fresh bytes objects, so readinto cannot avoid a copy."""
+        return float("inf")
+
+    @classmethod
+    def compress(cls, b: bytes, level: int, chunk_sizes=None) -> bytes:
+        """Compress b, written in chunks of the given sizes, or in one write."""
+        result = io.BytesIO()
+        with cls.open_compressed(result, "wb", level) as f:
+            if chunk_sizes:
+                i = 0
+                position = 0
+                while position < len(b):
+                    size = chunk_sizes[i % len(chunk_sizes)]
+                    f.write(b[position : position + size])  # noqa E203
+                    position += size
+                    i += 1
+            else:
+                f.write(b)
+        return result.getvalue()
+
+    @classmethod
+    def decompress(cls, c: bytes, read_size: int = -1) -> bytes:
+        """Decompress c, reading in chunks of read_size."""
+        chunks = []
+        with cls.open_compressed(io.BytesIO(c), "rb", None) as f:
+            while True:
+                chunk = f.read(read_size)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+        return b"".join(chunks)
+
+    @classmethod
+    def throughput_report(cls, payload: bytes, small_read_size: int = 64) -> list:
+        """Measure the throughput of payload at each compression level.
+
+        The small_read_MBps column reads back using read(small_read_size),
+        to show up implementations whose throughput collapses on small reads.
+        """
+        result = []
+        for level in cls.compression_levels:
+            start = time.perf_counter()
+            c = cls.compress(payload, level)
+            write_time = time.perf_counter() - start
+            start = time.perf_counter()
+            cls.decompress(c)
+            read_time = time.perf_counter() - start
+            start = time.perf_counter()
+            cls.decompress(c, small_read_size)
+            small_read_time = time.perf_counter() - start
+            result.append(
+                ThroughputRecord(
+                    level=level,
+                    ratio=len(c) / max(len(payload), 1),
+                    write_MBps=len(payload) / max(write_time, 1e-9) / 1e6,
+                    read_MBps=len(payload) / max(read_time, 1e-9) / 1e6,
+                    small_read_MBps=len(payload) / max(small_read_time, 1e-9) / 1e6,
+                )
+            )
+        return result
+
+    def test_generic_2701_read1_chunked(self, a: ClassUnderTest, data) -> None:
+        """a.read1(n₀) + a.read1(n₁) + ... == a.read()"""
+        self._check_chunked_read(a, data, "read1")
+
+    def test_generic_2705_compression_round_trip(self, b: bytes, data) -> None:
+        """decompress(compress(b, level)) == b"""
+        level = data.draw(st.sampled_from(self.compression_levels))
+        self.assertEqual(self.decompress(self.compress(b, level)), b)
+
+    def test_generic_2706_chunked_write(self, b: bytes, data) -> None:
+        """compressing b written in chunks of arbitrary size decompresses to b"""
+        level = data.draw(st.sampled_from(self.compression_levels))
+        c = self.compress(b, level, self._chunk_sizes(data))
+        self.assertEqual(self.decompress(c), b)
+
+
+class GzipFileTests(_CompressedFileTests):
+    """Tests of gzip.GzipFile properties."""
+
+    compression_levels = range(0, 10)
+
+    @staticmethod
+    def open_compressed(fileobj, mode: str, level: int):
+        return gzip.GzipFile(fileobj=fileobj, mode=mode, compresslevel=9 if level is None else level)
+
+
+class BZ2FileTests(_CompressedFileTests):
+    """Tests of bz2.BZ2File properties."""
+
+    @staticmethod
+    def open_compressed(fileobj, mode: str, level: int):
+        if bz2 is None:
+            raise unittest.SkipTest("bz2 is not available")
+        return bz2.BZ2File(fileobj, mode=mode, compresslevel=9 if level is None else level)
+
+
+class LZMAFileTests(_CompressedFileTests):
+    """Tests of lzma.LZMAFile properties."""
+
+    compression_levels = range(0, 10)
+
+    @staticmethod
+    def open_compressed(fileobj, mode: str, level: int):
+        if lzma is None:
+            raise unittest.SkipTest("lzma is not available")
+        return lzma.LZMAFile(fileobj, mode=mode, preset=level)
+
+
 class TextIOBaseTests(IOBaseTests, _SharedBufferedTextIOBaseTests):
     """Tests of TextIOBase inheritable properties."""
 
@@ -860,3 +1311,110 @@ class StringIOTests(TextIOBaseTests):
         hypothesis.assume(not a.closed)
         with self.assertRaises(io.UnsupportedOperation):
             a.detach()
+
+
+class TextIOWrapperTests(_ChunkedReadMixinTests, TextIOBaseTests):
+    """Tests of TextIOWrapper properties.
+
+    A TextIOWrapper decodes with an incremental decoder,
+    so multi-byte characters may be split across the reads from its buffer.
+    """
+
+    def test_generic_2710_incremental_decoder_chunked(self, a: ClassUnderTest, data) -> None:
+        """decoding the underlying bytes in chunks of arbitrary size == decoding them in one go"""
+        hypothesis.assume(not a.closed)
+        self._ensure_readable(a)
+        self._ensure_seekable(a)
+        a.buffer.seek(0)
+        raw = a.buffer.read()
+        decoder = codecs.getincrementaldecoder(a.encoding)(a.errors)
+        sizes = self._chunk_sizes(data)
+        chunks = []
+        i = 0
+        position = 0
+        while position < len(raw):
+            size = sizes[i % len(sizes)]
+            chunks.append(decoder.decode(raw[position : position + size]))  # noqa E203
+            position += size
+            i += 1
+        chunks.append(decoder.decode(b"", final=True))
+        self.assertEqual("".join(chunks), codecs.decode(raw, a.encoding, a.errors))
+
+
+class mmapTests(SizedMixinTests, GenericTests):
+    """Tests of mmap properties.
+
+    An mmap is both a mutable sequence of bytes and a file-like object with a current position,
+    so these tests check that the two views agree.
+    """
+
+    def test_generic_2680_size(self, a: ClassUnderTest) -> None:
+        """len(a) <= a.size()"""
+        hypothesis.assume(not a.closed)
+        self.assertLessEqual(len(a), a.size())
+
+    def test_generic_2681_read_definition(self, a: ClassUnderTest) -> None:
+        """a.seek(0); a.read() == a[:]"""
+        hypothesis.assume(not a.closed)
+        a.seek(0)
+        self.assertEqual(a.read(), a[:])
+        self.assertEqual(a.tell(), len(a))
+        self.assertEqual(a.read(), b"")
+
+    def test_generic_2682_seek_and_tell(self, a: ClassUnderTest, n: int) -> None:
+        """a.seek(i); a.tell() == i for i in [0 .. len(a)]"""
+        hypothesis.assume(not a.closed)
+        position = n % (len(a) + 1)
+        a.seek(position)
+        self.assertEqual(a.tell(), position)
+        a.seek(0, 2)
+        self.assertEqual(a.tell(), len(a))
+        a.seek(-position, 1)
+        self.assertEqual(a.tell(), len(a) - position)
+        with self.assertRaises(ValueError):
+            a.seek(len(a) + 1)
+
+    def test_generic_2683_read_seek_write(self, a: ClassUnderTest, b: bytes, n: int) -> None:
+        """a.seek(i); a.write(b); a[i:i + len(b)] == b"""
+        hypothesis.assume(not a.closed)
+        original = a[:]
+        position = n % (len(a) + 1)
+        c = b[: len(a) - position]
+        a.seek(position)
+        self.assertEqual(a.write(c), len(c))
+        self.assertEqual(a.tell(), position + len(c))
+        expected = bytearray(original)
+        expected[position : position + len(c)] = c  # noqa E203
+        self.assertEqual(a[:], expected)
+        a.seek(position)
+        self.assertEqual(a.read(len(c)), c)
+        a.seek(0, 2)
+        with self.assertRaises(ValueError):
+            a.write(b"\0")
+
+    def test_generic_2684_getitem_definition(self, a: ClassUnderTest, n: int) -> None:
+        """a[i] == a[:][i]"""
+        hypothesis.assume(not a.closed)
+        hypothesis.assume(len(a) > 0)
+        i = n % len(a)
+        self.assertEqual(a[i], a[:][i])
+        self.assertEqual(a[i - len(a)], a[i])
+        with self.assertRaises(IndexError):
+            a[len(a)]
+
+    def test_generic_2685_find_definition(self, a: ClassUnderTest, b: bytes) -> None:
+        """a.find(b) == a[:].find(b) and a.rfind(b) == a[:].rfind(b)"""
+        hypothesis.assume(not a.closed)
+        a.seek(0)
+        self.assertEqual(a.find(b), a[:].find(b))
+        self.assertEqual(a.rfind(b), a[:].rfind(b))
+
+    def test_generic_2686_close_and_closed(self, a: ClassUnderTest) -> None:
+        """a.close(); a.closed"""
+        hypothesis.assume(not a.closed)
+        a.close()
+        self.assertTrue(a.closed)
+        a.close()
+        self.assertTrue(a.closed)
+        with self.assertRaises(ValueError):
+            a.read()
@@ -0,0 +1,231 @@
+# Copyright 2021 Steve Palmer
+
+"""A local store of benchmark results, and their comparison across runs.
+
+Each run of the benchmarks is appended to benchmarks.jsonl in the history directory,
+one line per benchmark class and operation, with the run id and an environment fingerprint.
+Runs are only compared within an environment, as timings from different machines or Pythons are not comparable.
+
+Two runs are compared with a Mann-Whitney U test on the samples of each benchmark class and operation,
+and a difference is only flagged if it is significant, and its effect size, Cliff's delta,
+and its relative change in median both exceed thresholds, as a significant difference can be negligible.
+
+From the command line:
+
+    python -m generic_testing.history run [--directory D] [--start-directory S] [--pattern P]
+    python -m generic_testing.history compare [--directory D] [BASELINE [CURRENT]]
+
+run discovers and runs the benchmarks, stores them, and compares them with the previous run.
+compare compares two stored runs, by default the last two in this environment.
+Both exit with status 1 if there are regressions and --strict is given.
+"""
+
+import argparse
+import collections
+import hashlib
+import json
+import math
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import typing
+import unittest
+
+from .benchmarks import GenericBenchmarks
+
+
+__all__ = ("Comparison", "environment_fingerprint", "mann_whitney_u", "BenchmarkHistory")
+
+
+Comparison = collections.namedtuple(
+    "Comparison",
+    ["test", "operation", "baseline_median", "current_median", "change", "p_value", "effect_size", "verdict"],
+)
+# test: str = name of the benchmark class
+# operation: str = name of the operation timed
+# baseline_median, current_median: float = median seconds per call in each run
+# change: float = relative change in median, (current - baseline) / baseline
+# p_value: float = two sided p value of the Mann-Whitney U test
+# effect_size: float = Cliff's delta, from -1 when current is always faster, to 1 when always slower
+# verdict: str = "regression", "improvement" or "unchanged"
+
+
+def environment_fingerprint() -> str:
+    """A short digest of the interpreter and machine that the benchmarks ran on."""
+    environment = dict(
+        implementation=platform.python_implementation(),
+        version=platform.python_version(),
+        gil=getattr(sys, "_is_gil_enabled", lambda: True)(),
+        system=platform.system(),
+        machine=platform.machine(),
+        processor=platform.processor(),
+        cpus=os.cpu_count(),
+    )
+    return hashlib.sha256(json.dumps(environment, sort_keys=True).encode()).hexdigest()[:12]
+
+
+def mann_whitney_u(xs: typing.Sequence[float], ys: typing.Sequence[float]) -> typing.Tuple[float, float]:
+    """The U statistic of xs, and the two sided p value, by the normal approximation with a tie correction."""
+    n1, n2 = len(xs), len(ys)
+    pooled = sorted([(x, 0) for x in xs] + [(y, 1) for y in ys])
+    n = n1 + n2
+    rank_sum = 0.0
+    tie_sum = 0
+    i = 0
+    while i < n:
+        j = i
+        while j < n and pooled[j][0] == pooled[i][0]:
+            j += 1
+        rank = (i + j + 1) / 2  # mean of ranks i+1 .. j
+        rank_sum += rank * sum(1 for _, sample in pooled[i:j] if sample == 0)
+        tie_sum += (j - i) ** 3 - (j - i)
+        i = j
+    u = rank_sum - n1 * (n1 + 1) / 2
+    variance = n1 * n2 / 12 * ((n + 1) - tie_sum / (n * (n - 1)))
+    if variance <= 0.0:
+        return u, 1.0
+    z = (abs(u - n1 * n2 / 2) - 0.5) / math.sqrt(variance)
+    return u, min(1.0, math.erfc(max(0.0, z) / math.sqrt(2)))
+
+
+class BenchmarkHistory:
+    """The benchmark results stored in a directory.
+
+    alpha: the significance level of the Mann-Whitney U test.
+    min_effect_size: the least |Cliff's delta| flagged, 0.474 being conventionally a large effect.
+    min_change: the least relative change in median flagged.
+    Runs in separate processes differ by several percent on operators taking tens of nanoseconds,
+    so the defaults only flag large changes.
+    """
+
+    def __init__(
+        self, directory: str, *, alpha: float = 0.01, min_effect_size: float = 0.474, min_change: float = 0.1
+    ) -> None:
+        self.directory = directory
+        self.alpha = alpha
+        self.min_effect_size = min_effect_size
+        self.min_change = min_change
+
+    @property
+    def path(self) -> str:
+        return os.path.join(self.directory, "benchmarks.jsonl")
+
+    @staticmethod
+    def default_run_id() -> str:
+        """The current git commit, if there is one, or else the time."""
+        try:
+            return subprocess.run(
+                ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+            ).stdout.strip()
+        except (OSError, subprocess.CalledProcessError):
+            return time.strftime("%Y%m%dT%H%M%S")
+
+    def save(self, records, run: str = None, environment: str = None) -> str:
+        """Append the BenchmarkRecords as a run, and return its run id."""
+        run = self.default_run_id() if run is None else run
+        environment = environment_fingerprint() if environment is None else environment
+        samples = collections.OrderedDict()
+        for record in records:
+            samples.setdefault((record.test, record.operation), []).extend(record.samples)
+        os.makedirs(self.directory, exist_ok=True)
+        with open(self.path, "a") as f:
+            for (test, operation), seconds in samples.items():
+                line = dict(run=run, environment=environment, test=test, operation=operation, samples=seconds)
+                f.write(json.dumps(line) + "\n")
+        return run
+
+    def load(self, environment: str = None) -> "collections.OrderedDict[str, dict]":
+        """The stored runs of the environment, oldest first, each mapping (test, operation) to samples."""
+        environment = environment_fingerprint() if environment is None else environment
+        runs = collections.OrderedDict()
+        if os.path.exists(self.path):
+            with open(self.path) as f:
+                for line in f:
+                    entry = json.loads(line)
+                    if entry["environment"] == environment:
+                        # A run id saved again, such as a rerun of a commit, replaces its samples and becomes latest
+                        runs.setdefault(entry["run"], dict())[(entry["test"], entry["operation"])] = entry["samples"]
+                        runs.move_to_end(entry["run"])
+        return runs
+
+    def compare_samples(self, test: str, operation: str, baseline, current) -> Comparison:
+        baseline_median = statistics.median(baseline)
+        current_median = statistics.median(current)
+        change = (current_median - baseline_median) / baseline_median if baseline_median > 0.0 else 0.0
+        u, p_value = mann_whitney_u(current, baseline)
+        effect_size = 2 * u / (len(current) * len(baseline)) - 1
+        verdict = "unchanged"
+        if p_value < self.alpha and abs(effect_size) >= self.min_effect_size and abs(change) >= self.min_change:
+            verdict = "regression" if change > 0.0 else "improvement"
+        return Comparison(test, operation, baseline_median, current_median, change, p_value, effect_size, verdict)
+
+    def compare(self, baseline: str = None, current: str = None, environment: str = None) -> typing.List[Comparison]:
+        """Compare the benchmarks common to two runs, by default the last two stored."""
+        runs = self.load(environment)
+        run_ids = list(runs)
+        if current is None:
+            current = run_ids[-1] if run_ids else None
+        if baseline is None:
+            earlier = [run for run in run_ids if run != current]
+            baseline = earlier[-1] if earlier else None
+        if baseline not in runs or current not in runs:
+            return []
+        return [
+            self.compare_samples(test, operation, samples, runs[current][(test, operation)])
+            for (test, operation), samples in runs[baseline].items()
+            if (test, operation) in runs[current] and len(samples) > 1 and len(runs[current][(test, operation)]) > 1
+        ]
+
+
+def _print_comparisons(comparisons) -> int:
+    """Print the flagged comparisons, and return the number of regressions."""
+    for comparison in comparisons:
+        if comparison.verdict != "unchanged":
+            print(
+                f"{comparison.verdict}: {comparison.test}.{comparison.operation} "
+                f"{comparison.baseline_median:.3g}s -> {comparison.current_median:.3g}s "
+                f"({comparison.change:+.1%}, p={comparison.p_value:.2g}, delta={comparison.effect_size:+.2f})"
+            )
+    regressions = sum(1 for comparison in comparisons if comparison.verdict == "regression")
+    print(f"{len(comparisons)} benchmarks compared, {regressions} regressions")
+    return regressions
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m generic_testing.history", description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--directory",
+        default=os.environ.get("GENERIC_TESTING_BENCHMARKS", ".benchmarks"),
+        help="history directory, default $GENERIC_TESTING_BENCHMARKS or .benchmarks",
+    )
+    parser.add_argument("--strict", action="store_true", help="exit with status 1 if there are regressions")
+    commands = parser.add_subparsers(dest="command", required=True)
+    run_parser = commands.add_parser("run", help="run the benchmarks, store them and compare with the previous run")
+    run_parser.add_argument("--start-directory", default="tests")
+    run_parser.add_argument("--pattern", default="test_benchmarks*.py")
+    run_parser.add_argument("--run", help="run id, default the git commit")
+    compare_parser = commands.add_parser("compare", help="compare two stored runs")
+    compare_parser.add_argument("baseline", nargs="?")
+    compare_parser.add_argument("current", nargs="?")
+    args = parser.parse_args(argv)
+
+    history = BenchmarkHistory(args.directory)
+    if args.command == "run":
+        start = len(GenericBenchmarks.benchmark_records)
+        suite = unittest.defaultTestLoader.discover(args.start_directory, pattern=args.pattern)
+        result = unittest.TextTestRunner(stream=sys.stderr).run(suite)
+        if not result.wasSuccessful():
+            return 1
+        current = history.save(GenericBenchmarks.benchmark_records[start:], args.run)
+        comparisons = history.compare(current=current)
+    else:
+        comparisons = history.compare(args.baseline, args.current)
+    regressions = _print_comparisons(comparisons)
+    return 1 if args.strict and regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,177 @@
+# Copyright 2021 Steve Palmer
+
+"""Fingerprints of test classes, and a cache of the tests that passed with them, to skip unchanged tests.
+
+The fingerprint of a test class is a digest of:
+    the Python version,
+    the source of each class in its MRO, which includes the generic tests it inherits,
+    the definition of each strategy bound to it by Given,
+    the source of each function and class that the strategy is built from, such as the target of builds,
+    the source of each class in the MRO of its class under test.
+The class under test is the class_under_test attribute of the test class, if it has one,
+or else the type of the values of the strategy bound to ClassUnderTest, found from its definition.
+No example is drawn, as that is nondeterministic, and may have side effects, such as creating temporary files.
+Built-in classes have no source, so are represented by their name, and change with the Python version.
+
+Strategies are taken apart through the attributes of the hypothesis internals, which differ between versions,
+so where a strategy cannot be taken apart, its class under test is None, and only its repr is in the fingerprint.
+
+The ResultCache records the tests that passed, keyed by the fingerprint of their class and the library version.
+"""
+
+import hashlib
+import inspect
+import json
+import os
+import sys
+import typing
+
+from hypothesis import strategies as st
+
+from .core import ClassUnderTest
+
+
+__all__ = ("class_under_test", "fingerprint", "ResultCache")
+
+
+def _source(obj) -> str:
+    try:
+        return inspect.getsource(obj)
+    except (OSError, TypeError):
+        return f"{getattr(obj, '__module__', '')}.{getattr(obj, '__qualname__', repr(obj))}"
+
+
+def _strategy_parts(strategy: st.SearchStrategy) -> typing.Iterator:
+    """The strategy, and the strategies, functions and values it is built from, depth first."""
+    stack, seen = [strategy], set()
+    while stack:
+        part = stack.pop()
+        if id(part) in seen:
+            continue
+        seen.add(id(part))
+        yield part
+        if isinstance(part, st.SearchStrategy):
+            stack.extend(reversed(list(getattr(part, "__dict__", dict()).values())))
+        elif isinstance(part, (tuple, list)):
+            stack.extend(reversed(part))
+        elif isinstance(part, dict):
+            stack.extend(reversed(list(part.values())))
+
+
+def _type_of_hint(hint) -> typing.Optional[type]:
+    """The class of hint, such as list for typing.List[int], or None if it is not a class."""
+    hint = typing.get_origin(hint) or hint
+    return hint if isinstance(hint, type) else None
+
+
+def _produced_type(producer) -> typing.Optional[type]:
+    """The type of the values returned by producer, a class or an annotated function.
+
+    A classmethod, such as ModuloN.decimal_digit, is taken to be an alternative constructor of its class.
+    """
+    if isinstance(producer, type):
+        return producer
+    if inspect.ismethod(producer) and isinstance(producer.__self__, type):
+        return producer.__self__
+    try:
+        return _type_of_hint(typing.get_type_hints(producer).get("return"))
+    except Exception:
+        return None
+
+
+def _strategy_type(strategy: st.SearchStrategy, depth: int = 0) -> typing.Optional[type]:
+    """The type of the values of strategy, found from its definition, or None."""
+    if depth > 100:
+        return None
+    maps = [transformation[1] for transformation in getattr(strategy, "_transformations", ()) if transformation[0] == "map"]
+    if maps:  # later versions of hypothesis keep the maps of a LazyStrategy
+        return _produced_type(maps[-1])
+    for attribute in ("pack", "target"):  # MappedStrategy and BuildsStrategy
+        if hasattr(strategy, attribute):
+            return _produced_type(getattr(strategy, attribute))
+    for attribute, part_type in (("original_strategies", _strategy_type), ("elements", lambda e, _: type(e))):
+        parts = getattr(strategy, attribute, None)  # one_of, and just or sampled_from
+        if parts is not None:
+            types = {part_type(part, depth + 1) for part in parts}
+            return types.pop() if len(types) == 1 else None
+    function = getattr(strategy, "function", None)  # a LazyStrategy, such as st.integers(), is SearchStrategy[int]
+    if function is not None:
+        try:
+            arguments = typing.get_args(typing.get_type_hints(function).get("return"))
+        except Exception:
+            arguments = ()
+        if arguments and _type_of_hint(arguments[0]) is not None:
+            return _type_of_hint(arguments[0])
+    wrapped = getattr(strategy, "wrapped_strategy", strategy)
+    return None if wrapped is strategy else _strategy_type(wrapped, depth + 1)
+
+
+def class_under_test(test_class: type) -> typing.Optional[type]:
+    """The class tested by test_class, or None if it cannot be determined."""
+    result = getattr(test_class, "class_under_test", None)
+    if result is None:
+        strategy = getattr(test_class, "_given_strategies", dict()).get(ClassUnderTest)
+        if isinstance(strategy, st.SearchStrategy):
+            result = _strategy_type(strategy)
+    return result
+
+
+def fingerprint(test_class: type) -> str:
+    """A digest of everything that the results of test_class depend on."""
+    digest = hashlib.sha256(sys.version.encode())
+    for klass in test_class.__mro__:
+        digest.update(_source(klass).encode())
+    for annotation, strategy in getattr(test_class, "_given_strategies", dict()).items():
+        if isinstance(strategy, st.SearchStrategy):
+            digest.update(f"{annotation}: {strategy!r}".encode())
+            for part in _strategy_parts(strategy):
+                if inspect.isfunction(part) or inspect.ismethod(part) or isinstance(part, type):
+                    digest.update(_source(part).encode())
+        else:
+            digest.update(f"{annotation}: {_source(strategy)}".encode())
+    T = class_under_test(test_class)
+    if T is not None:
+        for klass in T.__mro__:
+            digest.update(_source(klass).encode())
+    return digest.hexdigest()
+
+
+class ResultCache:
+    """The tests that passed with each test class fingerprint, stored in directory/results.json."""
+
+    def __init__(self, directory: str, version: str) -> None:
+        self.directory = directory
+        self.version = str(version)
+
+    @property
+    def path(self) -> str:
+        return os.path.join(self.directory, "results.json")
+
+    def _load(self) -> dict:
+        if not os.path.exists(self.path):
+            return dict()
+        with open(self.path) as f:
+            return json.load(f)
+
+    def passed(self, test_id: str, test_fingerprint: str) -> typing.FrozenSet[str]:
+        """The test methods of test_id that last passed with test_fingerprint and this version."""
+        entry = self._load().get(test_id)
+        if entry is None or entry["fingerprint"] != test_fingerprint or entry["version"] != self.version:
+            return frozenset()
+        return frozenset(entry["passed"])
+
+    def update(self, results: typing.Iterable[typing.Tuple[str, str, typing.Iterable[str], typing.Iterable[str]]]) -> None:
+        """Record the (test_id, fingerprint, passed, failed) test methods of each test class run.
+
+        Tests that passed before with the same fingerprint, and were not run, remain passed.
+        """
+        cache = self._load()
+        for test_id, test_fingerprint, passed, failed in results:
+            entry = cache.get(test_id)
+            if entry is None or entry["fingerprint"] != test_fingerprint or entry["version"] != self.version:
+                entry = dict(fingerprint=test_fingerprint, version=self.version, passed=[])
+            entry["passed"] = sorted((set(entry["passed"]) | set(passed)) - set(failed))
+            cache[test_id] = entry
+        os.makedirs(self.directory, exist_ok=True)
+        with open(self.path, "w") as f:
+            json.dump(cache, f, indent=1, sort_keys=True)
@@ -2,12 +2,32 @@
 
 """Determine the generic test base class for a given class_under_test."""
 
+import array
 import collections
 import enum
 import fractions
+import gzip
 import inspect
 import io
+import mmap
 import numbers
+import queue
+import unittest
+
+try:
+    import bz2
+except ImportError:
+    bz2 = None
+
+try:
+    import lzma
+except ImportError:
+    lzma = None
+
+try:
+    import sortedcontainers
+except ImportError:
+    sortedcontainers = None
 
 import yaml
 
@@ -18,8 +38,13 @@ from .arithmetic import *
 from .collections_abc import *
 from .numbers_abc import *
 from .built_in_types import *
+from .sorted_collections import *
 from .file_likes import *
 from .enums import *
+from .queues import *
+from .memory import *
+from .concurrency import *
+from .benchmarks import *
 
 
 __all__ = ("GenericTestLoader", "defaultGenericTestLoader")
@@ -109,11 +134,12 @@ class GenericTestLoader:
                     if class_description.has:
                         base_class_list = []
                         for model in class_description.has:
-                            model = str(model) + "Tests"
-                            if model in globals():
-                                base_class_list.append(globals()[model])
+                            for model_tests in (str(model) + "Tests", str(model) + "MixinTests"):
+                                if model_tests in globals():
+                                    base_class_list.append(globals()[model_tests])
+                                    break
                             else:
-                                print(f"ERROR: Model {model} not in globals")
+                                print(f"ERROR: Model {model}Tests not in globals")
                         if base_class_list:
 
                             class result(*base_class_list):
@@ -172,6 +198,23 @@ class GenericTestLoader:
         assert issubclass(result, GenericTests)
         return result
 
+    def discover_benchmarks(self, T: type, *, use_docstring_yaml: bool = False) -> GenericBenchmarks:
+        """Generate Benchmarks of the operators exercised by the discovered tests."""
+        return benchmarks_for(self.discover(T, use_docstring_yaml=use_docstring_yaml))
+
+    def profile(self, T: type, strategy_dict, *, use_docstring_yaml: bool = False) -> str:
+        """Run the discovered Benchmarks of T, bound to strategy_dict, and report them as JSON lines."""
+        benchmarks = Given(strategy_dict)(
+            type(f"Benchmark_{T.__name__}", (self.discover_benchmarks(T, use_docstring_yaml=use_docstring_yaml),), {})
+        )
+        result = unittest.TestResult()
+        unittest.defaultTestLoader.loadTestsFromTestCase(benchmarks).run(result)
+        if result.errors or result.failures:
+            raise RuntimeError((result.errors + result.failures)[0][1])
+        return GenericBenchmarks.benchmark_report(
+            [record for record in GenericBenchmarks.benchmark_records if record.test == benchmarks.__name__]
+        )
+
 
 defaultGenericTestLoader = GenericTestLoader()
 
@@ -203,9 +246,27 @@ defaultGenericTestLoader.register(dict, dictTests)
 defaultGenericTestLoader.register(collections.Counter, CounterTests)
 defaultGenericTestLoader.register(collections.OrderedDict, OrderedDictTests)
 defaultGenericTestLoader.register(collections.defaultdict, defaultdictTests)
+defaultGenericTestLoader.register(collections.deque, dequeTests)
+defaultGenericTestLoader.register(queue.PriorityQueue, PriorityQueueTests)
 defaultGenericTestLoader.register(tuple, tupleTests)
 defaultGenericTestLoader.register(str, tupleTests)
 defaultGenericTestLoader.register(list, listTests)
+defaultGenericTestLoader.register(range, rangeTests)
+defaultGenericTestLoader.register(bytes, bytesTests)
+defaultGenericTestLoader.register(bytearray, bytearrayTests)
+defaultGenericTestLoader.register(memoryview, memoryviewTests)
+defaultGenericTestLoader.register(array.array, arrayTests)
+if sortedcontainers is not None:
+    defaultGenericTestLoader.register(sortedcontainers.SortedList, SortedSequenceTests)
+    defaultGenericTestLoader.register(sortedcontainers.SortedSet, sortedcontainersSortedSetTests)
+    defaultGenericTestLoader.register(sortedcontainers.SortedDict, SortedMappingTests)
+defaultGenericTestLoader.register(mmap.mmap, mmapTests)
+defaultGenericTestLoader.register(io.TextIOWrapper, TextIOWrapperTests)
+defaultGenericTestLoader.register(gzip.GzipFile, GzipFileTests)
+if bz2 is not None:
+    defaultGenericTestLoader.register(bz2.BZ2File, BZ2FileTests)
+if lzma is not None:
+    defaultGenericTestLoader.register(lzma.LZMAFile, LZMAFileTests)
 
 defaultGenericTestLoader.register(complex, complexTests)
 defaultGenericTestLoader.register(float, floatTests)
@@ -0,0 +1,279 @@
+# Copyright 2021 Steve Palmer
+
+"""A library of generic tests of memory footprint, measured with tracemalloc."""
+
+import collections
+import collections.abc
+import copy
+import gc
+import json
+import operator
+import pickle
+import tracemalloc
+
+from hypothesis import Phase, settings
+
+from .core import AllocationTrace, ClassUnderTest
+
+
+__all__ = (
+    "FootprintRecord",
+    "MemoryFootprintMixinTests",
+    "SizedMemoryFootprintMixinTests",
+    "LeakCheckMixinTests",
+)
+
+
+FootprintRecord = collections.namedtuple("FootprintRecord", ["test", "length", "per_instance", "per_element"])
+# test: str = name of the test class
+# length: int = len() of the instance measured, or None if it is not Sized
+# per_instance: float = bytes allocated by constructing an instance
+# per_element: float = bytes allocated by constructing an instance, per element beyond empty, or None
+
+
+class MemoryFootprintMixinTests:
+    """Discrete tests of the memory footprint of the ClassUnderTest.
+
+    The footprint of an instance is the net memory allocated constructing a batch of
+    footprint_batch copies of it, divided by the batch size, and the least of footprint_repeats batches.
+    By default, the copies are constructed by unpickling, so this includes everything the instance owns.
+    Override footprint_copy to construct them differently.
+
+    The footprint is checked against footprint_budget, if set, and against footprint_baseline, if set.
+    The baseline is a mapping of test class name to the largest footprints previously seen,
+    as produced by footprint_baseline_from, and may exceed it by the fraction footprint_tolerance.
+    The most recent footprint_records_kept measurements, of all the test classes, are kept in footprint_records,
+    and footprint_report gives them as JSON lines.
+    """
+
+    footprint_batch = 100
+    footprint_repeats = 3
+    footprint_budget = None  # bytes per instance
+    footprint_baseline = None
+    footprint_tolerance = 0.1
+    footprint_records_kept = 100_000
+    footprint_records = collections.deque(maxlen=footprint_records_kept)  # shared by all test classes
+
+    def footprint_copy(self, a: ClassUnderTest) -> ClassUnderTest:
+        """Construct a new instance equal to a."""
+        try:
+            return pickle.loads(pickle.dumps(a, pickle.HIGHEST_PROTOCOL))
+        except (pickle.PicklingError, TypeError, AttributeError):
+            self.skipTest(f"cannot construct copies of {type(a).__name__} by pickling")
+
+    def measure_footprint(self, a: ClassUnderTest) -> float:
+        """The bytes allocated by constructing a copy of a.
+
+        The least of footprint_repeats batches is taken, to discount one-off allocations
+        that happen to fall within a batch, such as a cache growing.
+        """
+        self.footprint_copy(a)  # warm any caches
+        result = float("inf")
+        for _ in range(self.footprint_repeats):
+            batch = [None] * self.footprint_batch
+            with AllocationTrace() as trace:
+                for i in range(self.footprint_batch):
+                    batch[i] = self.footprint_copy(a)
+            result = min(result, trace.net / self.footprint_batch)
+            del batch
+        return result
+
+    @classmethod
+    def footprint_report(cls) -> str:
+        """The footprint_records, as JSON lines."""
+        return "".join(json.dumps(record._asdict()) + "\n" for record in cls.footprint_records)
+
+    @classmethod
+    def footprint_baseline_from(cls, records=None) -> dict:
+        """The largest footprints of each test class in records, default footprint_records, for footprint_baseline."""
+        result = dict()
+        for record in cls.footprint_records if records is None else records:
+            baseline = result.setdefault(record.test, dict(per_instance=None, per_element=None))
+            for field in ("per_instance", "per_element"):
+                value = getattr(record, field)
+                if value is not None and (baseline[field] is None or baseline[field] < value):
+                    baseline[field] = value
+        return result
+
+    def _record_footprint(self, record: FootprintRecord, field: str, budget, *, use_baseline: bool = True) -> None:
+        type(self).footprint_records.append(record)
+        value = getattr(record, field)
+        if budget is not None:
+            self.assertLessEqual(value, budget, f"{field} footprint over budget")
+        if use_baseline and self.footprint_baseline is not None and record.test in self.footprint_baseline:
+            baseline = self.footprint_baseline[record.test][field]
+            if baseline is not None:
+                self.assertLessEqual(
+                    value, baseline * (1 + self.footprint_tolerance), f"{field} footprint regressed from {baseline}"
+                )
+
+    def test_generic_2900_footprint_per_instance(self, a: ClassUnderTest) -> None:
+        """footprint(a) <= budget"""
+        record = FootprintRecord(type(self).__name__, None, self.measure_footprint(a), None)
+        self._record_footprint(record, "per_instance", self.footprint_budget)
+
+
+class SizedMemoryFootprintMixinTests(MemoryFootprintMixinTests):
+    """Discrete tests of the memory footprint of a Sized ClassUnderTest, per element.
+
+    The footprint per element is the footprint of a beyond that of the empty instance, if there is one,
+    divided by len(a).  Short instances are dominated by fixed overheads,
+    so this is only measured for len(a) >= footprint_min_length.
+    The footprint_budget and baseline apply to the footprint per element.
+    The footprint per instance depends on len(a), so is only checked against footprint_per_instance_budget.
+    """
+
+    footprint_min_length = 16
+    footprint_per_instance_budget = None  # bytes per instance
+
+    def test_generic_2900_footprint_per_instance(self, a: ClassUnderTest) -> None:
+        """footprint(a) <= budget"""
+        record = FootprintRecord(type(self).__name__, len(a), self.measure_footprint(a), None)
+        self._record_footprint(record, "per_instance", self.footprint_per_instance_budget, use_baseline=False)
+
+    def test_generic_2901_footprint_per_element(self, a: ClassUnderTest) -> None:
+        """(footprint(a) - footprint(∅)) / len(a) <= budget"""
+        a_len = len(a)
+        if a_len >= self.footprint_min_length:
+            empty = getattr(self, "empty", None)
+            empty_footprint = 0.0 if empty is None else self.measure_footprint(empty)
+            per_instance = self.measure_footprint(a)
+            record = FootprintRecord(type(self).__name__, a_len, per_instance, (per_instance - empty_footprint) / a_len)
+            self._record_footprint(record, "per_element", self.footprint_budget)
+
+
+_leak_check_phases = [Phase.explicit, Phase.reuse, Phase.generate]
+
+
+class LeakCheckMixinTests:
+    """Discrete tests that repeated operations on the ClassUnderTest do not leak memory.
+
+    The operations are run together leak_check_warmup times, to fill any caches,
+    and then for leak_check_rounds rounds of leak_check_iterations.
+    After each round, garbage is collected and the gc object count and tracemalloc total are sampled.
+    The first round is allowed to settle, but after that, the growth per iteration must be below
+    leak_check_objects_per_iteration and leak_check_bytes_per_iteration,
+    and the collection must find no uncollectable objects.
+    If they fail, each operation is checked alone, to name the culprit.
+
+    The operations are the names of operator functions, used where the ClassUnderTest has the
+    corresponding special method, or callables, such as mutations.  In-place operations are applied to a copy,
+    so that a mutable ClassUnderTest does not grow.  Operations that raise an ArithmeticError,
+    ValueError or TypeError on the operands are passed over.
+    A copy discards any history the instance keeps of its operations, so the leak_check_per_instance_operations
+    are also repeated on a single instance.  These are in-place operations that do not grow the value,
+    other than += on a Sized ClassUnderTest, which concatenates.
+    Since each example runs many thousand operations, only 10 examples are run, with no deadline.
+    Leaks rarely depend on the operands, so failing examples are not shrunk.
+    """
+
+    leak_check_unary_operations = ("neg", "pos", "abs", "invert")
+    leak_check_binary_operations = (
+        "add", "sub", "mul", "truediv", "floordiv", "mod", "and_", "or_", "xor",
+        "iadd", "isub", "imul", "itruediv", "ifloordiv", "imod", "iand", "ior", "ixor",
+    )
+    leak_check_per_instance_operations = ("iadd", "isub", "iand", "ior", "ixor")
+    leak_check_warmup = 100
+    leak_check_rounds = 4
+    leak_check_iterations = 1000
+    leak_check_objects_per_iteration = 0.5
+    leak_check_bytes_per_iteration = 4.0
+
+    @staticmethod
+    def _leak_check_supports(a, operation: str) -> bool:
+        """Does a have the special method of the named operator function, or the operator an in-place one falls back to?"""
+        name = operation.rstrip("_")
+        # Look in the class dictionaries, as hasattr also finds type.__or__ on every class
+        supported = {attribute for c in type(a).__mro__ for attribute in vars(c)}
+        return f"__{name}__" in supported or (name.startswith("i") and f"__{name[1:]}__" in supported)
+
+    @classmethod
+    def _leak_check_resolve(cls, operation, a):
+        """The callable and name of operation, or None if a does not support it."""
+        if callable(operation):
+            return operation, getattr(operation, "__name__", repr(operation))
+        if not cls._leak_check_supports(a, operation):
+            return None
+        name = operation.rstrip("_")
+        function = getattr(operator, operation)
+        if name.startswith("i") and name != "invert":
+            return (lambda x, *args: function(copy.copy(x), *args)), operation
+        return function, operation
+
+    def assertDoesNotLeak(self, call, msg: str = None) -> None:
+        """Confirm that calling call() repeatedly does not grow memory, nor leave uncollectable garbage."""
+        for _ in range(self.leak_check_warmup):
+            call()
+        samples = []
+        with AllocationTrace():
+            for _ in range(self.leak_check_rounds):
+                for _ in range(self.leak_check_iterations):
+                    call()
+                garbage = len(gc.garbage)
+                gc.collect()
+                if len(gc.garbage) != garbage:
+                    raise self.failureException(
+                        self._formatMessage(msg, f"{len(gc.garbage) - garbage} uncollectable objects")
+                    )
+                samples.append((len(gc.get_objects()), tracemalloc.get_traced_memory()[0]))
+        iterations = self.leak_check_iterations * (self.leak_check_rounds - 1)
+        objects = (samples[-1][0] - samples[0][0]) / iterations
+        if objects >= self.leak_check_objects_per_iteration:
+            raise self.failureException(self._formatMessage(msg, f"leaked {objects} objects per iteration"))
+        allocated = (samples[-1][1] - samples[0][1]) / iterations
+        if allocated >= self.leak_check_bytes_per_iteration:
+            raise self.failureException(self._formatMessage(msg, f"leaked {allocated} bytes per iteration"))
+
+    def _check_operations_do_not_leak(self, operations, *args) -> None:
+        functions = []
+        for operation in operations:
+            resolved = self._leak_check_resolve(operation, args[0])
+            if resolved is not None:
+                try:
+                    resolved[0](*args)
+                except (ArithmeticError, ValueError, TypeError):
+                    continue
+                functions.append(resolved)
+
+        def call_all():
+            for function, _ in functions:
+                function(*args)
+
+        # Check all the operations together, as collecting garbage after every round is slow,
+        # and only check them one by one to name the culprit
+        try:
+            self.assertDoesNotLeak(call_all)
+        except self.failureException:
+            for function, name in functions:
+                self.assertDoesNotLeak(lambda: function(*args), f"{name} leaks")
+            raise
+
+    @settings(max_examples=10, deadline=None, phases=_leak_check_phases)
+    def test_generic_2910_unary_operations_do_not_leak(self, a: ClassUnderTest) -> None:
+        self._check_operations_do_not_leak(self.leak_check_unary_operations, a)
+
+    @settings(max_examples=10, deadline=None, phases=_leak_check_phases)
+    def test_generic_2911_binary_operations_do_not_leak(self, a: ClassUnderTest, b: ClassUnderTest) -> None:
+        self._check_operations_do_not_leak(self.leak_check_binary_operations, a, b)
+
+    @settings(max_examples=10, deadline=None, phases=_leak_check_phases)
+    def test_generic_2912_inplace_operations_do_not_leak_per_instance(
+        self, a: ClassUnderTest, b: ClassUnderTest
+    ) -> None:
+        def repeated_on_one_instance(operation):
+            function = getattr(operator, operation)
+            target = [copy.copy(a)]
+
+            def call(_, y):
+                target[0] = function(target[0], y)
+
+            call.__name__ = operation
+            return call
+
+        operations = [
+            repeated_on_one_instance(operation)
+            for operation in self.leak_check_per_instance_operations
+            if self._leak_check_supports(a, operation)
+            and not (operation == "iadd" and isinstance(a, collections.abc.Sized))
+        ]
+        self._check_operations_do_not_leak(operations, a, b)
@@ -0,0 +1,228 @@
+# Copyright 2021 Steve Palmer
+
+"""Mutation testing of the generic tests, to score how strong they are for a class.
+
+Each mutant perturbs one special method of the class, such as adding one to the result of __mod__,
+or making __lt__ call __le__.  The test class is run against each mutant in turn,
+and a mutant is killed by the tests that fail against it, but pass against the original class.
+A mutant that no test kills survives, and suggests a property the tests do not capture.
+
+The mutants are run in a pool of spawned processes, as each mutant is installed by patching the class,
+which must not be seen by the tests of another mutant.  So the class, and the test class,
+must be defined at the top level of an importable module, and the class must allow its attributes to be set,
+which rules out the built-in types.
+"""
+
+import collections
+import concurrent.futures
+import json
+import multiprocessing
+import os
+import re
+import threading
+import typing
+import unittest
+
+from hypothesis import Phase, settings
+
+
+__all__ = ("Mutant", "MutantResult", "mutants_for", "run_mutants", "mutation_report")
+
+
+Mutant = collections.namedtuple("Mutant", ["method", "kind", "other"])
+# method: str = name of the special method mutated
+# kind: str = name of the mutation, one of the keys of _mutations
+# other: str = name of the special method that a "swap" mutant calls instead, else None
+
+
+MutantResult = collections.namedtuple("MutantResult", ["mutant", "killed_by"])
+# mutant: Mutant = the mutant run, or None for the original class
+# killed_by: tuple of str = test numbers that failed against the mutant, but not against the original class
+
+
+def _off_by_one(original, mutant):
+    def result(self, *args):
+        return original(self, *args) + 1
+
+    return result
+
+
+def _swap_args(original, mutant):
+    def result(self, other):
+        return original(other, self) if isinstance(other, type(self)) else original(self, other)
+
+    return result
+
+
+def _swap(original, mutant):
+    def result(self, *args):
+        return getattr(type(self), mutant.other)(self, *args)
+
+    return result
+
+
+def _negate(original, mutant):
+    def result(self, *args):
+        return not original(self, *args)
+
+    return result
+
+
+def _constant(original, mutant):
+    def result(self, *args):
+        return 0
+
+    return result
+
+
+def _return_self(original, mutant):
+    def result(self, *args):
+        return self
+
+    return result
+
+
+def _out_of_place(original, mutant):
+    operator_name = mutant.method.replace("__i", "__", 1)
+
+    def result(self, other):
+        return getattr(type(self), operator_name)(self, other)
+
+    return result
+
+
+_mutations = {
+    "off_by_one": _off_by_one,
+    "swap_args": _swap_args,
+    "swap": _swap,
+    "negate": _negate,
+    "constant": _constant,
+    "return_self": _return_self,
+    "out_of_place": _out_of_place,
+}
+
+_binary_operators = (
+    "add", "sub", "mul", "truediv", "floordiv", "mod", "pow", "and", "or", "xor", "lshift", "rshift",
+)
+_swapped_relations = (("__lt__", "__le__"), ("__le__", "__lt__"), ("__gt__", "__ge__"), ("__ge__", "__gt__"))
+
+
+def _defines(T: type, name: str) -> bool:
+    """Whether T, or a base class other than object, defines name as something callable."""
+    for klass in T.__mro__[:-1]:
+        if name in vars(klass):
+            return callable(vars(klass)[name])
+    return False
+
+
+def mutants_for(T: type) -> typing.List[Mutant]:
+    """The default mutants of the special methods that T defines."""
+    result = []
+    for operator_name in _binary_operators:
+        name = f"__{operator_name}__"
+        if _defines(T, name):
+            result.append(Mutant(name, "off_by_one", None))
+            result.append(Mutant(name, "swap_args", None))
+        if _defines(T, f"__i{operator_name}__") and _defines(T, name):
+            result.append(Mutant(f"__i{operator_name}__", "out_of_place", None))
+    for name, other in _swapped_relations:
+        if _defines(T, name) and _defines(T, other):
+            result.append(Mutant(name, "swap", other))
+    for name in ("__eq__", "__ne__", "__contains__"):
+        if _defines(T, name):
+            result.append(Mutant(name, "negate", None))
+    for name in ("__neg__", "__abs__", "__invert__"):
+        if _defines(T, name):
+            result.append(Mutant(name, "return_self", None))
+    if _defines(T, "__len__"):
+        result.append(Mutant("__len__", "off_by_one", None))
+    if _defines(T, "__hash__"):
+        result.append(Mutant("__hash__", "constant", None))
+    return result
+
+
+def _test_number(test: unittest.TestCase) -> str:
+    match = re.match(r"test_generic_(\d+)", test._testMethodName)
+    return match.group(1) if match else test._testMethodName
+
+
+def _failing_tests(test_class: type) -> typing.Set[str]:
+    # Hypothesis fails a test called on a second instance of its test class in the same thread,
+    # with HealthCheck.differing_executors, and each worker runs the test class once per mutant,
+    # so each run is made in a new thread.
+    result = unittest.TestResult()
+    suite = unittest.defaultTestLoader.loadTestsFromTestCase(test_class)
+    runner = threading.Thread(target=suite.run, args=(result,), name="generic_testing.mutation")
+    runner.start()
+    runner.join()
+    return {_test_number(test) for test, _ in result.failures + result.errors}
+
+
+def _load_profile(max_examples: int) -> None:
+    # Failures against mutants must not be saved to the example database, nor shrunk.
+    # Tests take the settings in force when they are defined, so this only applies to a test class
+    # first imported by the worker to run it, not to one imported with the main module of a spawned worker.
+    settings.register_profile(
+        "generic_testing.mutation",
+        database=None,
+        max_examples=max_examples,
+        phases=[Phase.explicit, Phase.generate],
+    )
+    settings.load_profile("generic_testing.mutation")
+
+
+def _run_mutant(test_class: type, T: type, mutant: Mutant) -> typing.Set[str]:
+    """The tests of test_class that fail with the mutant installed on T, or with T itself if mutant is None."""
+    if mutant is None:
+        return _failing_tests(test_class)
+    original_in_T = mutant.method in vars(T)
+    original_method = vars(T).get(mutant.method)
+    setattr(T, mutant.method, _mutations[mutant.kind](getattr(T, mutant.method), mutant))
+    try:
+        return _failing_tests(test_class)
+    finally:
+        if original_in_T:
+            setattr(T, mutant.method, original_method)
+        else:
+            delattr(T, mutant.method)
+
+
+def run_mutants(
+    test_class: type,
+    T: type,
+    mutants: typing.Iterable[Mutant] = None,
+    *,
+    max_examples: int = 20,
+    max_workers: int = None,
+) -> typing.List[MutantResult]:
+    """Run test_class against each mutant of T, by default mutants_for(T), in a process pool.
+
+    Each hypothesis test runs at most max_examples examples, as most mutants are killed within a few.
+    The results are in the order of the mutants.
+    """
+    mutants = mutants_for(T) if mutants is None else list(mutants)
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers=max_workers or os.cpu_count(),
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_load_profile,
+        initargs=(max_examples,),
+    ) as executor:
+        baseline = executor.submit(_run_mutant, test_class, T, None)
+        futures = [executor.submit(_run_mutant, test_class, T, mutant) for mutant in mutants]
+        original_failures = baseline.result()
+        return [
+            MutantResult(mutant, tuple(sorted(future.result() - original_failures)))
+            for mutant, future in zip(mutants, futures)
+        ]
+
+
+def mutation_report(results: typing.Iterable[MutantResult]) -> str:
+    """The results as JSON lines, followed by a line giving the mutation score, the fraction of mutants killed."""
+    results = list(results)
+    lines = [
+        json.dumps(dict(method=r.mutant.method, kind=r.mutant.kind, other=r.mutant.other, killed_by=list(r.killed_by)))
+        for r in results
+    ]
+    killed = sum(1 for r in results if r.killed_by)
+    lines.append(json.dumps(dict(mutants=len(results), killed=killed, score=killed / len(results) if results else None)))
+    return "".join(line + "\n" for line in lines)
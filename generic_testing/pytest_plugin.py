@@ -0,0 +1,127 @@
+# Copyright 2021 Steve Palmer
+
+"""A pytest plugin for running GenericTests, in particular under pytest-xdist.
+
+Enable it with "-p generic_testing.pytest_plugin", or pytest_plugins = ["generic_testing.pytest_plugin"] in a conftest.
+
+Each generic test is marked generic(number=N), with N its test number, so "-m 'generic(number=2200)'" selects one test,
+and the --generic option selects ranges of test numbers, such as "--generic 2200-2299,2900".
+
+Each generic test is also marked xdist_group with its test class, so that the tests of a class run in one worker,
+and the class, its strategies and its class level values, such as zero and one, are only built in the workers
+that need them. xdist only honours the xdist_group marks with "--dist loadgroup", which must be given with "-n":
+    pytest -p generic_testing.pytest_plugin -n 4 --dist loadgroup
+Under any other xdist distribution mode, the plugin warns that the tests of a class may be spread over the workers.
+
+The duration of each test is kept in the pytest cache, and the generic test classes are ordered longest first,
+as xdist hands the groups to workers in order, so the longest classes do not start last.
+Classes without a history are taken to last as long as the mean of the others.
+Other tests keep their place in the collection, and the generic tests are only reordered among themselves.
+"""
+
+import collections
+import re
+import typing
+
+import pytest
+
+from .core import GenericTests
+
+
+_durations_key = "generic_testing/durations"
+_test_number_pattern = re.compile(r"test_generic_(\d+)")
+
+
+def parse_ranges(text: str) -> typing.List[typing.Tuple[int, int]]:
+    """The inclusive (first, last) ranges of test numbers in text, such as "2200-2299,2900"."""
+    result = []
+    for part in text.split(","):
+        first, _, last = part.strip().partition("-")
+        result.append((int(first), int(last or first)))
+    return result
+
+
+def balanced_order(groups: typing.Mapping[str, typing.Sequence[str]], durations: typing.Mapping[str, float]) -> typing.List[str]:
+    """The group names, longest total duration first, where each group is a sequence of test ids.
+
+    A test without a duration is taken to last as long as the mean of those with one.
+    Groups of equal duration keep their order.
+    """
+    known = [durations[test] for tests in groups.values() for test in tests if test in durations]
+    default = sum(known) / len(known) if known else 0.0
+    totals = {group: sum(durations.get(test, default) for test in tests) for group, tests in groups.items()}
+    return sorted(groups, key=lambda group: -totals[group])
+
+
+def _test_number(item) -> typing.Optional[int]:
+    match = _test_number_pattern.match(getattr(item, "originalname", None) or item.name)
+    if match is None or not isinstance(getattr(item, "cls", None), type) or not issubclass(item.cls, GenericTests):
+        return None
+    return int(match.group(1))
+
+
+def pytest_addoption(parser) -> None:
+    group = parser.getgroup("generic_testing")
+    group.addoption(
+        "--generic", metavar="RANGES", default=None, help="only run the generic tests numbered in RANGES, such as 2200-2299,2900"
+    )
+
+
+def pytest_configure(config) -> None:
+    config.addinivalue_line("markers", "generic(number): a generic test, and its test number")
+    config.addinivalue_line("markers", "xdist_group(name): run the tests of the group in one xdist worker")
+    if not hasattr(config, "workerinput"):
+        config.pluginmanager.register(_Durations(config), "generic_testing_durations")
+        if getattr(config.option, "dist", "no") not in ("no", "loadgroup"):
+            config.issue_config_time_warning(
+                pytest.PytestConfigWarning(
+                    "generic_testing groups the tests of each class with xdist_group, "
+                    "which xdist only honours with --dist loadgroup"
+                ),
+                stacklevel=2,
+            )
+
+
+@pytest.hookimpl(tryfirst=True)  # mark the tests before "-m" selects them
+def pytest_collection_modifyitems(session, config, items) -> None:
+    ranges = parse_ranges(config.getoption("generic")) if config.getoption("generic") else None
+    selected, deselected = [], []
+    groups = collections.OrderedDict()  # the selected generic tests, by test class
+    for item in items:
+        number = _test_number(item)
+        if number is not None:
+            item.add_marker(pytest.mark.generic(number=number))
+            item.add_marker(pytest.mark.xdist_group(name=item.parent.nodeid))
+        if ranges is None or (number is not None and any(first <= number <= last for first, last in ranges)):
+            selected.append((number is not None, item))
+            if number is not None:
+                groups.setdefault(item.parent.nodeid, []).append(item)
+        else:
+            deselected.append(item)
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+    durations = config.cache.get(_durations_key, dict()) if config.cache is not None else dict()
+    order = balanced_order(
+        collections.OrderedDict((group, [item.nodeid for item in group_items]) for group, group_items in groups.items()),
+        durations,
+    )
+    # The generic tests take the places of the generic tests in the collection, in the balanced order
+    generic = iter([item for group in order for item in groups[group]])
+    items[:] = [next(generic) if is_generic else item for is_generic, item in selected]
+
+
+class _Durations:
+    """Keeps the duration of each test run, in the controller under xdist, which logs the reports of the workers."""
+
+    def __init__(self, config) -> None:
+        self.config = config
+        self.durations = collections.OrderedDict()
+
+    def pytest_runtest_logreport(self, report) -> None:
+        self.durations[report.nodeid] = self.durations.get(report.nodeid, 0.0) + report.duration
+
+    def pytest_sessionfinish(self, session) -> None:
+        if self.config.cache is not None and self.durations:
+            durations = self.config.cache.get(_durations_key, dict())
+            durations.update(self.durations)
+            self.config.cache.set(_durations_key, durations)
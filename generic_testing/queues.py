@@ -0,0 +1,108 @@
+# Copyright 2021 Steve Palmer
+
+"""A library of generic tests of priority queues, such as heapq heaps and queue.PriorityQueue."""
+
+import heapq
+import queue
+
+from .core import GenericTests, ClassUnderTest
+from .collections_abc import ElementT
+from .scaling import ScalingMixinTests
+
+
+__all__ = ("HeapTests", "PriorityQueueTests")
+
+
+class HeapTests(ScalingMixinTests, GenericTests):
+    """Tests of a priority queue, by default a list kept in heap order by the heapq functions.
+
+    For other priority queues, override heap_new, heap_push, heap_pop, heap_peek and heap_len.
+    The least element is peeked in constant time, and an element pushed and popped in logarithmic time,
+    which is timed when scaling_timed.
+    """
+
+    def heap_new(self) -> ClassUnderTest:
+        """A new empty priority queue."""
+        return list()
+
+    def heap_push(self, a: ClassUnderTest, b: ElementT) -> None:
+        heapq.heappush(a, b)
+
+    def heap_pop(self, a: ClassUnderTest) -> ElementT:
+        return heapq.heappop(a)
+
+    def heap_peek(self, a: ClassUnderTest) -> ElementT:
+        return a[0]
+
+    def heap_len(self, a: ClassUnderTest) -> int:
+        return len(a)
+
+    def heap_pop_all(self, a: ClassUnderTest) -> list:
+        """Pop every element of a, in the order popped."""
+        result = []
+        while self.heap_len(a) > 0:
+            result.append(self.heap_pop(a))
+        return result
+
+    def scaling_instance(self, n: int) -> ClassUnderTest:
+        result = self.heap_new()
+        for i in range(n):
+            self.heap_push(result, self.scaling_element(i))
+        return result
+
+    def test_generic_2740_pop_order_is_sorted(self, a: ClassUnderTest) -> None:
+        """pop(a) <= pop(a) <= ..."""
+        a_len = self.heap_len(a)
+        popped = self.heap_pop_all(a)
+        self.assertEqual(len(popped), a_len)
+        for x, y in zip(popped, popped[1:]):
+            self.assertFalse(y < x)
+
+    def test_generic_2741_push_definition(self, a: ClassUnderTest, b: ElementT) -> None:
+        """push(a, b); [pop(a), ...] == sorted(a₀ + [b])"""
+        elements = self.heap_pop_all(a) + [b]
+        for x in reversed(elements):
+            self.heap_push(a, x)
+        self.assertEqual(self.heap_pop_all(a), sorted(elements))
+
+    def test_generic_2742_peek_is_next_pop(self, a: ClassUnderTest) -> None:
+        """|a| > 0 ⇒ peek(a) == pop(a)"""
+        a_len = self.heap_len(a)
+        if a_len > 0:
+            a_peek = self.heap_peek(a)
+            self.assertEqual(self.heap_len(a), a_len)
+            self.assertEqual(self.heap_pop(a), a_peek)
+            self.assertEqual(self.heap_len(a), a_len - 1)
+
+    def test_generic_2743_peek_is_constant_time(self) -> None:
+        """time(peek) ∈ O(1)"""
+        self.assertScalesConstantly(lambda a, x: self.heap_peek(a), "peek is slower than constant")
+
+    def test_generic_2744_push_and_pop_are_logarithmic(self) -> None:
+        """time(push; pop) ∈ O(log(|a|))"""
+
+        def push_and_pop(a, x):
+            self.heap_push(a, x)
+            self.heap_pop(a)
+
+        self.assertScalesLogarithmically(push_and_pop, "push and pop are slower than logarithmic")
+
+
+class PriorityQueueTests(HeapTests):
+    """Tests of queue.PriorityQueue class properties."""
+
+    def heap_new(self) -> ClassUnderTest:
+        return queue.PriorityQueue()
+
+    def heap_push(self, a: ClassUnderTest, b: ElementT) -> None:
+        a.put_nowait(b)
+
+    def heap_pop(self, a: ClassUnderTest) -> ElementT:
+        return a.get_nowait()
+
+    def heap_peek(self, a: ClassUnderTest) -> ElementT:
+        with a.mutex:
+            return a.queue[0]
+
+    def heap_len(self, a: ClassUnderTest) -> int:
+        return a.qsize()
@@ -0,0 +1,233 @@
+# Copyright 2021 Steve Palmer
+
+"""Machine readable reports of a test run, written as each test finishes.
+
+The StreamingTestResult appends one JSON line per test to a file, as soon as the test stops,
+with its number, class, status, duration, and the statistics of its hypothesis examples:
+    examples: the number of examples run, from the example database and generated,
+    rejected: the number of those examples rejected, by assume or by a filter,
+    shrinks: the number of successful shrinks of a failing example,
+    falsifying: the falsifying example that hypothesis reports, or None.
+The statistics come from hypothesis internals that are not part of its public API, and differ between versions,
+so where they are not available, examples, rejected and shrinks are None, and where hypothesis does not attach
+its report to the exception as notes, falsifying is None.
+Each line is written by a single append to the file, so results in threads and processes,
+such as the workers of run_test_classes, can stream to the same file without interleaving.
+
+write_junit converts the JSON lines file to JUnit XML, reading it twice rather than keeping the run in memory.
+"""
+
+import collections
+import contextlib
+import json
+import os
+import re
+import time
+import typing
+import unittest
+from xml.sax.saxutils import quoteattr, escape
+
+try:
+    from hypothesis.statistics import collector
+except ImportError:  # not in every version of hypothesis
+    collector = None
+
+
+__all__ = ("TestReport", "StreamingTestResult", "StreamingTestRunner", "write_junit")
+
+
+TestReport = collections.namedtuple(
+    "TestReport",
+    ["number", "test", "name", "status", "seconds", "examples", "rejected", "shrinks", "falsifying", "message"],
+)
+# number: int = test number of a generic test, else None
+# test: str = module and qualified name of the test class
+# name: str = name of the test method
+# status: str = "pass", "fail", "error", "skip", "expected_failure" or "unexpected_success"
+# seconds: float = time taken by the test
+# examples: int = number of hypothesis examples run, summed over each call of a given test, such as each tier,
+#     else None if the statistics are not available
+# rejected: int = number of those examples rejected, by assume or by a filter, else None
+# shrinks: int = number of successful shrinks of failing examples, else None
+# falsifying: str = the falsifying example reported by hypothesis, else None
+# message: str = the exception type and first line of a failure or error, or the reason for a skip, else None
+
+
+def _test_number(name: str) -> typing.Optional[int]:
+    match = re.match(r"test_generic_(\d+)", name)
+    return int(match.group(1)) if match else None
+
+
+def _falsifying(err) -> typing.Optional[str]:
+    notes = getattr(err[1], "__notes__", None)
+    if not isinstance(notes, (list, tuple)):  # earlier versions of hypothesis print the example instead
+        return None
+    # Earlier versions of hypothesis say "Falsifying example", later versions "Failing test case"
+    falsifying = [
+        note for note in notes if isinstance(note, str) and note.startswith(("Falsifying", "Failing test case"))
+    ]
+    return "\n".join(falsifying) if falsifying else None
+
+
+class StreamingTestResult(unittest.TextTestResult):
+    """A TextTestResult that also appends a TestReport, as a JSON line, to jsonl_path as each test stops."""
+
+    _severity = ("pass", "expected_failure", "skip", "unexpected_success", "fail", "error")
+
+    def __init__(self, stream, descriptions, verbosity, *, jsonl_path: str, **kwargs) -> None:
+        super().__init__(stream, descriptions, verbosity, **kwargs)
+        self.jsonl_path = jsonl_path
+
+    def _note_statistics(self, statistics) -> None:
+        try:
+            for phase in ("reuse", "generate"):
+                for case in statistics.get(f"{phase}-phase", dict()).get("test-cases", ()):
+                    self._examples += 1
+                    if case.get("status") in ("invalid", "overrun"):
+                        self._rejected += 1
+            self._shrinks += statistics.get("shrink-phase", dict()).get("shrinks-successful", 0)
+        except (AttributeError, TypeError):  # statistics in a form this does not know
+            self._examples = self._rejected = self._shrinks = None
+
+    def _set_status(self, status: str, message: str = None, err=None) -> None:
+        # A test with subtests, such as a tiered test, takes the most severe status of them
+        if self._severity.index(status) >= self._severity.index(self._status):
+            self._status = status
+            if message is not None:
+                self._message = message
+            if err is not None:
+                self._falsifying = _falsifying(err) or self._falsifying
+
+    @staticmethod
+    def _describe(err) -> str:
+        lines = str(err[1]).splitlines()
+        return f"{err[0].__name__}: {lines[0]}" if lines else err[0].__name__
+
+    def startTest(self, test) -> None:
+        self._status = "pass"
+        self._message = None
+        self._falsifying = None
+        if collector is None:
+            self._examples = self._rejected = self._shrinks = None
+            self._collecting = contextlib.nullcontext()
+        else:
+            self._examples = self._rejected = self._shrinks = 0
+            self._collecting = collector.with_value(self._note_statistics)
+        self._collecting.__enter__()
+        self._start = time.perf_counter()
+        super().startTest(test)
+
+    def stopTest(self, test) -> None:
+        super().stopTest(test)
+        seconds = time.perf_counter() - self._start
+        self._collecting.__exit__(None, None, None)
+        name = getattr(test, "_testMethodName", str(test))
+        report = TestReport(
+            _test_number(name),
+            f"{type(test).__module__}.{type(test).__qualname__}",
+            name,
+            self._status,
+            seconds,
+            self._examples,
+            self._rejected,
+            self._shrinks,
+            self._falsifying,
+            self._message,
+        )
+        line = (json.dumps(report._asdict()) + "\n").encode()
+        fd = os.open(self.jsonl_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o666)
+        try:
+            os.write(fd, line)
+        finally:
+            os.close(fd)
+
+    def addFailure(self, test, err) -> None:
+        super().addFailure(test, err)
+        self._set_status("fail", self._describe(err), err)
+
+    def addError(self, test, err) -> None:
+        super().addError(test, err)
+        self._set_status("error", self._describe(err), err)
+
+    def addSubTest(self, test, subtest, err) -> None:
+        super().addSubTest(test, subtest, err)
+        if err is not None:
+            status = "fail" if issubclass(err[0], test.failureException) else "error"
+            self._set_status(status, self._describe(err), err)
+
+    def addSkip(self, test, reason) -> None:
+        super().addSkip(test, reason)
+        self._set_status("skip", reason)
+
+    def addExpectedFailure(self, test, err) -> None:
+        super().addExpectedFailure(test, err)
+        self._set_status("expected_failure")
+
+    def addUnexpectedSuccess(self, test) -> None:
+        super().addUnexpectedSuccess(test)
+        self._set_status("unexpected_success")
+
+
+class StreamingTestRunner(unittest.TextTestRunner):
+    """A TextTestRunner that streams a TestReport of each test to jsonl_path, and writes JUnit XML to junit_path."""
+
+    def __init__(self, jsonl_path: str, junit_path: str = None, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.jsonl_path = jsonl_path
+        self.junit_path = junit_path
+
+    def _makeResult(self) -> StreamingTestResult:
+        return StreamingTestResult(self.stream, self.descriptions, self.verbosity, jsonl_path=self.jsonl_path)
+
+    def run(self, test) -> unittest.TestResult:
+        open(self.jsonl_path, "w").close()
+        result = super().run(test)
+        if self.junit_path is not None:
+            write_junit(self.jsonl_path, self.junit_path)
+        return result
+
+
+def _reports(jsonl_path: str) -> typing.Iterator[TestReport]:
+    with open(jsonl_path) as f:
+        for line in f:
+            yield TestReport(**json.loads(line))
+
+
+def write_junit(jsonl_path: str, junit_path: str, name: str = "generic_testing") -> None:
+    """Write the TestReports streamed to jsonl_path as a JUnit XML testsuite."""
+    totals = collections.Counter()
+    seconds = 0.0
+    for report in _reports(jsonl_path):
+        totals["tests"] += 1
+        totals[report.status] += 1
+        seconds += report.seconds
+    with open(junit_path, "w") as f:
+        f.write('<?xml version="1.0" encoding="utf-8"?>\n')
+        f.write(
+            f"<testsuite name={quoteattr(name)} tests=\"{totals['tests']}\" "
+            f"failures=\"{totals['fail'] + totals['unexpected_success']}\" errors=\"{totals['error']}\" "
+            f"skipped=\"{totals['skip']}\" time=\"{seconds:.6f}\">\n"
+        )
+        for report in _reports(jsonl_path):
+            f.write(
+                f"  <testcase classname={quoteattr(report.test)} name={quoteattr(report.name)} "
+                f"time=\"{report.seconds:.6f}\">\n"
+            )
+            statistics = dict(examples=report.examples, rejected=report.rejected, shrinks=report.shrinks)
+            f.write("    <properties>\n")
+            for key, value in statistics.items():
+                if value is None:
+                    continue
+                f.write(f"      <property name=\"{key}\" value=\"{value}\"/>\n")
+            f.write("    </properties>\n")
+            message = quoteattr(report.message or "")
+            if report.status == "fail":
+                f.write(f"    <failure message={message}>{escape(report.falsifying or '')}</failure>\n")
+            elif report.status == "unexpected_success":
+                f.write('    <failure message="unexpected success"/>\n')
+            elif report.status == "error":
+                f.write(f"    <error message={message}>{escape(report.falsifying or '')}</error>\n")
+            elif report.status == "skip":
+                f.write(f"    <skipped message={message}/>\n")
+            f.write("  </testcase>\n")
+        f.write("</testsuite>\n")
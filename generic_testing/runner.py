@@ -0,0 +1,169 @@
+# Copyright 2021 Steve Palmer
+
+"""Run independent GenericTests classes concurrently.
+
+Each test class is run by a worker of an executor, chosen by the backend:
+    "thread": a thread of this interpreter, which only runs in parallel on a free-threaded build,
+    "subinterpreter": a subinterpreter with its own GIL, from Python 3.14,
+    "process": a separate process, which pays for pickling and importing in every worker,
+    "auto": threads on a free-threaded build, else subinterpreters where supported, else processes.
+Except in threads, the test classes are passed to the workers by pickling,
+so they must be defined at the top level of an importable module.
+
+Threads share the module level state of the library, such as the defaultGenericTestLoader registrations
+and the isclose default tolerances, so a test class that changes it would change it under the others.
+The thread backend confirms that the shared_state is unchanged by the run.
+
+Given a cache_directory, the tests that passed are recorded against the fingerprint of their test class,
+and are not run again while the fingerprint and library version are unchanged,
+except for a random sample_fraction of them, in case the fingerprint misses a change.
+
+Given a jsonl_path, every worker streams the TestReport of each test to it as the test finishes,
+and given a junit_path, the reports are written as JUnit XML at the end of the run.
+"""
+
+import collections
+import concurrent.futures
+import io
+import os
+import random
+import sys
+import time
+import typing
+import unittest
+
+from . import version as library_version
+from .incremental import ResultCache, fingerprint
+from .isclose import isclose
+from .loader import defaultGenericTestLoader
+from .reporting import StreamingTestResult, write_junit
+
+
+__all__ = ("ClassResult", "SharedState", "shared_state", "default_backend", "run_test_classes")
+
+
+ClassResult = collections.namedtuple(
+    "ClassResult", ["test", "run", "failures", "errors", "skipped", "seconds", "passed", "cached"]
+)
+# test: str = module and qualified name of the test class
+# run: int = number of tests run
+# failures: list of (str, str) = test id and traceback of each failure
+# errors: list of (str, str) = test id and traceback of each error
+# skipped: int = number of tests skipped
+# seconds: float = time taken to run the test class, in its worker
+# passed: tuple of str = names of the test methods that passed
+# cached: int = number of tests not run, as they passed before with the same fingerprint
+
+
+SharedState = collections.namedtuple("SharedState", ["loader_registrations", "default_rel_tol", "default_abs_tol"])
+# loader_registrations: tuple = the (type, tests) registered with the defaultGenericTestLoader, in order
+# default_rel_tol: float = isclose.default_rel_tol
+# default_abs_tol: float = isclose.default_abs_tol
+
+
+def shared_state() -> SharedState:
+    """The module level state shared by all the test classes run in one interpreter."""
+    return SharedState(
+        tuple(defaultGenericTestLoader._superclass_mapping.items()), isclose.default_rel_tol, isclose.default_abs_tol
+    )
+
+
+def default_backend() -> str:
+    """The backend chosen by "auto"."""
+    if not getattr(sys, "_is_gil_enabled", lambda: True)():
+        return "thread"
+    if hasattr(concurrent.futures, "InterpreterPoolExecutor"):
+        return "subinterpreter"
+    return "process"
+
+
+def _test_id(test_class: type) -> str:
+    return f"{test_class.__module__}.{test_class.__qualname__}"
+
+
+def _run_test_class(
+    test_class: type, skip: typing.FrozenSet[str] = frozenset(), jsonl_path: str = None
+) -> ClassResult:
+    """Run the tests of test_class, except those named in skip, streaming their reports to any jsonl_path."""
+    if jsonl_path is None:
+        result = unittest.TestResult()
+    else:
+        result = StreamingTestResult(io.StringIO(), False, 0, jsonl_path=jsonl_path)
+    start = time.perf_counter()
+    all_tests = list(unittest.defaultTestLoader.loadTestsFromTestCase(test_class))
+    tests = [test for test in all_tests if test._testMethodName not in skip]
+    unittest.TestSuite(tests).run(result)
+    not_passed = {test._testMethodName for test, _ in result.failures + result.errors + result.skipped}
+    return ClassResult(
+        _test_id(test_class),
+        result.testsRun,
+        [(str(test), traceback) for test, traceback in result.failures],
+        [(str(test), traceback) for test, traceback in result.errors],
+        len(result.skipped),
+        time.perf_counter() - start,
+        tuple(test._testMethodName for test in tests if test._testMethodName not in not_passed),
+        len(all_tests) - len(tests),
+    )
+
+
+def run_test_classes(
+    test_classes: typing.Iterable[type],
+    *,
+    backend: str = "auto",
+    max_workers: int = None,
+    cache_directory: str = None,
+    sample_fraction: float = 0.05,
+    jsonl_path: str = None,
+    junit_path: str = None,
+) -> typing.List[ClassResult]:
+    """Run each of the test_classes in a worker of the backend, and their results, in the same order.
+
+    Given a cache_directory, the tests that passed with the same fingerprint are skipped,
+    except for a random sample_fraction of them.
+    Given a jsonl_path, the report of each test is streamed to it, and given a junit_path, written as JUnit XML.
+    """
+    test_classes = list(test_classes)
+    if backend == "auto":
+        backend = default_backend()
+    if backend == "thread":
+        executor_type = concurrent.futures.ThreadPoolExecutor
+    elif backend == "subinterpreter":
+        executor_type = getattr(concurrent.futures, "InterpreterPoolExecutor", None)
+        if executor_type is None:
+            raise ValueError("subinterpreter backend needs Python 3.14 or later")
+    elif backend == "process":
+        executor_type = concurrent.futures.ProcessPoolExecutor
+    else:
+        raise ValueError(f"unknown backend {backend!r}")
+    skips = [frozenset()] * len(test_classes)
+    if cache_directory is not None:
+        cache = ResultCache(cache_directory, library_version)
+        fingerprints = [fingerprint(test_class) for test_class in test_classes]
+        skips = [
+            frozenset(name for name in cache.passed(_test_id(test_class), f) if random.random() >= sample_fraction)
+            for test_class, f in zip(test_classes, fingerprints)
+        ]
+    if junit_path is not None and jsonl_path is None:
+        raise ValueError("junit_path needs a jsonl_path to stream the reports to")
+    if jsonl_path is not None:
+        open(jsonl_path, "w").close()
+    before = shared_state()
+    with executor_type(max_workers=max_workers or os.cpu_count()) as executor:
+        results = list(executor.map(_run_test_class, test_classes, skips, [jsonl_path] * len(test_classes)))
+    if junit_path is not None:
+        write_junit(jsonl_path, junit_path)
+    if cache_directory is not None:
+        cache.update(
+            (
+                result.test,
+                f,
+                result.passed,
+                [failure.split(" ", 1)[0] for failure, _ in result.failures + result.errors],
+            )
+            for result, f in zip(results, fingerprints)
+        )
+    if backend == "thread":
+        changed = [field for field, was, now in zip(SharedState._fields, before, shared_state()) if was != now]
+        if changed:
+            raise RuntimeError(f"test classes run in threads changed the shared {', '.join(changed)}")
+    return results
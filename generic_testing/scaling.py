@@ -0,0 +1,78 @@
+# Copyright 2021 Steve Palmer
+
+"""A library of discrete tests of how the cost of operations grows with the size of the ClassUnderTest.
+
+The tests compare wall clock times, which vary with the load of the machine, so they are skipped
+unless the test class sets scaling_timed, which by default is set by the GENERIC_TESTING_SCALING environment variable:
+    GENERIC_TESTING_SCALING=1 python -m unittest test_sorted_containers
+"""
+
+import math
+import os
+import random
+import time
+import typing
+
+from .core import ClassUnderTest
+from .collections_abc import ElementT
+
+
+__all__ = ("ScalingMixinTests",)
+
+
+class ScalingMixinTests:
+    """Discrete tests that operations take the time expected of their complexity, as the collection grows.
+
+    Each operation is timed scaling_operations times on a collection of each of the scaling_sizes,
+    taking the least of scaling_repeats rounds, so an amortised cost is measured.
+    The time on the largest collection must be within scaling_tolerance × the growth of the complexity
+    from the smallest, so within scaling_tolerance for constant time,
+    and scaling_tolerance × log(largest) / log(smallest) for logarithmic time,
+    well short of the ratio of the sizes.
+    The collections are made by scaling_instance, which by default builds one like empty,
+    from the scaling_element of each index.
+    The tests are skipped unless scaling_timed.
+    """
+
+    scaling_timed = os.environ.get("GENERIC_TESTING_SCALING", "") not in ("", "0")
+    scaling_sizes = (1_000, 100_000)
+    scaling_operations = 1000
+    scaling_repeats = 5
+    scaling_tolerance = 4.0
+
+    def scaling_element(self, i: int) -> ElementT:
+        """The i-th smallest element of a collection built by scaling_instance."""
+        return i
+
+    def scaling_instance(self, n: int) -> ClassUnderTest:
+        """A collection of n elements."""
+        return type(self.empty)(self.scaling_element(i) for i in range(n))
+
+    def _time_operation(self, n: int, operation: typing.Callable) -> float:
+        a = self.scaling_instance(n)
+        rnd = random.Random(n)
+        result = float("inf")
+        for _ in range(self.scaling_repeats):
+            elements = [self.scaling_element(rnd.randrange(n)) for _ in range(self.scaling_operations)]
+            start = time.perf_counter()
+            for element in elements:
+                operation(a, element)
+            result = min(result, time.perf_counter() - start)
+        return result
+
+    def assertScales(self, operation: typing.Callable, complexity: typing.Callable, msg: str = None) -> None:
+        """Confirm that operation(a, element) takes time in O(complexity(len(a))), if scaling_timed."""
+        if not self.scaling_timed:
+            self.skipTest("Wall clock scaling tests only run with scaling_timed, or GENERIC_TESTING_SCALING=1")
+        smallest, largest = min(self.scaling_sizes), max(self.scaling_sizes)
+        ratio = self._time_operation(largest, operation) / self._time_operation(smallest, operation)
+        limit = self.scaling_tolerance * complexity(largest) / complexity(smallest)
+        self.assertLessEqual(ratio, limit, msg)
+
+    def assertScalesConstantly(self, operation: typing.Callable, msg: str = None) -> None:
+        """Confirm that operation(a, element) takes amortised constant time."""
+        self.assertScales(operation, lambda n: 1.0, msg)
+
+    def assertScalesLogarithmically(self, operation: typing.Callable, msg: str = None) -> None:
+        """Confirm that operation(a, element) takes time logarithmic in len(a)."""
+        self.assertScales(operation, math.log, msg)
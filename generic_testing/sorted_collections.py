@@ -0,0 +1,129 @@
+# Copyright 2021 Steve Palmer
+
+"""A library of generic tests of sorted collections, such as those of the sortedcontainers package.
+
+A sorted collection iterates in sorted order, and finds elements by bisection,
+so bisect_left, bisect_right and irange must agree with a linear scan of the iteration.
+It is also expected to add, find and index an element in time logarithmic in its size,
+which the ScalingMixinTests check by timing the operations on collections of increasing size,
+when their wall clock tests are enabled by scaling_timed.
+"""
+
+from .core import ClassUnderTest
+from .collections_abc import ElementT, MutableMappingTests, MutableSetTests, SequenceTests
+from .scaling import ScalingMixinTests
+
+
+__all__ = (
+    "SortedMixinTests",
+    "SortedScalingMixinTests",
+    "SortedSequenceTests",
+    "SortedSetTests",
+    "sortedcontainersSortedSetTests",
+    "SortedMappingTests",
+)
+
+
+class SortedMixinTests:
+    """Tests of the order of a sorted collection, and of its bisection methods.
+
+    Elements are added by sorted_insert and removed by sorted_remove,
+    which are the add and discard methods by default.
+    """
+
+    def sorted_insert(self, a: ClassUnderTest, b: ElementT) -> None:
+        a.add(b)
+
+    def sorted_remove(self, a: ClassUnderTest, b: ElementT) -> None:
+        a.discard(b)
+
+    def assertSorted(self, a: ClassUnderTest, msg: str = None) -> None:
+        """Confirm that a iterates in sorted order."""
+        elements = list(a)
+        for x, y in zip(elements, elements[1:]):
+            self.assertFalse(y < x, msg)
+
+    def test_generic_2720_iteration_is_sorted(self, a: ClassUnderTest) -> None:
+        """a[i] <= a[i+1]"""
+        self.assertSorted(a)
+
+    def test_generic_2721_bisect_left_definition(self, a: ClassUnderTest, b: ElementT) -> None:
+        """a.bisect_left(b) == |{x ∈ a: x < b}|"""
+        self.assertEqual(a.bisect_left(b), sum(1 for x in a if x < b))
+
+    def test_generic_2722_bisect_right_definition(self, a: ClassUnderTest, b: ElementT) -> None:
+        """a.bisect_right(b) == |{x ∈ a: x <= b}|"""
+        self.assertEqual(a.bisect_right(b), sum(1 for x in a if not b < x))
+
+    def test_generic_2723_irange_definition(self, a: ClassUnderTest, b: ElementT, c: ElementT) -> None:
+        """list(a.irange(b, c)) == [x ∈ a: b <= x <= c]"""
+        self.assertEqual(list(a.irange(b, c)), [x for x in a if not x < b and not c < x])
+
+    def test_generic_2724_insert_keeps_order(self, a: ClassUnderTest, b: ElementT) -> None:
+        """sorted_insert(a, b); b ∈ a and a is sorted"""
+        a_len = len(a)
+        self.sorted_insert(a, b)
+        self.assertIn(b, a)
+        self.assertIn(len(a) - a_len, (0, 1))
+        self.assertSorted(a, "sorted_insert breaks the order")
+
+    def test_generic_2725_remove_keeps_order(self, a: ClassUnderTest, b: ElementT) -> None:
+        """sorted_remove(a, b); |a| == |a₀| - (b ∈ a₀) and a is sorted"""
+        a_len = len(a)
+        b_in_a = b in a
+        self.sorted_remove(a, b)
+        self.assertEqual(len(a), a_len - b_in_a)
+        self.assertSorted(a, "sorted_remove breaks the order")
+
+
+class SortedScalingMixinTests(SortedMixinTests, ScalingMixinTests):
+    """Discrete tests that sorted_insert, in and index take time logarithmic in the size of the collection."""
+
+    def test_generic_2730_insert_is_logarithmic(self) -> None:
+        """time(sorted_insert) ∈ O(log(|a|))"""
+        self.assertScalesLogarithmically(self.sorted_insert, "sorted_insert is slower than logarithmic")
+
+    def test_generic_2731_contains_is_logarithmic(self) -> None:
+        """time(x in a) ∈ O(log(|a|))"""
+        self.assertScalesLogarithmically(lambda a, x: x in a, "in is slower than logarithmic")
+
+    def test_generic_2732_index_is_logarithmic(self) -> None:
+        """time(a.index(x)) ∈ O(log(|a|))"""
+        self.assertScalesLogarithmically(lambda a, x: a.index(x), "index is slower than logarithmic")
+
+
+class SortedSequenceTests(SortedScalingMixinTests, SequenceTests):
+    """Tests of a sorted sequence, such as sortedcontainers.SortedList."""
+
+
+class SortedSetTests(SortedScalingMixinTests, MutableSetTests):
+    """Tests of a sorted set, such as sortedcontainers.SortedSet."""
+
+    def copy(self, a: ClassUnderTest) -> ClassUnderTest:
+        return a.copy()
+
+
+class sortedcontainersSortedSetTests(SortedSetTests):
+    """Tests of sortedcontainers.SortedSet."""
+
+    # sortedcontainers.SortedSet rebuilds its sorted list for each of these
+    inplace_allocation_exempt = ("ior", "iand", "isub", "ixor")
+
+
+class SortedMappingTests(SortedScalingMixinTests, MutableMappingTests):
+    """Tests of a mapping sorted by key, such as sortedcontainers.SortedDict.
+
+    Keys are inserted with the value None.
+    """
+
+    def copy(self, a: ClassUnderTest) -> ClassUnderTest:
+        return a.copy()
+
+    def sorted_insert(self, a: ClassUnderTest, b: ElementT) -> None:
+        a.setdefault(b, None)
+
+    def sorted_remove(self, a: ClassUnderTest, b: ElementT) -> None:
+        a.pop(b, None)
+
+    def scaling_instance(self, n: int) -> ClassUnderTest:
+        return type(self.empty)((self.scaling_element(i), None) for i in range(n))
@@ -4,7 +4,10 @@
 """A library for simple timeout flags."""
 
 import asyncio
+import collections
 import datetime
+import heapq
+import itertools
 import math
 import numbers
 import signal
@@ -21,8 +24,8 @@ except ImportError:
     _version = type("_version", (object,), {"Version": lambda self, s: s})()
 
 
-__all__ = ("version", "Timeout")
-version = _version.Version("2.0.0")
+__all__ = ("version", "Timeout", "TickStatistics", "TimeoutGroup")
+version = _version.Version("2.2.0")
 
 
 ClockDeltaT = numbers.Real
@@ -193,74 +196,387 @@ class Timeout:
         """
         return cls(when - datetime.datetime.now(when.tzinfo), clock=clock)
 
-    def wait(self) -> bool:
+    def _wait(self, spin: ClockDeltaT) -> typing.Tuple[bool, float]:
+        """Sleep until timeout, spinning on the clock for the final spin interval, if spin is positive.
+
+        Without spin, the clock is only read before and after a single sleep,
+        so a clock that is not in seconds, or that does not advance, cannot make the wait spin.
+
+        Returns whether the timeout had already expired, and the clock reading when the wait ended.
+        """
+        now = self._clock()
+        remaining = self._finish - now
+        if remaining < 0:
+            warnings.warn("Timeout Overrun", RuntimeWarning)
+        elif math.isinf(remaining):
+            signal.pause()
+        elif spin <= 0:
+            time.sleep(remaining)
+            now = self._clock()
+        else:
+            if remaining > spin:
+                time.sleep(remaining - spin)
+                now = self._clock()
+            finish = self._finish
+            while now < finish:
+                now = self._clock()
+        return remaining < 0, now
+
+    def wait(self, *, spin: ClockDeltaT = 0) -> bool:
         """Sleep until timeout.
+
+        time.sleep typically wakes 50 µs to 1 ms late.  If spin is given,
+        sleep only until spin before the timeout, then spin on the clock for the final interval.
         >>> t = Timeout(1)
         >>> t.wait()
         False
         >>> bool(t)
         True
+        >>> t = Timeout(0.1)
+        >>> t.wait(spin=0.002)
+        False
+        >>> bool(t)
+        True
         """
-        remaining = self._remaining
-        if remaining < 0:
-            warnings.warn("Timeout Overrun", RuntimeWarning)
-        elif math.isinf(remaining):
-            signal.pause()
-        else:
-            time.sleep(remaining)
-        return remaining < 0
+        late, _ = self._wait(spin)
+        return late
 
     def iterator(
         self,
         *,
         do_restart: bool = False,
         do_quick_start: bool = False,
+        spin: ClockDeltaT = 0,
+        statistics: "TickStatistics" = None,
     ) -> typing.Iterator[bool]:
         """
+        Each tick is scheduled from the previous deadline, not from when the tick was delivered,
+        so lateness does not accumulate.  See wait for spin.
+        If statistics is given, the lateness of each tick is recorded there.
         >>> [o for _, o in zip(range(3), Timeout(1).iterator())]
         [False, False, False]
+        >>> stats = TickStatistics()
+        >>> ticks = Timeout(0.001).iterator(do_restart=True, spin=0.0005, statistics=stats)
+        >>> _ = [next(ticks) for _ in range(100)]
+        >>> stats.count
+        100
         """
         if do_restart:
             self.restart()
         if do_quick_start:
             yield bool(self)
         while True:
-            late = self.wait()
+            late, now = self._wait(spin)
+            if statistics is not None:
+                statistics.record(now - self._finish)
             self.recycle()
             yield late
 
     def __iter__(self) -> typing.Iterator[bool]:
         return self.iterator(do_restart=True, do_quick_start=True)
 
-    async def async_wait(self) -> bool:
-        remaining = self._remaining
+    async def _async_wait(self, spin: ClockDeltaT) -> typing.Tuple[bool, float]:
+        now = self._clock()
+        remaining = self._finish - now
         if remaining < 0:
             warnings.warn("Timeout Overrun", RuntimeWarning)
         elif math.isinf(remaining):
             await asyncio.Event().wait()
+        elif spin <= 0:
+            await asyncio.sleep(remaining)
+            now = self._clock()
         else:
-            await asyncio.sleep(self.remaining)
-        return remaining < 0
-
-    async def _aiterator(self, do_quick_start: bool) -> typing.AsyncIterator[bool]:
+            if remaining > spin:
+                await asyncio.sleep(remaining - spin)
+                now = self._clock()
+            finish = self._finish
+            while now < finish:
+                await asyncio.sleep(0)  # yield to other tasks while spinning
+                now = self._clock()
+        return remaining < 0, now
+
+    async def async_wait(self, *, spin: ClockDeltaT = 0) -> bool:
+        late, _ = await self._async_wait(spin)
+        return late
+
+    async def _aiterator(
+        self, do_quick_start: bool, spin: ClockDeltaT, statistics: "TickStatistics"
+    ) -> typing.AsyncIterator[bool]:
         if do_quick_start:
             yield bool(self)
         while True:
-            late = await self.async_wait()
+            late, now = await self._async_wait(spin)
+            if statistics is not None:
+                statistics.record(now - self._finish)
             self.recycle()
             yield late
 
     def aiterator(
-        self, *, do_restart: bool = False, do_quick_start: bool = False
+        self,
+        *,
+        do_restart: bool = False,
+        do_quick_start: bool = False,
+        spin: ClockDeltaT = 0,
+        statistics: "TickStatistics" = None,
     ) -> typing.AsyncIterator[bool]:
         if do_restart:
             self.restart()
-        return self._aiterator(do_quick_start)
+        return self._aiterator(do_quick_start, spin, statistics)
 
     def __aiter__(self) -> typing.AsyncIterator[bool]:
         return self.aiterator(do_restart=True, do_quick_start=True)
 
 
+class TickStatistics:
+    """Lateness statistics for the ticks of a periodic Timeout iteration.
+
+    The lateness of a tick is how long after its deadline it was delivered.
+    The count and maximum cover every tick recorded;
+    percentiles are taken over the most recent window of ticks, to bound the memory used.
+
+    >>> stats = TickStatistics()
+    >>> for lateness in range(1, 101):
+    ...     stats.record(lateness / 1000)
+    >>> stats.count, stats.max, stats.p99
+    (100, 0.1, 0.099)
+    """
+
+    __slots__ = ("_samples", "count", "max")
+
+    def __init__(self, window: int = 100000) -> None:
+        self._samples = collections.deque(maxlen=window)
+        self.count = 0
+        self.max = float("-inf")
+
+    def __repr__(self) -> str:
+        return f"TickStatistics(count={self.count}, max={self.max}, p99={self.p99})"
+
+    def record(self, lateness: ClockDeltaT) -> None:
+        self._samples.append(lateness)
+        self.count += 1
+        if lateness > self.max:
+            self.max = lateness
+
+    def percentile(self, p: float) -> ClockDeltaT:
+        """The nearest-rank p-th percentile of the lateness in the window."""
+        if not self._samples:
+            return float("nan")
+        ordered = sorted(self._samples)
+        rank = max(1, math.ceil(p / 100 * len(ordered)))
+        return ordered[rank - 1]
+
+    @property
+    def p99(self) -> ClockDeltaT:
+        return self.percentile(99)
+
+
+class TimeoutGroup:
+    """A collection of Timeouts ordered by when they expire.
+
+    The Timeouts are held in a heap keyed on their finish time,
+    so adding and cancelling a Timeout costs O(log n), and finding the next to expire costs O(1).
+
+    A Timeout that is recycled while in the group moves later, and is re-keyed when it reaches the top of the heap.
+    A Timeout that is restarted, or has its delay changed, may move earlier,
+    so use the group's restart method, or call update after changing it.
+
+    >>> now = [0.0]
+    >>> clock = lambda: now[0]
+    >>> group = TimeoutGroup(clock=clock)
+    >>> t1, t2, t3 = Timeout(5, clock=clock), Timeout(2, clock=clock), Timeout(9, clock=clock)
+    >>> group.add(t1); group.add(t2); group.add(t3)
+    >>> len(group)
+    3
+    >>> group.next_expiry is t2
+    True
+    >>> group.remaining
+    2.0
+    >>> now[0] = 6.0
+    >>> group.pop_expired() == {t1, t2}
+    True
+    >>> group.next_expiry is t3
+    True
+    >>> group.restart(t3)
+    >>> group.remaining
+    9.0
+    >>> group.cancel(t3)
+    >>> len(group), group.next_expiry
+    (0, None)
+    """
+
+    __slots__ = ("_clock", "_heap", "_entries", "_counter", "_changed")
+    # _clock: Callable[[], float] the clock shared by all the Timeouts in the group.
+    # _heap: List[list] heap of [finish, sequence number, Timeout or None if cancelled] entries.
+    # _entries: Dict[Timeout, list] the live heap entry of each Timeout in the group.
+    # _counter: Iterator[int] sequence numbers, to break ties between equal finish times.
+    # _changed: Optional[asyncio.Event] set when the group changes while async_wait is waiting.
+
+    def __init__(
+        self,
+        timeouts: typing.Iterable[Timeout] = (),
+        *,
+        clock: typing.Callable[[], float] = None,
+    ) -> None:
+        self._clock = clock or time.monotonic
+        self._heap = []
+        self._entries = {}
+        self._counter = itertools.count()
+        self._changed = None
+        for timeout in timeouts:
+            self.add(timeout)
+
+    def __repr__(self) -> str:
+        return f"TimeoutGroup({sorted(self._entries, key=lambda t: t._finish)!r})"
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, timeout: Timeout) -> bool:
+        return timeout in self._entries
+
+    def __iter__(self) -> typing.Iterator[Timeout]:
+        return iter(list(self._entries))
+
+    def _push(self, timeout: Timeout) -> None:
+        entry = [timeout._finish, next(self._counter), timeout]
+        self._entries[timeout] = entry
+        heapq.heappush(self._heap, entry)
+
+    def _tidy(self) -> None:
+        """Ensure the top of the heap is a live entry keyed on its Timeout's current finish time."""
+        heap = self._heap
+        if len(heap) > 2 * len(self._entries) + 16:
+            # Too many cancelled entries, so rebuild the heap from the live ones
+            heap[:] = [entry for entry in heap if entry[2] is not None]
+            heapq.heapify(heap)
+        while heap:
+            finish, _, timeout = heap[0]
+            if timeout is None:
+                heapq.heappop(heap)
+            elif finish != timeout._finish:
+                entry = [timeout._finish, next(self._counter), timeout]
+                self._entries[timeout] = entry
+                heapq.heapreplace(heap, entry)
+            else:
+                break
+
+    def _notify(self) -> None:
+        if self._changed is not None:
+            self._changed.set()
+
+    def add(self, timeout: Timeout) -> None:
+        """Add a Timeout to the group, or re-key it if it is already in the group."""
+        if timeout._clock is not self._clock:
+            raise ValueError("Timeout does not use the same clock as the TimeoutGroup")
+        entry = self._entries.get(timeout)
+        if entry is not None:
+            entry[2] = None
+        self._push(timeout)
+        self._tidy()
+        self._notify()
+
+    def update(self, timeout: Timeout) -> None:
+        """Re-key a Timeout in the group after its finish time has changed."""
+        if timeout not in self._entries:
+            raise KeyError(timeout)
+        self.add(timeout)
+
+    def cancel(self, timeout: Timeout) -> None:
+        """Remove a Timeout from the group, if present."""
+        entry = self._entries.pop(timeout, None)
+        if entry is not None:
+            entry[2] = None
+            self._tidy()
+            self._notify()
+
+    def recycle(self, timeout: Timeout) -> None:
+        """Recycle a Timeout in the group."""
+        timeout.recycle()
+        self.update(timeout)
+
+    def restart(self, timeout: Timeout, start: float = None) -> None:
+        """Restart a Timeout in the group."""
+        timeout.restart(start)
+        self.update(timeout)
+
+    @property
+    def next_expiry(self) -> typing.Optional[Timeout]:
+        """The Timeout that will expire first, or None if the group is empty.
+
+        This is O(1), unless the Timeout at the top of the heap has been recycled since it was keyed.
+        """
+        self._tidy()
+        return self._heap[0][2] if self._heap else None
+
+    @property
+    def _remaining(self) -> ClockDeltaT:
+        self._tidy()
+        return self._heap[0][0] - self._clock() if self._heap else float("inf")
+
+    @property
+    def remaining(self) -> ClockDeltaT:
+        """Time until the next Timeout expires, or infinity if the group is empty."""
+        return max(0, self._remaining)
+
+    def pop_expired(self) -> typing.Set[Timeout]:
+        """Remove and return all the expired Timeouts."""
+        self._tidy()
+        now = self._clock()
+        heap = self._heap
+        result = set()
+        while heap and heap[0][0] <= now:
+            _, _, timeout = heapq.heappop(heap)
+            del self._entries[timeout]
+            result.add(timeout)
+            self._tidy()
+        return result
+
+    def wait(self) -> typing.Set[Timeout]:
+        """Sleep until the next Timeout expires, then remove and return all the expired Timeouts.
+
+        An empty group returns an empty set immediately.
+
+        >>> group = TimeoutGroup([Timeout(0.2), Timeout(0.1), Timeout(1)])
+        >>> [t.delay for t in group.wait()]
+        [0.1]
+        >>> len(group)
+        2
+        """
+        while self._heap:
+            remaining = self._remaining
+            if remaining <= 0:
+                break
+            elif math.isinf(remaining):
+                signal.pause()
+            else:
+                time.sleep(remaining)
+        return self.pop_expired()
+
+    async def async_wait(self) -> typing.Set[Timeout]:
+        """Sleep until the next Timeout expires, then remove and return all the expired Timeouts.
+
+        Other tasks may add, update or cancel Timeouts while this is waiting;
+        the wait is then recalculated from the new next expiry.
+        An empty group returns an empty set immediately.
+        """
+        self._changed = asyncio.Event()
+        try:
+            while self._heap:
+                remaining = self._remaining
+                if remaining <= 0:
+                    break
+                self._changed.clear()
+                try:
+                    await asyncio.wait_for(
+                        self._changed.wait(), None if math.isinf(remaining) else remaining
+                    )
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            self._changed = None
+        return self.pop_expired()
+
+
 if __name__ == "__main__":
     import doctest
 
@@ -0,0 +1,181 @@
+# Copyright 2021 Steve Palmer
+
+"""Per-example deadline enforcement and slow example reporting.
+
+Hypothesis's deadline only reports that an example took too long once it has finished,
+so an example that never finishes hangs the whole run.
+A Watchdog interrupts any example that runs past its timeout by raising ExampleTimeout in it,
+which hypothesis then shrinks like any other failure, to the smallest input that still times out.
+On the main thread the interrupt is delivered by SIGALRM, elsewhere by a watchdog thread.
+Either way, it is only delivered between bytecodes, so a single long call into C may complete first.
+
+A Watchdog also records the slowest examples of each property, with their inputs.
+"""
+
+import collections
+import ctypes
+import functools
+import heapq
+import itertools
+import reprlib
+import signal
+import sys
+import threading
+import typing
+
+from .timeout import Timeout
+
+
+__all__ = ("ExampleTimeout", "SlowExample", "Watchdog")
+
+
+class ExampleTimeout(AssertionError):
+    """Raised in an example that has run past the Watchdog timeout."""
+
+
+SlowExample = collections.namedtuple("SlowExample", ["seconds", "size", "inputs"])
+# seconds: float = time the example took to run.
+# size: int = approximate size of the inputs, being the sum of sys.getsizeof over them.
+#   Ties, such as between ints of similar magnitude, are broken on the length of inputs.
+# inputs: str = abbreviated repr of the inputs, taken before the example ran.
+
+
+class _SlowExampleLog:
+    """The slowest examples of one property, and the smallest of its slow examples."""
+
+    def __init__(self, keep: int, slow_seconds: float) -> None:
+        self._keep = keep
+        self._slow_seconds = slow_seconds
+        self._slowest = []  # heap of (seconds, sequence number, SlowExample)
+        self._counter = itertools.count()
+        self.smallest_slow = None
+
+    @property
+    def slowest(self) -> typing.List[SlowExample]:
+        return [example for _, _, example in sorted(self._slowest, reverse=True)]
+
+    def record(self, example: SlowExample) -> None:
+        item = (example.seconds, next(self._counter), example)
+        if len(self._slowest) < self._keep:
+            heapq.heappush(self._slowest, item)
+        elif item > self._slowest[0]:
+            heapq.heapreplace(self._slowest, item)
+        if example.seconds >= self._slow_seconds and (
+            self.smallest_slow is None
+            or (example.size, len(example.inputs)) < (self.smallest_slow.size, len(self.smallest_slow.inputs))
+        ):
+            self.smallest_slow = example
+
+
+class Watchdog:
+    """Enforce a timeout on each example of the generic tests, and record the slow examples.
+
+    Pass to Given to watch all the tests it binds:
+
+        @Given(st.integers(), watchdog=Watchdog(timeout=2.0))
+        class Test_int(intTests):
+            pass
+
+    timeout: seconds an example may run before it is interrupted, or None to never interrupt.
+    keep: number of the slowest examples to record for each property.
+    slow_seconds: examples taking at least this long are candidates for smallest_slow.
+    """
+
+    _repr = reprlib.Repr()
+    _repr.maxstring = _repr.maxother = 80
+
+    def __init__(self, timeout: float = None, *, keep: int = 5, slow_seconds: float = 0.1) -> None:
+        self.timeout = timeout
+        self.keep = keep
+        self.slow_seconds = slow_seconds
+        self._logs = collections.OrderedDict()
+
+    def __repr__(self) -> str:
+        return f"Watchdog(timeout={self.timeout!r}, keep={self.keep!r}, slow_seconds={self.slow_seconds!r})"
+
+    @staticmethod
+    def _safe_repr(value) -> str:
+        try:
+            return Watchdog._repr.repr(value)
+        except Exception:  # e.g. ints too large to convert to str
+            return f"<{type(value).__name__} object>"
+
+    @staticmethod
+    def _size(value) -> int:
+        try:
+            return sys.getsizeof(value)
+        except TypeError:
+            return 0
+
+    def log(self, test_id: str) -> _SlowExampleLog:
+        """The slow example log for a test, identified as 'Class.method'."""
+        if test_id not in self._logs:
+            self._logs[test_id] = _SlowExampleLog(self.keep, self.slow_seconds)
+        return self._logs[test_id]
+
+    def report(self) -> typing.Dict[str, typing.List[SlowExample]]:
+        """The slowest examples of each test run, slowest first."""
+        return collections.OrderedDict((test_id, log.slowest) for test_id, log in self._logs.items())
+
+    def _run_with_signal(self, call, timeout: Timeout):
+        def on_alarm(signum, frame):
+            raise ExampleTimeout(f"example exceeded {self.timeout} seconds")
+
+        previous_handler = signal.signal(signal.SIGALRM, on_alarm)
+        signal.setitimer(signal.ITIMER_REAL, timeout.remaining)
+        try:
+            return call()
+        finally:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, previous_handler)
+
+    def _run_with_thread(self, call, timeout: Timeout):
+        target = threading.get_ident()
+        lock = threading.Lock()
+        done = threading.Event()
+
+        def watch():
+            if not done.wait(timeout.remaining):
+                with lock:
+                    if not done.is_set():
+                        ctypes.pythonapi.PyThreadState_SetAsyncExc(
+                            ctypes.c_ulong(target), ctypes.py_object(ExampleTimeout)
+                        )
+
+        watcher = threading.Thread(target=watch, name="generic_testing.Watchdog", daemon=True)
+        watcher.start()
+        try:
+            return call()
+        finally:
+            with lock:
+                done.set()
+                # Cancel an ExampleTimeout set just as call returned, before it is raised in the caller
+                ctypes.pythonapi.PyThreadState_SetAsyncExc(ctypes.c_ulong(target), None)
+
+    def run(self, call):
+        """Run call(), interrupting it with ExampleTimeout if it runs past the timeout."""
+        if self.timeout is None:
+            return call()
+        timeout = Timeout(self.timeout)
+        if hasattr(signal, "setitimer") and threading.current_thread() is threading.main_thread():
+            return self._run_with_signal(call, timeout)
+        return self._run_with_thread(call, timeout)
+
+    def watch(self, test_id: str, method):
+        """Wrap a test method so that each call is run under this Watchdog, and recorded."""
+        watchdog = self
+        log = self.log(test_id)
+
+        @functools.wraps(method)
+        def watched(self, *args, **kwargs):
+            inputs = ", ".join(
+                [watchdog._safe_repr(v) for v in args] + [f"{k}={watchdog._safe_repr(v)}" for k, v in kwargs.items()]
+            )
+            size = sum(watchdog._size(v) for v in itertools.chain(args, kwargs.values()))
+            timeout = Timeout()
+            try:
+                return watchdog.run(lambda: method(self, *args, **kwargs))
+            finally:
+                log.record(SlowExample(timeout.elapse, size, inputs))
+
+        return watched
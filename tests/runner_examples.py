@@ -0,0 +1,30 @@
+#!/usr/bin/env python3
+# Copyright 2021 Steve Palmer
+
+"""Test classes for the generic_testing runner to run, in an importable module."""
+
+import unittest
+
+from hypothesis import strategies as st
+
+from generic_testing_test_context import generic_testing
+
+
+@generic_testing.Given(st.integers())
+class Example_int(generic_testing.EqualityTests):
+    pass
+
+
+@generic_testing.Given(st.text())
+class Example_str(generic_testing.EqualityTests):
+    pass
+
+
+class Example_failure(unittest.TestCase):
+    def test_failure(self) -> None:
+        self.fail("as expected")
+
+
+class Example_changes_rel_tol(unittest.TestCase):
+    def test_loosen_rel_tol(self) -> None:
+        generic_testing.isclose.default_rel_tol = 1e-3
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+# Copyright 2021 Steve Palmer
+
+"""A test of the generic_testing benchmarks, discovered for the built-in types."""
+
+import json
+import unittest
+
+from hypothesis import strategies as st
+
+from generic_testing_test_context import generic_testing
+
+
+@generic_testing.Given(st.integers())
+class Benchmark_int(generic_testing.defaultGenericTestLoader.discover_benchmarks(int)):
+    pass
+
+
+@generic_testing.Given(
+    {
+        generic_testing.ClassUnderTest: st.lists(st.integers()),
+        generic_testing.KeyT: st.integers(),
+        generic_testing.ValueT: st.integers(),
+    }
+)
+class Benchmark_list(generic_testing.defaultGenericTestLoader.discover_benchmarks(list)):
+    pass
+
+
+class Test_Benchmarks(unittest.TestCase):
+    def test_mirrors_tests(self) -> None:
+        benchmarks = generic_testing.defaultGenericTestLoader.discover_benchmarks(frozenset)
+        self.assertTrue(issubclass(benchmarks, generic_testing.SetBenchmarks))
+        self.assertTrue(issubclass(benchmarks, generic_testing.HashableBenchmarks))
+        self.assertFalse(issubclass(benchmarks, generic_testing.AdditionMonoidBenchmarks))
+
+    def test_profile_is_json_lines(self) -> None:
+        report = generic_testing.defaultGenericTestLoader.profile(
+            frozenset,
+            {generic_testing.ClassUnderTest: st.frozensets(st.integers()), generic_testing.ElementT: st.integers()},
+        )
+        records = {record["operation"]: record for record in map(json.loads, report.splitlines())}
+        self.assertLessEqual({"eq", "le", "hash", "or", "and", "sub", "xor", "contains", "len", "iter"}, records.keys())
+        self.assertTrue(all(record["test"] == "Benchmark_frozenset" for record in records.values()))
+        self.assertTrue(all(0.0 < record["min"] <= record["median"] for record in records.values()))
+
+
+if __name__ == "__main__":
+    SUITE = unittest.TestSuite()
+    SUITE.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(Benchmark_int))
+    SUITE.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(Benchmark_list))
+    SUITE.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(Test_Benchmarks))
+    TR = unittest.TextTestRunner(verbosity=2)
+    TR.run(SUITE)
+    print(generic_testing.GenericBenchmarks.benchmark_report(), end="")
@@ -4,7 +4,9 @@
 """A test of the generic_test.built_in_tests using the built-in container types."""
 
 import unittest
+import array
 import collections
+import random
 import types
 
 from hypothesis import strategies as st
@@ -12,14 +14,39 @@ from hypothesis import strategies as st
 from generic_testing_test_context import generic_testing
 
 
+# Sizes either side of the points where sets and dicts resize their hash tables
+tiers = {"small": (0, 10, 200), "large": (10_000, 100_000, 5)}
+
+
+def sized(small, large):
+    """Sized strategy for Given tiers.
+
+    small(min_size, max_size) is a strategy, used while hypothesis can draw every element.
+    Larger collections are built by large(rnd, size), from a Random with a hypothesis drawn seed.
+    """
+
+    def result(min_size, max_size):
+        if max_size <= 1000:
+            return small(min_size, max_size)
+        return st.builds(
+            lambda seed, size: large(random.Random(seed), size), st.integers(0, 2 ** 32), st.integers(min_size, max_size)
+        )
+
+    return result
+
+
 element_st = st.integers()
 
 
 @generic_testing.Given(
     {
-        generic_testing.ClassUnderTest: st.frozensets(element_st),
+        generic_testing.ClassUnderTest: sized(
+            lambda min_size, max_size: st.frozensets(element_st, min_size=min_size, max_size=max_size),
+            lambda rnd, size: frozenset(rnd.getrandbits(64) for _ in range(size)),
+        ),
         generic_testing.ElementT: element_st,
-    }
+    },
+    tiers=tiers,
 )
 class Test_frozenset(generic_testing.frozensetTests):
     pass
@@ -30,9 +57,13 @@ element_st = st.integers()
 
 @generic_testing.Given(
     {
-        generic_testing.ClassUnderTest: st.sets(element_st),
+        generic_testing.ClassUnderTest: sized(
+            lambda min_size, max_size: st.sets(element_st, min_size=min_size, max_size=max_size),
+            lambda rnd, size: set(rnd.getrandbits(64) for _ in range(size)),
+        ),
         generic_testing.ElementT: element_st,
-    }
+    },
+    tiers=tiers,
 )
 class Test_set(generic_testing.setTests):
     pass
@@ -109,10 +140,14 @@ value_st = st.integers()
 
 @generic_testing.Given(
     {
-        generic_testing.ClassUnderTest: st.dictionaries(key_st, value_st),
+        generic_testing.ClassUnderTest: sized(
+            lambda min_size, max_size: st.dictionaries(key_st, value_st, min_size=min_size, max_size=max_size),
+            lambda rnd, size: {rnd.getrandbits(64): rnd.getrandbits(64) for _ in range(size)},
+        ),
         generic_testing.KeyT: key_st,
         generic_testing.ValueT: value_st,
-    }
+    },
+    tiers=tiers,
 )
 class Test_dict(generic_testing.dictTests):
     pass
@@ -224,6 +259,87 @@ class Test_list(generic_testing.listTests):
     pass
 
 
+bound_st = st.integers(min_value=-(2 ** 40), max_value=2 ** 40)
+
+
+@generic_testing.Given(
+    {
+        generic_testing.ClassUnderTest: st.builds(
+            range, bound_st, bound_st, st.integers(min_value=-(2 ** 20), max_value=2 ** 20).filter(bool)
+        ),
+        generic_testing.KeyT: st.integers(min_value=-(2 ** 41), max_value=2 ** 41),
+        generic_testing.ValueT: bound_st,
+    }
+)
+class Test_range(generic_testing.rangeTests):
+    pass
+
+
+byte_st = st.integers(min_value=0, max_value=255)
+
+
+@generic_testing.Given(
+    {
+        generic_testing.ClassUnderTest: st.binary(),
+        generic_testing.KeyT: st.integers(min_value=-(2 ** 30), max_value=2 ** 30),
+        generic_testing.ValueT: byte_st,
+        generic_testing.ScalarT: st.integers(min_value=-1, max_value=10),
+    }
+)
+class Test_bytes(generic_testing.bytesTests):
+    pass
+
+
+@generic_testing.Given(
+    {
+        generic_testing.ClassUnderTest: st.binary().map(bytearray),
+        generic_testing.KeyT: st.integers(min_value=-(2 ** 30), max_value=2 ** 30),
+        generic_testing.ValueT: byte_st,
+        generic_testing.ScalarT: st.integers(min_value=-1, max_value=10),
+    }
+)
+class Test_bytearray(generic_testing.bytearrayTests):
+    pass
+
+
+@generic_testing.Given(
+    {
+        generic_testing.ClassUnderTest: st.one_of(st.binary(), st.binary().map(bytearray)).map(memoryview),
+        generic_testing.KeyT: st.integers(min_value=-(2 ** 30), max_value=2 ** 30),
+        generic_testing.ValueT: byte_st,
+    }
+)
+class Test_memoryview(generic_testing.memoryviewTests):
+    pass
+
+
+int32_st = st.integers(min_value=-(2 ** 31), max_value=2 ** 31 - 1)
+
+
+@generic_testing.Given(
+    {
+        generic_testing.ClassUnderTest: st.lists(int32_st).map(lambda l: array.array("i", l)),
+        generic_testing.KeyT: st.integers(min_value=-(2 ** 30), max_value=2 ** 30),
+        generic_testing.ValueT: int32_st,
+        generic_testing.ScalarT: st.integers(min_value=-1, max_value=10),
+    }
+)
+class Test_array(generic_testing.arrayTests):
+    typecode = "i"
+
+
+@generic_testing.Given(
+    {
+        generic_testing.ClassUnderTest: st.lists(st.integers()).map(collections.deque),
+        generic_testing.KeyT: st.integers(min_value=-(2 ** 30), max_value=2 ** 30),
+        generic_testing.ValueT: st.integers(),
+        generic_testing.ScalarT: st.integers(min_value=-1, max_value=10),
+    }
+)
+class Test_deque(generic_testing.dequeTests):
+    pass
+
+
 __all__ = (
     "Test_frozenset",
     "Test_set",
@@ -237,6 +353,12 @@ __all__ = (
     "Test_defaultdict",
     "Test_tuple",
     "Test_list",
+    "Test_range",
+    "Test_bytes",
+    "Test_bytearray",
+    "Test_memoryview",
+    "Test_array",
+    "Test_deque",
 )
 
 
@@ -264,5 +386,11 @@ if __name__ == "__main__":
     SUITE.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(Test_tuple))
     SUITE.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(Test_str))
     SUITE.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(Test_list))
+    SUITE.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(Test_range))
+    SUITE.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(Test_bytes))
+    SUITE.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(Test_bytearray))
+    SUITE.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(Test_memoryview))
+    SUITE.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(Test_array))
+    SUITE.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(Test_deque))
     TR = unittest.TextTestRunner(verbosity=2)
     TR.run(SUITE)
@@ -5,6 +5,7 @@
 
 import unittest
 import io
+import mmap
 import tempfile
 
 from hypothesis import strategies as st
@@ -30,6 +31,17 @@ class Test_FileIO(generic_testing.FileIOTests):
     pass
 
 
+@generic_testing.Given(
+    {
+        generic_testing.ClassUnderTest: st.builds(_make_raw_temp_file),
+        int: st.integers(),
+        bytes: st.binary(),
+    }
+)
+class Test_FileIO_large(generic_testing.LargeFileIOTests):
+    pass
+
+
 def _make_buffered_temp_file(b: bytes):
     result = tempfile.TemporaryFile()
     result.write(b)
@@ -60,7 +72,10 @@ def _make_buffered_reader_file(b: bytes):
     }
 )
 class Test_BufferedReader(generic_testing.BufferedIOBaseTests):
-    pass
+    def zero_copy_reader(self, a):
+        # A BufferedReader cannot be lengthened, so read a long reader with the same data
+        a.seek(0)
+        return _make_buffered_reader_file(a.read() + bytes(range(256)) * (self.zero_copy_payload_bytes // 256))
 
 
 class Test_BufferedReader2(unittest.TestCase):
@@ -108,6 +123,17 @@ class Test_BufferedRandom(generic_testing.BufferedIOBaseTests):
     pass
 
 
+@generic_testing.Given(
+    {
+        generic_testing.ClassUnderTest: st.builds(_make_buffered_random_file),
+        int: st.integers(),
+        bytes: st.binary(),
+    }
+)
+class Test_BufferedRandom_large(generic_testing.LargeBufferedIOBaseTests):
+    pass
+
+
 def _make_buffered_pair_file(b: bytes):
     return io.BufferedRWPair(_make_raw_temp_file(b), _make_raw_temp_file(b))
 
@@ -138,6 +164,48 @@ class Test_BytesIO(generic_testing.BytesIOTests):
     pass
 
 
+def _compressed_file_st(tests_class, levels=None):
+    return st.builds(
+        lambda b, level: tests_class.open_compressed(io.BytesIO(tests_class.compress(b, level)), "rb", None),
+        st.binary(),
+        st.sampled_from(levels or tests_class.compression_levels),
+    )
+
+
+@generic_testing.Given(
+    {
+        generic_testing.ClassUnderTest: _compressed_file_st(generic_testing.GzipFileTests),
+        int: st.integers(),
+        bytes: st.binary(),
+    }
+)
+class Test_GzipFile(generic_testing.GzipFileTests):
+    pass
+
+
+@generic_testing.Given(
+    {
+        generic_testing.ClassUnderTest: _compressed_file_st(generic_testing.BZ2FileTests),
+        int: st.integers(),
+        bytes: st.binary(),
+    }
+)
+class Test_BZ2File(generic_testing.BZ2FileTests):
+    pass
+
+
+@generic_testing.Given(
+    {
+        # presets 7 to 9 only enlarge the dictionary, but each writer then costs tens of milliseconds
+        generic_testing.ClassUnderTest: _compressed_file_st(generic_testing.LZMAFileTests, range(0, 7)),
+        int: st.integers(),
+        bytes: st.binary(),
+    }
+)
+class Test_LZMAFile(generic_testing.LZMAFileTests):
+    pass
+
+
 def _make_text_temp_file(s: str):
     result = tempfile.TemporaryFile("w+t")
     result.write(s)
@@ -156,6 +224,48 @@ class Test_TextIO(generic_testing.TextIOBaseTests):
     pass
 
 
+class _TrickleRawIO(io.RawIOBase):
+    """A seekable raw stream that returns at most one byte per read, like a very slow device."""
+
+    def __init__(self, b: bytes) -> None:
+        super().__init__()
+        self._data = io.BytesIO(b)
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def readinto(self, b) -> int:
+        return self._data.readinto(memoryview(b)[:1])
+
+    def seek(self, offset: int, whence: int = 0) -> int:
+        return self._data.seek(offset, whence)
+
+    def tell(self) -> int:
+        return self._data.tell()
+
+
+def _make_trickle_text_file(s: str, encoding: str):
+    return io.TextIOWrapper(io.BufferedReader(_TrickleRawIO(s.encode(encoding))), encoding=encoding)
+
+
+@generic_testing.Given(
+    {
+        generic_testing.ClassUnderTest: st.builds(
+            _make_trickle_text_file,
+            st.text(),
+            st.sampled_from(["utf-8", "utf-8-sig", "utf-16", "utf-32", "gb18030"]),
+        ),
+        int: st.integers(),
+        str: st.text(),
+    }
+)
+class Test_TextIOWrapper(generic_testing.TextIOWrapperTests):
+    pass
+
+
 @generic_testing.Given(
     {
         generic_testing.ClassUnderTest: st.builds(io.StringIO),
@@ -167,12 +277,39 @@ class Test_StringIO(generic_testing.StringIOTests):
     pass
 
 
+def _make_mmap(b: bytes):
+    f = tempfile.TemporaryFile()
+    f.write(b or b"\n")  # an empty file cannot be mapped
+    f.flush()
+    result = mmap.mmap(f.fileno(), 0)
+    f.close()
+    return result
+
+
+@generic_testing.Given(
+    {
+        generic_testing.ClassUnderTest: st.builds(_make_mmap),
+        int: st.integers(),
+        bytes: st.binary(),
+    }
+)
+class Test_mmap(generic_testing.mmapTests):
+    pass
+
+
 __all__ = (
     "Test_FileIO",
+    "Test_FileIO_large",
     "Test_BufferedIO",
+    "Test_BufferedRandom_large",
     "Test_BytesIO",
+    "Test_GzipFile",
+    "Test_BZ2File",
+    "Test_LZMAFile",
     "Test_TextIO",
+    "Test_TextIOWrapper",
     "Test_StringIO",
+    "Test_mmap",
 )
 
 
@@ -189,3 +326,8 @@ if __name__ == "__main__":
             unittest.defaultTestLoader.loadTestsFromTestCase(Test_BufferedReader2)
         )
     unittest.TextTestRunner(verbosity=2).run(SUITE)
+    payload = bytes(range(256)) * 4096
+    for tests_class in (Test_GzipFile, Test_BZ2File, Test_LZMAFile):
+        print(tests_class.__name__)
+        for record in tests_class.throughput_report(payload):
+            print(f"  {record}")
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+# Copyright 2021 Steve Palmer
+
+"""A test of the python -m generic_testing command line."""
+
+import contextlib
+import io
+import unittest
+
+from hypothesis import strategies as st
+
+from generic_testing_test_context import generic_testing
+from generic_testing import __main__ as command_line
+
+import modulo_n
+
+
+class Test_CommandLine(unittest.TestCase):
+    def test_parse_duration(self) -> None:
+        self.assertEqual([command_line.parse_duration(text) for text in ("90", "90s", "2m", "1h")], [90, 90, 120, 3600])
+
+    def test_import_object(self) -> None:
+        self.assertIs(command_line.import_object("modulo_n:ModuloN"), modulo_n.ModuloN)
+        self.assertEqual(command_line.import_object("modulo_n:ModuloN.decimal_digit(3)"), modulo_n.ModuloN.decimal_digit(3))
+        self.assertEqual(command_line.import_object("modulo_n:st.integers()"), st.integers())
+        with self.assertRaises(ValueError):
+            command_line.import_object("modulo_n")
+
+    def test_build_test_class_uses_docstring(self) -> None:
+        test_class = command_line.build_test_class(
+            "modulo_n:ModuloN",
+            "modulo_n:st.builds(ModuloN.decimal_digit, st.integers())",
+            ["zero=modulo_n:ModuloN.decimal_digit(0)", "one=modulo_n:ModuloN.decimal_digit(1)"],
+        )
+        self.assertIs(test_class.class_under_test, modulo_n.ModuloN)
+        self.assertEqual(test_class.zero, modulo_n.ModuloN.decimal_digit(0))
+        self.assertTrue(hasattr(test_class, "test_generic_2251_exponentiation_by_zero"))
+
+    def test_missing_attribute_is_an_error(self) -> None:
+        with self.assertRaisesRegex(ValueError, "need one"):
+            command_line.build_test_class(
+                "modulo_n:ModuloN", "hypothesis.strategies:integers", ["zero=modulo_n:ModuloN.decimal_digit(0)"]
+            )
+        with contextlib.redirect_stderr(io.StringIO()) as error, contextlib.redirect_stdout(io.StringIO()) as output:
+            status = command_line.main(["run", "modulo_n:ModuloN", "--set", "zero=modulo_n:ModuloN.decimal_digit(0)"])
+        self.assertEqual(status, 2)
+        self.assertIn("error: the tests of ModuloN need one", error.getvalue())
+        self.assertEqual(output.getvalue(), "")
+
+    def test_run_within_budget(self) -> None:
+        with contextlib.redirect_stdout(io.StringIO()) as output:
+            status = command_line.main(["run", "builtins:int", "--strategy", "hypothesis.strategies:integers", "--budget", "1s"])
+        self.assertEqual(status, 0)
+        self.assertRegex(output.getvalue(), r"Ran [1-9]\d* tests .* 0 failures, 0 errors, [1-9]\d* skipped")
+
+    def test_workers_share_the_tests(self) -> None:
+        results = command_line.run("builtins:int", "hypothesis.strategies:integers", workers=2, budget=0.0)
+        self.assertEqual(len(results), 2)
+        self.assertEqual([result.run for result in results], [0, 0])
+        self.assertLessEqual(abs(results[0].skipped - results[1].skipped), 1)
+
+    def test_workers_run_the_tests(self) -> None:
+        results = command_line.run(
+            "modulo_n:ModuloN",
+            "modulo_n:st.builds(ModuloN.decimal_digit, st.integers())",
+            ["zero=modulo_n:ModuloN.decimal_digit(0)", "one=modulo_n:ModuloN.decimal_digit(1)"],
+            workers=2,
+        )
+        self.assertEqual(len(results), 2)
+        self.assertTrue(all(result.run > 0 for result in results))
+        self.assertEqual([(result.failures, result.errors, result.skipped) for result in results], [([], [], 0)] * 2)
+        self.assertEqual(sum(len(result.passed) for result in results), sum(result.run for result in results))
+
+
+if __name__ == "__main__":
+    SUITE = unittest.defaultTestLoader.loadTestsFromTestCase(Test_CommandLine)
+    unittest.TextTestRunner(verbosity=2).run(SUITE)
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+# Copyright 2021 Steve Palmer
+
+"""A test of the generic_testing concurrent mutation tests."""
+
+import collections.abc
+import json
+import time
+import unittest
+
+from hypothesis import strategies as st
+
+from generic_testing_test_context import generic_testing
+
+
+key_st = st.integers()
+value_st = st.integers()
+
+
+class TupleMapping(collections.abc.MutableMapping):
+    """A mapping that replaces a tuple of its items on every mutation, so loses concurrent updates."""
+
+    def __init__(self, items=()):
+        self._items = tuple(dict(items).items())
+
+    def __getitem__(self, key):
+        for k, v in self._items:
+            if k == key:
+                return v
+        raise KeyError(key)
+
+    def __setitem__(self, key, value):
+        items = tuple((k, v) for k, v in self._items if k != key)
+        time.sleep(0)  # let another thread in
+        self._items = items + ((key, value),)
+
+    def __delitem__(self, key):
+        if key not in self:
+            raise KeyError(key)
+        items = tuple((k, v) for k, v in self._items if k != key)
+        time.sleep(0)
+        self._items = items
+
+    def __iter__(self):
+        return iter([k for k, _ in self._items])
+
+    def __len__(self):
+        return len(self._items)
+
+
+@generic_testing.Given(
+    {
+        generic_testing.ClassUnderTest: st.dictionaries(key_st, value_st),
+        generic_testing.KeyT: key_st,
+        generic_testing.ValueT: value_st,
+    }
+)
+class Test_dict_concurrency(generic_testing.ConcurrentMutableMappingMixinTests, generic_testing.GenericTests):
+    def copy(self, a):
+        return a.copy()
+
+
+class ListConcurrencyMixinTests(generic_testing.ConcurrentMutableSequenceMixinTests):
+    concurrent_iteration_safe = True
+
+    def copy(self, a):
+        return a.copy()
+
+
+@generic_testing.Given({generic_testing.ClassUnderTest: st.lists(value_st), generic_testing.ValueT: value_st})
+class Test_list_concurrency(ListConcurrencyMixinTests, generic_testing.GenericTests):
+    pass
+
+
+def _make_list_tests():
+    @generic_testing.Given({generic_testing.ClassUnderTest: st.lists(value_st), generic_testing.ValueT: value_st})
+    class Test_list(ListConcurrencyMixinTests, generic_testing.GenericTests):
+        pass
+
+    return Test_list
+
+
+def _make_tuple_mapping_tests():
+    @generic_testing.Given(
+        {
+            generic_testing.ClassUnderTest: st.dictionaries(key_st, value_st, min_size=8).map(TupleMapping),
+            generic_testing.KeyT: key_st,
+            generic_testing.ValueT: value_st,
+        }
+    )
+    class Test_TupleMapping(generic_testing.ConcurrentMutableMappingMixinTests, generic_testing.GenericTests):
+        concurrency_thread_counts = (4,)
+        concurrency_rounds = 20
+
+        def copy(self, a):
+            return TupleMapping(a)
+
+    return Test_TupleMapping
+
+
+class DescribedDict(dict):
+    """A dict that describes its tests.
+
+--- !ClassDescription
+    has:
+      - ConcurrentMutableMapping
+      - MutableMapping
+    """
+
+
+class Test_Concurrency(unittest.TestCase):
+    def test_named_in_class_description(self) -> None:
+        test_class = generic_testing.defaultGenericTestLoader.discover(DescribedDict, use_docstring_yaml=True)
+        self.assertTrue(issubclass(test_class, generic_testing.ConcurrentMutableMappingMixinTests))
+
+    def test_detects_lost_updates(self) -> None:
+        result = unittest.TestResult()
+        _make_tuple_mapping_tests()("test_generic_2920_concurrent_mapping_mutation").run(result)
+        self.assertEqual(len(result.failures), 1)
+        self.assertIn("lost updates with 4 threads", result.failures[0][1])
+
+    def test_report_is_json_lines(self) -> None:
+        _make_list_tests()("test_generic_2921_concurrent_sequence_mutation").test_generic_2921_concurrent_sequence_mutation()
+        records = [
+            json.loads(line) for line in generic_testing.ConcurrentMutationMixinTests.concurrency_report().splitlines()
+        ]
+        threads = {record["threads"] for record in records if record["test"] == "Test_list"}
+        self.assertEqual(threads, set(generic_testing.ConcurrentMutationMixinTests.concurrency_thread_counts))
+
+
+if __name__ == "__main__":
+    SUITE = unittest.TestSuite()
+    SUITE.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(Test_dict_concurrency))
+    SUITE.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(Test_list_concurrency))
+    SUITE.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(Test_Concurrency))
+    TR = unittest.TextTestRunner(verbosity=2)
+    TR.run(SUITE)
+    print(generic_testing.ConcurrentMutationMixinTests.concurrency_report(), end="")
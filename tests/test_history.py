@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+# Copyright 2021 Steve Palmer
+
+"""A test of the generic_testing benchmark history and its regression detection."""
+
+import contextlib
+import io
+import random
+import tempfile
+import unittest
+
+from generic_testing_test_context import generic_testing
+from generic_testing import history
+
+
+def samples(rnd, median, n=100):
+    return tuple(rnd.lognormvariate(0.0, 0.05) * median for _ in range(n))
+
+
+class Test_History(unittest.TestCase):
+    def setUp(self) -> None:
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.history = history.BenchmarkHistory(directory.name)
+        rnd = random.Random(0)
+        self.history.save(
+            [
+                generic_testing.BenchmarkRecord("Benchmark_int", "add", samples(rnd, 1e-7)),
+                generic_testing.BenchmarkRecord("Benchmark_int", "mul", samples(rnd, 1e-7)),
+                generic_testing.BenchmarkRecord("Benchmark_int", "mod", samples(rnd, 1e-7)),
+            ],
+            "base",
+        )
+        self.history.save(
+            [
+                generic_testing.BenchmarkRecord("Benchmark_int", "add", samples(rnd, 1e-7)),
+                generic_testing.BenchmarkRecord("Benchmark_int", "mul", samples(rnd, 1.5e-7)),
+                generic_testing.BenchmarkRecord("Benchmark_int", "mod", samples(rnd, 0.5e-7)),
+            ],
+            "head",
+        )
+
+    def test_mann_whitney_u(self) -> None:
+        u, p_value = history.mann_whitney_u([1, 2, 3], [4, 5, 6])
+        self.assertEqual(u, 0)
+        self.assertAlmostEqual(p_value, 0.0808, places=3)
+        u, p_value = history.mann_whitney_u([1, 1, 2], [1, 2, 2])
+        self.assertEqual(u, 3)
+        self.assertGreater(p_value, 0.5)
+
+    def test_verdicts(self) -> None:
+        verdicts = {comparison.operation: comparison.verdict for comparison in self.history.compare()}
+        self.assertEqual(verdicts, {"add": "unchanged", "mul": "regression", "mod": "improvement"})
+
+    def test_other_environments_are_not_compared(self) -> None:
+        self.assertEqual(self.history.compare(environment="elsewhere"), [])
+
+    def test_command_is_strict(self) -> None:
+        with contextlib.redirect_stdout(io.StringIO()) as output:
+            status = history.main(["--directory", self.history.directory, "--strict", "compare", "base", "head"])
+        self.assertEqual(status, 1)
+        self.assertIn("regression: Benchmark_int.mul", output.getvalue())
+        self.assertIn("3 benchmarks compared, 1 regressions", output.getvalue())
+
+
+if __name__ == "__main__":
+    SUITE = unittest.defaultTestLoader.loadTestsFromTestCase(Test_History)
+    unittest.TextTestRunner(verbosity=2).run(SUITE)
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+# Copyright 2021 Steve Palmer
+
+"""A test of skipping the tests that passed with an unchanged fingerprint."""
+
+import linecache
+import pathlib
+import tempfile
+import unittest
+
+from hypothesis import strategies as st
+
+from generic_testing_test_context import generic_testing
+
+import runner_examples
+
+
+class Test_Incremental(unittest.TestCase):
+    def test_fingerprint_is_stable(self) -> None:
+        self.assertEqual(
+            generic_testing.fingerprint(runner_examples.Example_int),
+            generic_testing.fingerprint(runner_examples.Example_int),
+        )
+
+    def test_fingerprint_depends_on_strategy_and_class_under_test(self) -> None:
+        self.assertIs(generic_testing.class_under_test(runner_examples.Example_int), int)
+        self.assertIs(generic_testing.class_under_test(runner_examples.Example_str), str)
+        narrower = generic_testing.Given(st.integers(0, 9))(type("Example_int", (generic_testing.EqualityTests,), {}))
+        self.assertNotEqual(
+            generic_testing.fingerprint(runner_examples.Example_int), generic_testing.fingerprint(narrower)
+        )
+
+    def test_class_under_test_draws_no_example(self) -> None:
+        made = []
+
+        def make_path(name: str) -> pathlib.PurePosixPath:
+            made.append(name)
+            return pathlib.PurePosixPath(name)
+
+        test_class = generic_testing.Given(st.builds(make_path, st.text()))(
+            type("Example_path", (generic_testing.EqualityTests,), {})
+        )
+        self.assertIs(generic_testing.class_under_test(test_class), pathlib.PurePosixPath)
+        self.assertEqual(made, [])
+
+    def test_fingerprint_depends_on_helper_source(self) -> None:
+        namespace = dict()
+        fingerprints = []
+        for body in ("return x", "return -x"):
+            with tempfile.TemporaryDirectory() as directory:
+                path = pathlib.Path(directory, "helpers.py")
+                path.write_text(f"def helper(x: int) -> int:\n    {body}\n")
+                exec(compile(path.read_text(), str(path), "exec"), namespace)
+                linecache.checkcache(str(path))
+                test_class = generic_testing.Given(st.integers().map(namespace["helper"]))(
+                    type("Example_int", (generic_testing.EqualityTests,), {})
+                )
+                fingerprints.append(generic_testing.fingerprint(test_class))
+        self.assertNotEqual(*fingerprints)
+
+    def test_cache_is_reset_by_fingerprint_or_version(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            cache = generic_testing.ResultCache(directory, "1.0.0")
+            cache.update([("T", "f", ["test_a", "test_b"], [])])
+            self.assertEqual(cache.passed("T", "f"), {"test_a", "test_b"})
+            cache.update([("T", "f", [], ["test_b"])])
+            self.assertEqual(cache.passed("T", "f"), {"test_a"})
+            self.assertEqual(cache.passed("T", "g"), frozenset())
+            self.assertEqual(generic_testing.ResultCache(directory, "1.0.1").passed("T", "f"), frozenset())
+
+    def test_second_run_skips_passed_tests(self) -> None:
+        test_classes = [runner_examples.Example_int, runner_examples.Example_failure]
+        with tempfile.TemporaryDirectory() as directory:
+            first = generic_testing.run_test_classes(
+                test_classes, backend="thread", cache_directory=directory, sample_fraction=0.0
+            )
+            second = generic_testing.run_test_classes(
+                test_classes, backend="thread", cache_directory=directory, sample_fraction=0.0
+            )
+            sampled = generic_testing.run_test_classes(
+                test_classes, backend="thread", cache_directory=directory, sample_fraction=1.0
+            )
+        self.assertGreater(first[0].run, 0)
+        self.assertEqual(first[0].cached, 0)
+        self.assertEqual(second[0].run, 0)
+        self.assertEqual(second[0].cached, first[0].run)
+        self.assertEqual(sampled[0].run, first[0].run)
+        self.assertEqual([result.run for result in (first[1], second[1], sampled[1])], [1, 1, 1])
+
+
+if __name__ == "__main__":
+    SUITE = unittest.defaultTestLoader.loadTestsFromTestCase(Test_Incremental)
+    unittest.TextTestRunner(verbosity=2).run(SUITE)
@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+# Copyright 2021 Steve Palmer
+
+"""A test of the generic_testing memory footprint and leak check tests."""
+
+import json
+import unittest
+
+from hypothesis import strategies as st
+
+from generic_testing_test_context import generic_testing
+
+
+class SlottedPoint:
+    __slots__ = ("x", "y")
+
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+
+    def __eq__(self, other):
+        return isinstance(other, type(self)) and (self.x, self.y) == (other.x, other.y)
+
+    def __getstate__(self):
+        return (self.x, self.y)
+
+    def __setstate__(self, state):
+        self.x, self.y = state
+
+
+class Point:
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+
+    def __eq__(self, other):
+        return isinstance(other, type(self)) and (self.x, self.y) == (other.x, other.y)
+
+
+# Small ints are cached, so the footprint is the Point alone
+coordinate_st = st.integers(min_value=0, max_value=100)
+
+
+class PointFootprintMixinTests(generic_testing.MemoryFootprintMixinTests):
+    footprint_budget = 96
+
+
+@generic_testing.Given(st.builds(SlottedPoint, coordinate_st, coordinate_st))
+class Test_SlottedPoint(PointFootprintMixinTests, generic_testing.EqualityTests):
+    pass
+
+
+def _make_point_tests(point_type):
+    @generic_testing.Given(st.builds(point_type, coordinate_st, coordinate_st))
+    class Test_Point(PointFootprintMixinTests, generic_testing.EqualityTests):
+        pass
+
+    return Test_Point
+
+
+class ListFootprintMixinTests(generic_testing.SizedMemoryFootprintMixinTests):
+    empty = []
+    footprint_budget = 64
+    footprint_batch = 10
+
+
+@generic_testing.Given(st.lists(st.integers(min_value=1000), min_size=16))
+class Test_list_footprint(ListFootprintMixinTests, generic_testing.GenericTests):
+    pass
+
+
+def _make_list_tests(baseline):
+    @generic_testing.Given(st.lists(st.integers(min_value=1000), min_size=16))
+    class Test_list(ListFootprintMixinTests, generic_testing.GenericTests):
+        footprint_baseline = baseline
+
+    return Test_list
+
+
+class Total:
+    """A number whose __iadd__ keeps every old value, as in the leak we had."""
+
+    history = []
+
+    def __init__(self, value):
+        self.value = value
+
+    def __add__(self, other):
+        return Total(self.value + other.value)
+
+    def __iadd__(self, other):
+        Total.history.append(Total(self.value))
+        self.value += other.value
+        return self
+
+
+class RunningTotal:
+    """A number whose __iadd__ keeps every old value in the instance, which a copy discards."""
+
+    def __init__(self, value):
+        self.value = value
+        self.history = []
+
+    def __copy__(self):
+        return RunningTotal(self.value)
+
+    def __add__(self, other):
+        return RunningTotal(self.value + other.value)
+
+    def __iadd__(self, other):
+        self.history.append(self.value)
+        self.value += other.value
+        return self
+
+
+@generic_testing.Given(st.integers())
+class Test_int_leaks(generic_testing.LeakCheckMixinTests, generic_testing.GenericTests):
+    pass
+
+
+@generic_testing.Given(st.lists(st.integers(), max_size=10))
+class Test_list_leaks(generic_testing.LeakCheckMixinTests, generic_testing.GenericTests):
+    pass
+
+
+def _make_total_tests():
+    @generic_testing.Given(st.builds(Total, st.integers()))
+    class Test_Total(generic_testing.LeakCheckMixinTests, generic_testing.GenericTests):
+        pass
+
+    return Test_Total
+
+
+class DescribedPoint(SlottedPoint):
+    """A SlottedPoint that describes its tests.
+
+--- !ClassDescription
+    has:
+      - Equality
+      - MemoryFootprint
+      - LeakCheck
+    """
+
+    __slots__ = ()
+
+
+def _make_described_point_tests():
+    @generic_testing.Given(st.builds(DescribedPoint, coordinate_st, coordinate_st))
+    class Test_DescribedPoint(
+        generic_testing.defaultGenericTestLoader.discover(DescribedPoint, use_docstring_yaml=True)
+    ):
+        footprint_budget = 96
+
+    return Test_DescribedPoint
+
+
+def _make_running_total_tests():
+    @generic_testing.Given(st.builds(RunningTotal, st.integers(min_value=2 ** 40)))
+    class Test_RunningTotal(generic_testing.LeakCheckMixinTests, generic_testing.GenericTests):
+        pass
+
+    return Test_RunningTotal
+
+
+class Test_Footprint(unittest.TestCase):
+    def test_losing_slots_breaks_budget(self) -> None:
+        result = unittest.TestResult()
+        _make_point_tests(Point)("test_generic_2900_footprint_per_instance").run(result)
+        self.assertEqual(len(result.failures), 1)
+        self.assertIn("over budget", result.failures[0][1])
+
+    def test_report_is_json_lines(self) -> None:
+        _make_point_tests(SlottedPoint)("test_generic_2900_footprint_per_instance").test_generic_2900_footprint_per_instance()
+        records = [json.loads(line) for line in generic_testing.MemoryFootprintMixinTests.footprint_report().splitlines()]
+        self.assertTrue(any(record["test"] == "Test_Point" for record in records))
+        self.assertTrue(all(record["length"] is None for record in records if record["test"] == "Test_Point"))
+
+    def test_named_in_class_description(self) -> None:
+        test_class = _make_described_point_tests()
+        self.assertTrue(issubclass(test_class, generic_testing.MemoryFootprintMixinTests))
+        self.assertTrue(issubclass(test_class, generic_testing.LeakCheckMixinTests))
+        result = unittest.TestResult()
+        test_class("test_generic_2900_footprint_per_instance").run(result)
+        test_class("test_generic_2911_binary_operations_do_not_leak").run(result)
+        self.assertEqual(result.testsRun, 2)
+        self.assertTrue(result.wasSuccessful(), result.failures + result.errors)
+
+    def test_records_are_bounded(self) -> None:
+        records = generic_testing.MemoryFootprintMixinTests.footprint_records
+        self.assertEqual(records.maxlen, generic_testing.MemoryFootprintMixinTests.footprint_records_kept)
+
+    def test_baseline_catches_regression(self) -> None:
+        records = [
+            generic_testing.FootprintRecord("Test_list_footprint", 20, 1000.0, 40.0),
+            generic_testing.FootprintRecord("Test_list_footprint", 40, 1600.0, 30.0),
+        ]
+        baseline = generic_testing.MemoryFootprintMixinTests.footprint_baseline_from(records)
+        self.assertEqual(baseline, {"Test_list_footprint": {"per_instance": 1600.0, "per_element": 40.0}})
+        result = unittest.TestResult()
+        test = _make_list_tests({"Test_list": {"per_instance": None, "per_element": 4.0}})
+        test("test_generic_2901_footprint_per_element").run(result)
+        self.assertEqual(len(result.failures), 1)
+        self.assertIn("regressed", result.failures[0][1])
+
+
+class Test_LeakCheck(unittest.TestCase):
+    def test_detects_references_kept_by_iadd(self) -> None:
+        result = unittest.TestResult()
+        _make_total_tests()("test_generic_2911_binary_operations_do_not_leak").run(result)
+        Total.history.clear()
+        self.assertEqual(len(result.failures), 1)
+        self.assertIn("iadd leaks", result.failures[0][1])
+
+    def test_detects_history_kept_in_the_instance(self) -> None:
+        test_class = _make_running_total_tests()
+        result = unittest.TestResult()
+        test_class("test_generic_2911_binary_operations_do_not_leak").run(result)
+        self.assertTrue(result.wasSuccessful(), result.failures + result.errors)
+        test_class("test_generic_2912_inplace_operations_do_not_leak_per_instance").run(result)
+        self.assertEqual(len(result.failures), 1)
+        self.assertIn("iadd leaks", result.failures[0][1])
+
+    def test_operators_only_supported_by_the_class(self) -> None:
+        # hasattr would find type.__or__, the union of types
+        self.assertIsNone(generic_testing.LeakCheckMixinTests._leak_check_resolve("or_", Total(1)))
+        self.assertIsNotNone(generic_testing.LeakCheckMixinTests._leak_check_resolve("ior", {1}))
+
+
+if __name__ == "__main__":
+    SUITE = unittest.TestSuite()
+    SUITE.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(Test_SlottedPoint))
+    SUITE.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(Test_list_footprint))
+    SUITE.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(Test_Footprint))
+    SUITE.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(Test_int_leaks))
+    SUITE.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(Test_list_leaks))
+    SUITE.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(Test_LeakCheck))
+    TR = unittest.TextTestRunner(verbosity=2)
+    TR.run(SUITE)
+    print(generic_testing.MemoryFootprintMixinTests.footprint_report(), end="")
@@ -14,11 +14,39 @@ from generic_testing_test_context import generic_testing
 
 @generic_testing.Given(st.builds(ModuloN.decimal_digit, st.integers()))
 class Test_ModuloN_decimal_digit(
-    generic_testing.defaultGenericTestLoader.discover(ModuloN, use_docstring_yaml=True)
+    generic_testing.ExponentiationIdentitiesMixinTests,
+    generic_testing.defaultGenericTestLoader.discover(ModuloN, use_docstring_yaml=True),
 ):
     zero = ModuloN.decimal_digit(0)
     one = ModuloN.decimal_digit(1)
 
+    # An int exponent promotes the power to an int, so the identities need ModuloN exponents
+    def exponent_strategy(self, max_exponent):
+        return st.builds(ModuloN.decimal_digit, st.integers(min_value=0, max_value=max_exponent))
+
+    # Exponents wrap modulo n, rather than modulo the order of the base, so only the product identity holds
+    test_generic_2255_exponentiation_sum_of_exponents = generic_testing.GenericTests._pass
+    test_generic_2257_exponentiation_power_of_power = generic_testing.GenericTests._pass
+
+
+@generic_testing.Given(st.builds(ModuloN.decimal_digit, st.integers()))
+class Test_ModuloN_decimal_digit_differential(generic_testing.DifferentialTests):
+    def reference(self, a):
+        return int(a)
+
+    def normalise_reference(self, x):
+        return x % 10
+
+
+# ModuloPow2 is an optimised ModuloN, so share the operators that ModuloN supports
+@generic_testing.Given(st.builds(ModuloPow2.u16, st.integers()))
+class Test_ModuloPow2_u16_differential(generic_testing.DifferentialTests):
+    differential_unary_operations = ("neg", "pos", "abs")
+    differential_binary_operations = ("add", "sub", "mul", "truediv", "floordiv", "mod", "pow")
+
+    def reference(self, a):
+        return ModuloN(a.modulus, int(a))
+
 
 class ModuloPow2Tests(
     generic_testing.defaultGenericTestLoader.discover(
@@ -52,7 +80,10 @@ if __name__ == "__main__":
     SUITE.addTest(
         unittest.defaultTestLoader.loadTestsFromTestCase(Test_ModuloN_decimal_digit)
     )
+    SUITE.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(Test_ModuloN_decimal_digit_differential))
+    SUITE.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(Test_ModuloPow2_u16_differential))
     SUITE.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(Test_ModuloPow2_bit))
     SUITE.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(Test_ModuloPow2_u16))
     TR = unittest.TextTestRunner(verbosity=2)
     TR.run(SUITE)
+    print(generic_testing.DifferentialTests.differential_report(), end="")
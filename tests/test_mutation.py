@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+# Copyright 2021 Steve Palmer
+
+"""A test of the generic_testing mutation engine, against the simplistic ModuloN class."""
+
+import json
+import unittest
+
+from modulo_n import ModuloN
+
+from generic_testing_test_context import generic_testing
+
+import test_modulo_n
+
+
+class Test_Mutation(unittest.TestCase):
+    def test_default_mutants(self) -> None:
+        mutants = generic_testing.mutants_for(ModuloN)
+        self.assertIn(generic_testing.Mutant("__mod__", "off_by_one", None), mutants)
+        self.assertIn(generic_testing.Mutant("__lt__", "swap", "__le__"), mutants)
+        self.assertIn(generic_testing.Mutant("__hash__", "constant", None), mutants)
+        # ModuloN disables the bitwise operators with None
+        self.assertFalse(any(mutant.method == "__or__" for mutant in mutants))
+
+    def test_kills_and_survivors(self) -> None:
+        mutants = [
+            generic_testing.Mutant("__mod__", "off_by_one", None),
+            generic_testing.Mutant("__lt__", "swap", "__le__"),
+            generic_testing.Mutant("__hash__", "constant", None),
+        ]
+        # One worker runs the original class and every mutant, so the test class is run repeatedly in one process
+        results = generic_testing.run_mutants(test_modulo_n.Test_ModuloN_decimal_digit, ModuloN, mutants, max_workers=1)
+        self.assertEqual([result.mutant for result in results], mutants)
+        killed_by = {result.mutant.method: result.killed_by for result in results}
+        self.assertIn("2246", killed_by["__mod__"])  # mod_range
+        self.assertIn("2161", killed_by["__lt__"])  # less_than_definition
+        self.assertEqual(killed_by["__hash__"], ())  # a constant hash is consistent with equality
+        self.assertNotEqual(ModuloN.__hash__(ModuloN.decimal_digit(3)), 0)  # mutants are not left installed
+        score = json.loads(generic_testing.mutation_report(results).splitlines()[-1])
+        self.assertEqual(score, dict(mutants=3, killed=2, score=2 / 3))
+
+
+if __name__ == "__main__":
+    SUITE = unittest.defaultTestLoader.loadTestsFromTestCase(Test_Mutation)
+    unittest.TextTestRunner(verbosity=2).run(SUITE)
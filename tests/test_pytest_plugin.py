@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+# Copyright 2021 Steve Palmer
+
+"""A test of the generic_testing pytest plugin."""
+
+import importlib.util
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import textwrap
+import unittest
+
+from generic_testing_test_context import generic_testing
+
+
+@unittest.skipIf(importlib.util.find_spec("pytest") is None, "needs pytest")
+class Test_PytestPlugin(unittest.TestCase):
+    def setUp(self) -> None:
+        from generic_testing import pytest_plugin
+
+        self.pytest_plugin = pytest_plugin
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+        with open(os.path.join(self.directory, "test_example.py"), "w") as f:
+            f.write(
+                textwrap.dedent(
+                    """\
+                    from hypothesis import strategies as st
+                    import generic_testing
+
+                    def test_first():
+                        pass
+
+                    @generic_testing.Given(st.integers())
+                    class Test_int(generic_testing.EqualityTests):
+                        pass
+
+                    @generic_testing.Given(st.frozensets(st.integers()))
+                    class Test_frozenset(generic_testing.PartialOrderingTests):
+                        pass
+
+                    def test_last():
+                        pass
+                    """
+                )
+            )
+
+    def pytest(self, *args: str) -> str:
+        environment = dict(os.environ, PYTHONPATH=os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+        return subprocess.run(
+            [sys.executable, "-m", "pytest", "-q", "-p", "generic_testing.pytest_plugin", *args],
+            cwd=self.directory,
+            env=environment,
+            capture_output=True,
+            text=True,
+        ).stdout
+
+    def test_parse_ranges(self) -> None:
+        self.assertEqual(self.pytest_plugin.parse_ranges("2200-2299, 2900"), [(2200, 2299), (2900, 2900)])
+
+    def test_balanced_order(self) -> None:
+        groups = dict(a=["a1", "a2"], b=["b1"], c=["c1"])
+        self.assertEqual(self.pytest_plugin.balanced_order(groups, dict(a1=1.0, a2=1.0, b1=5.0)), ["b", "c", "a"])
+        self.assertEqual(self.pytest_plugin.balanced_order(groups, dict()), ["a", "b", "c"])
+
+    def test_selects_ranges_and_markers(self) -> None:
+        self.assertIn("2 passed", self.pytest("--generic", "2100-2101"))
+        self.assertIn("1 passed", self.pytest("-m", "generic(number=2100)"))
+        self.assertIn("3 passed", self.pytest("-k", "test_first or test_last or 2100"))
+
+    def test_orders_by_duration(self) -> None:
+        self.pytest()
+        cache_path = os.path.join(self.directory, ".pytest_cache", "v", "generic_testing", "durations")
+        with open(cache_path) as f:
+            durations = json.load(f)
+        self.assertTrue(any("Test_frozenset" in test for test in durations))
+        durations = {test: (100.0 if "Test_int" in test else 0.0) for test in durations}
+        with open(cache_path, "w") as f:
+            json.dump(durations, f)
+        collected = [line for line in self.pytest("--collect-only").splitlines() if "::" in line]
+        self.assertTrue(collected[0].endswith("::test_first"))
+        self.assertTrue(collected[-1].endswith("::test_last"))
+        self.assertIn("Test_int", collected[1])
+        self.assertIn("Test_frozenset", collected[-2])
+
+
+if __name__ == "__main__":
+    SUITE = unittest.defaultTestLoader.loadTestsFromTestCase(Test_PytestPlugin)
+    unittest.TextTestRunner(verbosity=2).run(SUITE)
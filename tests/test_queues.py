@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+# Copyright 2021 Steve Palmer
+
+"""A test of the generic_testing.queues tests using heapq heaps and queue.PriorityQueue."""
+
+import heapq
+import queue
+import unittest
+
+from hypothesis import strategies as st
+
+from generic_testing_test_context import generic_testing
+
+
+element_st = st.integers()
+
+
+def heap(elements: list) -> list:
+    heapq.heapify(elements)
+    return elements
+
+
+def priority_queue(elements: list) -> queue.PriorityQueue:
+    result = queue.PriorityQueue()
+    for element in elements:
+        result.put_nowait(element)
+    return result
+
+
+@generic_testing.Given(
+    {
+        generic_testing.ClassUnderTest: st.lists(element_st).map(heap),
+        generic_testing.ElementT: element_st,
+    }
+)
+class Test_heapq(generic_testing.HeapTests):
+    pass
+
+
+@generic_testing.Given(
+    {
+        generic_testing.ClassUnderTest: st.lists(element_st).map(priority_queue),
+        generic_testing.ElementT: element_st,
+    }
+)
+class Test_PriorityQueue(generic_testing.defaultGenericTestLoader.discover(queue.PriorityQueue)):
+    pass
+
+
+class Test_Scaling(unittest.TestCase):
+    def test_skipped_unless_timed(self) -> None:
+        class Untimed(Test_heapq):
+            scaling_timed = False
+
+        result = unittest.TestResult()
+        unittest.defaultTestLoader.loadTestsFromNames(
+            ["test_generic_2743_peek_is_constant_time", "test_generic_2744_push_and_pop_are_logarithmic"], Untimed
+        ).run(result)
+        self.assertEqual((result.testsRun, len(result.skipped)), (2, 2))
+
+
+__all__ = ("Test_heapq", "Test_PriorityQueue", "Test_Scaling")
+
+
+if __name__ == "__main__":
+    SUITE = unittest.TestSuite()
+    SUITE.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(Test_heapq))
+    SUITE.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(Test_PriorityQueue))
+    SUITE.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(Test_Scaling))
+    TR = unittest.TextTestRunner(verbosity=2)
+    TR.run(SUITE)
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+# Copyright 2021 Steve Palmer
+
+"""A test of the streaming JSON lines and JUnit XML reports."""
+
+import io
+import json
+import os
+import tempfile
+import unittest
+import unittest.mock
+import xml.etree.ElementTree as ET
+
+from hypothesis import assume, given, settings, strategies as st
+
+from generic_testing_test_context import generic_testing
+
+import runner_examples
+
+
+def _make_test_classes():
+    # Fresh test classes for each run in this process, as hypothesis requires a test to be run by one instance
+
+    @generic_testing.Given(st.integers())
+    class Example_int(generic_testing.EqualityTests):
+        pass
+
+    class Example_falsified(unittest.TestCase):
+        @settings(database=None, derandomize=True)
+        @given(st.integers())
+        def test_generic_9999_falsified(self, a: int) -> None:
+            assume(a % 2 == 0)
+            self.assertLess(a, 10)
+
+    return Example_int, Example_falsified
+
+
+class Test_Reporting(unittest.TestCase):
+    def setUp(self) -> None:
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.jsonl_path = os.path.join(directory.name, "results.jsonl")
+        self.junit_path = os.path.join(directory.name, "results.xml")
+
+    def reports(self):
+        with open(self.jsonl_path) as f:
+            return {report["name"]: report for report in map(json.loads, f)}
+
+    def check_junit(self, tests: int, failures: int) -> None:
+        suite = ET.parse(self.junit_path).getroot()
+        self.assertEqual(suite.tag, "testsuite")
+        self.assertEqual(int(suite.get("tests")), tests)
+        self.assertEqual(int(suite.get("failures")), failures)
+        self.assertEqual(len(suite.findall("testcase")), tests)
+        self.assertEqual(len(suite.findall("testcase/failure")), failures)
+
+    def test_runner_streams_statistics(self) -> None:
+        suite = unittest.TestSuite(map(unittest.defaultTestLoader.loadTestsFromTestCase, _make_test_classes()))
+        runner = generic_testing.StreamingTestRunner(self.jsonl_path, self.junit_path, stream=io.StringIO())
+        result = runner.run(suite)
+        self.assertEqual(len(result.failures), 1)
+        reports = self.reports()
+        self.assertEqual(len(reports), suite.countTestCases())
+        passed = next(report for report in reports.values() if report["test"].endswith("Example_int"))
+        self.assertEqual(passed["status"], "pass")
+        self.assertGreater(passed["examples"], 0)
+        self.assertIsNone(passed["falsifying"])
+        falsified = reports["test_generic_9999_falsified"]
+        self.assertEqual(falsified["number"], 9999)
+        self.assertEqual(falsified["status"], "fail")
+        self.assertGreater(falsified["rejected"], 0)
+        self.assertIn("a=10", falsified["falsifying"])
+        self.assertTrue(falsified["message"].startswith("AssertionError"))
+        self.check_junit(suite.countTestCases(), 1)
+
+    def test_runner_without_statistics(self) -> None:
+        # Earlier versions of hypothesis have no statistics collector, and attach no notes to the exception
+        suite = unittest.TestSuite(map(unittest.defaultTestLoader.loadTestsFromTestCase, _make_test_classes()))
+        runner = generic_testing.StreamingTestRunner(self.jsonl_path, self.junit_path, stream=io.StringIO())
+        with unittest.mock.patch.object(generic_testing.reporting, "collector", None):
+            runner.run(suite)
+        for report in self.reports().values():
+            self.assertEqual([report[key] for key in ("examples", "rejected", "shrinks")], [None, None, None])
+        self.check_junit(suite.countTestCases(), 1)
+        self.assertIsNone(generic_testing.reporting._falsifying((AssertionError, AssertionError(), None)))
+
+    def test_run_test_classes_streams_from_workers(self) -> None:
+        results = generic_testing.run_test_classes(
+            [runner_examples.Example_str, runner_examples.Example_failure],
+            backend="process",
+            max_workers=2,
+            jsonl_path=self.jsonl_path,
+            junit_path=self.junit_path,
+        )
+        reports = self.reports()
+        self.assertEqual(len(reports), sum(result.run for result in results))
+        self.assertEqual(reports["test_failure"]["status"], "fail")
+        self.check_junit(len(reports), 1)
+
+
+if __name__ == "__main__":
+    SUITE = unittest.defaultTestLoader.loadTestsFromTestCase(Test_Reporting)
+    unittest.TextTestRunner(verbosity=2).run(SUITE)
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+# Copyright 2021 Steve Palmer
+
+"""A test of the generic_testing runner backends."""
+
+import unittest
+
+from generic_testing_test_context import generic_testing
+
+import runner_examples
+
+
+class Test_Runner(unittest.TestCase):
+    def check_backend(self, backend: str) -> None:
+        results = generic_testing.run_test_classes(
+            [runner_examples.Example_int, runner_examples.Example_failure, runner_examples.Example_str],
+            backend=backend,
+            max_workers=2,
+        )
+        self.assertEqual(
+            [result.test for result in results],
+            ["runner_examples.Example_int", "runner_examples.Example_failure", "runner_examples.Example_str"],
+        )
+        self.assertGreater(results[0].run, 0)
+        self.assertEqual(results[0].failures + results[0].errors, [])
+        self.assertEqual(len(results[1].failures), 1)
+        self.assertIn("as expected", results[1].failures[0][1])
+
+    def test_thread_backend(self) -> None:
+        self.check_backend("thread")
+
+    def test_process_backend(self) -> None:
+        self.check_backend("process")
+
+    def test_auto_backend(self) -> None:
+        self.assertIn(generic_testing.default_backend(), ("thread", "subinterpreter", "process"))
+        self.check_backend("auto")
+
+    def test_threads_leave_shared_state(self) -> None:
+        before = generic_testing.shared_state()
+        generic_testing.run_test_classes([runner_examples.Example_int, runner_examples.Example_str], backend="thread")
+        self.assertEqual(generic_testing.shared_state(), before)
+
+    def test_threads_detect_shared_state_change(self) -> None:
+        rel_tol = generic_testing.isclose.default_rel_tol
+        try:
+            with self.assertRaisesRegex(RuntimeError, "default_rel_tol"):
+                generic_testing.run_test_classes([runner_examples.Example_changes_rel_tol], backend="thread")
+        finally:
+            generic_testing.isclose.default_rel_tol = rel_tol
+
+    def test_unknown_backend(self) -> None:
+        with self.assertRaises(ValueError):
+            generic_testing.run_test_classes([], backend="fibre")
+
+
+if __name__ == "__main__":
+    SUITE = unittest.defaultTestLoader.loadTestsFromTestCase(Test_Runner)
+    unittest.TextTestRunner(verbosity=2).run(SUITE)
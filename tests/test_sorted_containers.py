@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+# Copyright 2021 Steve Palmer
+
+"""A test of the generic_testing.sorted_collections tests using the sortedcontainers types."""
+
+import math
+import unittest
+
+from hypothesis import strategies as st
+import sortedcontainers
+
+from generic_testing_test_context import generic_testing
+
+
+values_st = st.integers()
+
+
+@generic_testing.Given(
+    {
+        generic_testing.ClassUnderTest: st.lists(values_st).map(sortedcontainers.SortedList),
+        generic_testing.KeyT: st.integers(min_value=-(2 ** 30), max_value=2 ** 30),
+        generic_testing.ValueT: values_st,
+        generic_testing.ScalarT: st.integers(min_value=-1, max_value=10),
+    }
+)
+class Test_SortedList(generic_testing.defaultGenericTestLoader.discover(sortedcontainers.SortedList)):
+    empty = sortedcontainers.SortedList()
+
+
+element_st = st.integers()
+
+
+@generic_testing.Given(
+    {
+        generic_testing.ClassUnderTest: st.sets(element_st).map(sortedcontainers.SortedSet),
+        generic_testing.ElementT: element_st,
+    }
+)
+class Test_SortedSet(generic_testing.defaultGenericTestLoader.discover(sortedcontainers.SortedSet)):
+    empty = sortedcontainers.SortedSet()
+
+
+key_st = st.integers()
+value_st = st.integers()
+
+
+@generic_testing.Given(
+    {
+        generic_testing.ClassUnderTest: st.dictionaries(key_st, value_st).map(sortedcontainers.SortedDict),
+        generic_testing.KeyT: key_st,
+        generic_testing.ValueT: value_st,
+    }
+)
+class Test_SortedDict(generic_testing.defaultGenericTestLoader.discover(sortedcontainers.SortedDict)):
+    empty = sortedcontainers.SortedDict()
+
+
+class Test_InplaceAllocationExempt(unittest.TestCase):
+    def test_only_sortedcontainers_is_exempt(self) -> None:
+        self.assertEqual(generic_testing.SortedSetTests.inplace_allocation_exempt, ())
+        self.assertEqual(Test_SortedSet.inplace_allocation_exempt, ("ior", "iand", "isub", "ixor"))
+
+
+class Test_Scaling(unittest.TestCase):
+    """The wall clock scaling tests are opt in, and compare the growth of the time with the complexity."""
+
+    @staticmethod
+    def run_insert_test(scaling_timed: bool, growth) -> unittest.TestResult:
+        class Timed(Test_SortedList):
+            def _time_operation(self, n, operation):
+                return growth(n)
+
+        Timed.scaling_timed = scaling_timed
+        result = unittest.TestResult()
+        Timed("test_generic_2730_insert_is_logarithmic").run(result)
+        return result
+
+    def test_skipped_unless_timed(self) -> None:
+        self.assertEqual(len(self.run_insert_test(False, float).skipped), 1)
+
+    def test_compares_growth_with_complexity(self) -> None:
+        result = self.run_insert_test(True, lambda n: 1e-6 * math.log(n))
+        self.assertEqual((result.testsRun, result.skipped, result.failures), (1, [], []))
+        self.assertEqual(len(self.run_insert_test(True, lambda n: 1e-6 * n).failures), 1)
+
+
+__all__ = ("Test_SortedList", "Test_SortedSet", "Test_SortedDict", "Test_InplaceAllocationExempt", "Test_Scaling")
+
+
+if __name__ == "__main__":
+    SUITE = unittest.TestSuite()
+    for cls in (Test_SortedList, Test_SortedSet, Test_SortedDict, Test_InplaceAllocationExempt, Test_Scaling):
+        SUITE.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(cls))
+    TR = unittest.TextTestRunner(verbosity=2)
+    TR.run(SUITE)
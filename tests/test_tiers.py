@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+# Copyright 2021 Steve Palmer
+
+"""A test of the Given tiers, using deliberately size sensitive properties."""
+
+import unittest
+
+from hypothesis import strategies as st
+
+from generic_testing_test_context import generic_testing
+
+
+tiers = {"small": (0, 3, 20), "medium": (4, 8, 10)}
+
+
+def sized_lists(min_size, max_size):
+    return st.lists(st.integers(), min_size=min_size, max_size=max_size)
+
+
+def _make_sizes_tests(sizes):
+    @generic_testing.Given({generic_testing.ClassUnderTest: sized_lists, int: st.integers()}, tiers=tiers)
+    class Test_Sizes(generic_testing.GenericTests):
+        def test_generic_sizes(self, a: generic_testing.ClassUnderTest) -> None:
+            sizes.append(len(a))
+
+        def test_generic_unsized(self, b: int) -> None:
+            sizes.append(b)
+
+        def test_generic_short(self, a: generic_testing.ClassUnderTest) -> None:
+            """len(a) <= 3"""
+            self.assertLessEqual(len(a), 3)
+
+    return Test_Sizes
+
+
+class Test_Tiers(unittest.TestCase):
+    def test_runs_each_tier(self) -> None:
+        sizes = []
+        _make_sizes_tests(sizes)("test_generic_sizes").test_generic_sizes()
+        self.assertTrue(any(0 <= n <= 3 for n in sizes))
+        self.assertTrue(any(4 <= n <= 8 for n in sizes))
+        self.assertTrue(all(0 <= n <= 8 for n in sizes))
+
+    def test_unsized_is_not_tiered(self) -> None:
+        Test_Sizes = _make_sizes_tests([])
+        self.assertTrue(hasattr(Test_Sizes.test_generic_unsized, "hypothesis"))
+        self.assertFalse(hasattr(Test_Sizes.test_generic_sizes, "hypothesis"))
+
+    def test_reports_failures_per_tier(self) -> None:
+        result = unittest.TestResult()
+        _make_sizes_tests([])("test_generic_short").run(result)
+        self.assertEqual(len(result.failures), 1)
+        self.assertIn("tier='medium'", str(result.failures[0][0]))
+
+    def test_sized_strategy_needs_tiers(self) -> None:
+        with self.assertRaises(TypeError):
+
+            @generic_testing.Given(sized_lists)
+            class Test_Untiered(generic_testing.GenericTests):
+                def test_generic_sizes(self, a: generic_testing.ClassUnderTest) -> None:
+                    pass
+
+
+if __name__ == "__main__":
+    SUITE = unittest.defaultTestLoader.loadTestsFromTestCase(Test_Tiers)
+    unittest.TextTestRunner(verbosity=2).run(SUITE)
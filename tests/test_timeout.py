@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+# Copyright 2021 Steve Palmer
+
+"""A test of the generic_testing.Timeout waits and periodic iteration."""
+
+import asyncio
+import time
+import unittest
+
+from generic_testing_test_context import generic_testing
+
+
+class _CountingClock:
+    """A clock that stands still for a number of readings, then jumps forward."""
+
+    def __init__(self, still_readings: int) -> None:
+        self.readings = 0
+        self.still_readings = still_readings
+
+    def __call__(self) -> float:
+        self.readings += 1
+        return 0.0 if self.readings <= self.still_readings else 1.0
+
+
+class Test_Timeout(unittest.TestCase):
+    def test_wait_without_spin_reads_clock_once_after_sleeping(self) -> None:
+        clock = _CountingClock(100)
+        t = generic_testing.Timeout(0.01, clock=clock)
+        self.assertFalse(t.wait())
+        self.assertEqual(clock.readings, 3)  # restart, then before and after the sleep
+
+    def test_async_wait_without_spin_reads_clock_once_after_sleeping(self) -> None:
+        clock = _CountingClock(100)
+        t = generic_testing.Timeout(0.01, clock=clock)
+        self.assertFalse(asyncio.run(t.async_wait()))
+        self.assertEqual(clock.readings, 3)
+
+    def test_wait_with_spin_reaches_deadline(self) -> None:
+        t = generic_testing.Timeout(0.02)
+        self.assertFalse(t.wait(spin=0.002))
+        self.assertTrue(t)
+
+    def test_iterator_does_not_drift(self) -> None:
+        delay, ticks = 0.005, 40
+        statistics = generic_testing.TickStatistics()
+        start = time.monotonic()
+        iterator = generic_testing.Timeout(delay).iterator(do_restart=True, spin=0.001, statistics=statistics)
+        for _ in range(ticks):
+            next(iterator)
+        elapsed = time.monotonic() - start
+        self.assertEqual(statistics.count, ticks)
+        self.assertGreaterEqual(elapsed, ticks * delay)
+        # Each tick is scheduled from the previous deadline, so only the last tick's lateness remains,
+        # where a drift of delay / ticks per tick would add a whole delay
+        self.assertLess(elapsed - ticks * delay, statistics.max + delay)
+
+
+__all__ = ("Test_Timeout",)
+
+
+if __name__ == "__main__":
+    SUITE = unittest.TestSuite()
+    SUITE.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(Test_Timeout))
+    TR = unittest.TextTestRunner(verbosity=2)
+    TR.run(SUITE)
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+# Copyright 2021 Steve Palmer
+
+"""A test of the generic_testing.Watchdog, using deliberately slow properties."""
+
+import threading
+import time
+import unittest
+
+from hypothesis import strategies as st
+
+from generic_testing_test_context import generic_testing
+
+
+def _make_hangs_on_large_tests(watchdog):
+    @generic_testing.Given(st.integers(min_value=0), watchdog=watchdog)
+    class Test_HangsOnLarge(generic_testing.GenericTests):
+        def test_generic_runaway(self, a: generic_testing.ClassUnderTest) -> None:
+            """a <= 1000 or hang"""
+            while a > 1000:
+                pass
+
+    return Test_HangsOnLarge("test_generic_runaway")
+
+
+def _make_sleeps_tests(watchdog):
+    @generic_testing.Given(st.integers(min_value=0, max_value=20), watchdog=watchdog)
+    class Test_Sleeps(generic_testing.GenericTests):
+        def test_generic_sleeps(self, a: generic_testing.ClassUnderTest) -> None:
+            """sleep a milliseconds"""
+            time.sleep(a / 1000)
+
+    return Test_Sleeps("test_generic_sleeps")
+
+
+class Test_Watchdog(unittest.TestCase):
+    def test_interrupts_runaway_example_on_main_thread(self) -> None:
+        watchdog = generic_testing.Watchdog(timeout=0.05, slow_seconds=0.05)
+        with self.assertRaises(generic_testing.ExampleTimeout):
+            _make_hangs_on_large_tests(watchdog).test_generic_runaway()
+        smallest_slow = watchdog.log("Test_HangsOnLarge.test_generic_runaway").smallest_slow
+        self.assertEqual(smallest_slow.inputs, "a=1001")
+
+    def test_interrupts_runaway_example_on_other_thread(self) -> None:
+        watchdog = generic_testing.Watchdog(timeout=0.05)
+        raised = []
+
+        def run():
+            try:
+                _make_hangs_on_large_tests(watchdog).test_generic_runaway()
+            except generic_testing.ExampleTimeout as exc:
+                raised.append(exc)
+
+        thread = threading.Thread(target=run)
+        thread.start()
+        thread.join(60)
+        self.assertFalse(thread.is_alive())
+        self.assertEqual(len(raised), 1)
+
+    def test_records_slowest_examples(self) -> None:
+        watchdog = generic_testing.Watchdog(keep=3)
+        _make_sleeps_tests(watchdog).test_generic_sleeps()
+        slowest = watchdog.report()["Test_Sleeps.test_generic_sleeps"]
+        self.assertEqual(len(slowest), 3)
+        self.assertEqual([e.seconds for e in slowest], sorted((e.seconds for e in slowest), reverse=True))
+        self.assertGreaterEqual(slowest[0].seconds, 0.015)
+
+
+if __name__ == "__main__":
+    SUITE = unittest.defaultTestLoader.loadTestsFromTestCase(Test_Watchdog)
+    unittest.TextTestRunner(verbosity=2).run(SUITE)